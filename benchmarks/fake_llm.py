@@ -0,0 +1,365 @@
+"""
+Local fake of an OpenAI-compatible API for offline crew benchmarks.
+
+Serves ``/v1/chat/completions`` (plain and streamed), ``/v1/embeddings`` and
+``/v1/models`` with a configurable latency. Chat answers follow crewai's
+ReAct format: an agent that has tools and no observation yet gets an
+``Action`` for its first tool, with arguments guessed from the prompt;
+otherwise it gets a ``Final Answer``. Requests that carry a JSON schema
+(function calling, ``response_format`` or crewai's pydantic output
+instructions) get a JSON document matching the schema.
+
+Usage: python -m benchmarks.fake_llm [--port 8765] [--latency-ms 50]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+from .synthetic import make_resume_markdown
+
+EMBEDDING_DIMENSIONS = 1536
+TOOL_SECTION = re.compile(r"Tool Name: (?P<name>[^\n]+)\nTool Arguments: (?P<args>\{[^\n]*\})")
+PATH_PATTERN = re.compile(r"[\w./\\:-]+\.(?:pdf|txt|md)\b")
+TASK_NUMBER = re.compile(r"Task Number (\d+)")
+
+
+def _message_text(message: Dict[str, Any]) -> str:
+    content = message.get("content") or ""
+    if isinstance(content, list):
+        return "".join(part.get("text", "") for part in content if isinstance(part, dict))
+    return content
+
+
+def sample_from_schema(schema: Dict[str, Any], definitions: Optional[Dict[str, Any]] = None, count: int = 1) -> Any:
+    """Returns a small document that validates against a JSON schema"""
+    definitions = definitions if definitions is not None else schema.get("$defs", {})
+    if "$ref" in schema:
+        return sample_from_schema(definitions[schema["$ref"].split("/")[-1]], definitions, count)
+    for key in ("anyOf", "oneOf", "allOf"):
+        if key in schema:
+            options = [option for option in schema[key] if option.get("type") != "null"]
+            return sample_from_schema(options[0] if options else {}, definitions, count)
+    if "enum" in schema:
+        return schema["enum"][0]
+
+    kind = schema.get("type", "object" if "properties" in schema else "string")
+    if kind == "object":
+        return {
+            name: sample_from_schema(prop, definitions, count)
+            for name, prop in schema.get("properties", {}).items()
+        }
+    if kind == "array":
+        item = schema.get("items", {})
+        return [sample_from_schema(item, definitions, 1) for _ in range(max(1, count))]
+    if kind == "integer":
+        return 7
+    if kind == "number":
+        return 7.5
+    if kind == "boolean":
+        return True
+    return "Synthetic benchmark value"
+
+
+def _existing_path(candidate: str) -> str:
+    """Drops words glued to the front of a path ("this/tmp/cv.pdf") when the rest exists"""
+    starts = [0] + [index for index, char in enumerate(candidate) if char in "/\\"]
+    for start in starts:
+        if os.path.exists(candidate[start:]):
+            return candidate[start:]
+    return candidate
+
+
+def guess_tool_arguments(arguments: Dict[str, Any], prompt: str) -> Dict[str, Any]:
+    """Fills in a tool's arguments from what the prompt mentions"""
+    paths = [_existing_path(path) for path in PATH_PATTERN.findall(prompt)]
+    values = {}
+    for name in arguments:
+        lowered = name.lower()
+        if "path" in lowered or lowered in ("resume", "jd", "file"):
+            extension = ".pdf" if "resume" in lowered else ".txt" if "jd" in lowered else ""
+            matches = [path for path in paths if path.endswith(extension)] or paths
+            values[name] = matches[0] if matches else "input.txt"
+        elif "markdown" in lowered or "content" in lowered:
+            values[name] = make_resume_markdown(seed=len(prompt) % 97)
+        elif "query" in lowered:
+            values[name] = "in-demand skills and resume best practices for software engineers"
+        else:
+            values[name] = "benchmark"
+    return values
+
+
+class FakeLLM:
+    """Builds the responses; shared by every request handler thread"""
+
+    def __init__(self, latency_ms: float = 0.0, answer_words: int = 300):
+        self.latency = latency_ms / 1000.0
+        self.answer_words = answer_words
+        self.requests: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def count(self, endpoint: str):
+        with self._lock:
+            self.requests[endpoint] = self.requests.get(endpoint, 0) + 1
+
+    def final_answer(self, prompt: str) -> str:
+        words = (f"insight{i % 50}" for i in range(self.answer_words))
+        return (
+            "Thought: I now can give a great answer\n"
+            "Final Answer: ## Benchmark Report\n\n"
+            f"- Prompt characters: {len(prompt)}\n\n" + " ".join(words)
+        )
+
+    def structured(self, schema: Dict[str, Any], prompt: str) -> str:
+        count = len(set(TASK_NUMBER.findall(prompt))) or 1
+        return json.dumps(sample_from_schema(schema, count=count))
+
+    def chat(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """Returns the assistant message for a chat completion request"""
+        messages: List[Dict[str, Any]] = body.get("messages", [])
+        prompt = "\n".join(_message_text(message) for message in messages)
+
+        tools = body.get("tools")
+        if tools:
+            function = tools[0]["function"]
+            arguments = sample_from_schema(function.get("parameters", {}), count=len(set(TASK_NUMBER.findall(prompt))) or 1)
+            return {
+                "role": "assistant",
+                "content": None,
+                "tool_calls": [
+                    {
+                        "id": f"call_{uuid.uuid4().hex[:12]}",
+                        "type": "function",
+                        "function": {"name": function["name"], "arguments": json.dumps(arguments)},
+                    }
+                ],
+            }
+
+        response_format = body.get("response_format") or {}
+        if response_format.get("type") == "json_schema":
+            schema = response_format["json_schema"].get("schema", {})
+            return {"role": "assistant", "content": self.structured(schema, prompt)}
+
+        # crewai appends the pydantic schema to the task prompt for output_pydantic tasks
+        if "list_of_plans_per_task" in prompt:
+            count = len(set(TASK_NUMBER.findall(prompt))) or 1
+            plans = [
+                {"task": f"Task Number {number}", "plan": f"Step by step plan for task {number}."}
+                for number in range(1, count + 1)
+            ]
+            content = json.dumps({"list_of_plans_per_task": plans})
+            return {"role": "assistant", "content": f"Thought: I now can give a great answer\nFinal Answer: {content}"}
+
+        # The format instructions mention "Observation:" too; results come back as assistant turns
+        observed = any(
+            message.get("role") == "assistant" and "Observation:" in _message_text(message)
+            for message in messages
+        )
+        tool_match = TOOL_SECTION.search(prompt)
+        if tool_match and not observed:
+            try:
+                schema = json.loads(tool_match.group("args").replace("'", '"').replace("None", "null"))
+            except json.JSONDecodeError:
+                schema = {}
+            arguments = guess_tool_arguments(schema, prompt)
+            return {
+                "role": "assistant",
+                "content": (
+                    "Thought: I should use the available tool first\n"
+                    f"Action: {tool_match.group('name').strip()}\n"
+                    f"Action Input: {json.dumps(arguments)}"
+                ),
+            }
+
+        return {"role": "assistant", "content": self.final_answer(prompt)}
+
+    def embed(self, text: str) -> List[float]:
+        """Deterministic unit-length pseudo-embedding of a text"""
+        digest = hashlib.sha256(text.encode("utf-8")).digest()
+        values = [(digest[i % len(digest)] - 127.5) / 127.5 for i in range(EMBEDDING_DIMENSIONS)]
+        norm = sum(value * value for value in values) ** 0.5 or 1.0
+        return [value / norm for value in values]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "FakeLLMServer"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, payload: Dict[str, Any], status: int = 200):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path.rstrip("/").endswith("/models"):
+            self._send_json({"object": "list", "data": [{"id": "fake", "object": "model"}]})
+        else:
+            self._send_json({"error": {"message": f"Unknown path {self.path}"}}, status=404)
+
+    def do_POST(self):
+        fake = self.server.fake
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length) or b"{}")
+        time.sleep(fake.latency)
+
+        if self.path.rstrip("/").endswith("/embeddings"):
+            fake.count("embeddings")
+            inputs = body.get("input", [])
+            inputs = [inputs] if isinstance(inputs, str) else inputs
+            self._send_json(
+                {
+                    "object": "list",
+                    "model": body.get("model", "fake-embedding"),
+                    "data": [
+                        {"object": "embedding", "index": index, "embedding": fake.embed(str(text))}
+                        for index, text in enumerate(inputs)
+                    ],
+                    "usage": {"prompt_tokens": len(inputs), "total_tokens": len(inputs)},
+                }
+            )
+            return
+
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._send_json({"error": {"message": f"Unknown path {self.path}"}}, status=404)
+            return
+
+        fake.count("chat")
+        message = fake.chat(body)
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+        model = body.get("model", "fake")
+        prompt_tokens = sum(len(_message_text(m).split()) for m in body.get("messages", []))
+        completion_tokens = len((message.get("content") or "").split())
+
+        if body.get("stream"):
+            self._stream(completion_id, model, message, prompt_tokens, completion_tokens)
+            return
+
+        self._send_json(
+            {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": message,
+                        "finish_reason": "tool_calls" if message.get("tool_calls") else "stop",
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": completion_tokens,
+                    "total_tokens": prompt_tokens + completion_tokens,
+                },
+            }
+        )
+
+    def _stream(self, completion_id: str, model: str, message: Dict[str, Any], prompt_tokens: int, completion_tokens: int):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+
+        def send(delta: Dict[str, Any], finish_reason: Optional[str] = None, usage=None):
+            chunk = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+            }
+            if usage is not None:
+                chunk["usage"] = usage
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+            self.wfile.flush()
+
+        send({"role": "assistant", "content": ""})
+        if message.get("tool_calls"):
+            call = message["tool_calls"][0]
+            send({"tool_calls": [{"index": 0, **call}]})
+        else:
+            words = (message.get("content") or "").split(" ")
+            for start in range(0, len(words), 8):
+                send({"content": " ".join(words[start : start + 8]) + (" " if start + 8 < len(words) else "")})
+        send(
+            {},
+            finish_reason="tool_calls" if message.get("tool_calls") else "stop",
+            usage={
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        )
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+
+
+class FakeLLMServer(ThreadingHTTPServer):
+    """
+    Fake OpenAI-compatible server running on a background thread.
+
+    Use as a context manager; ``base_url`` is what OPENAI_API_BASE should
+    point at.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, latency_ms: float = 0.0, answer_words: int = 300, host: str = "127.0.0.1", port: int = 0):
+        super().__init__((host, port), _Handler)
+        self.fake = FakeLLM(latency_ms=latency_ms, answer_words=answer_words)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> "FakeLLMServer":
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self) -> "FakeLLMServer":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a fake OpenAI-compatible API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="Delay before each response")
+    parser.add_argument("--answer-words", type=int, default=300, help="Length of final answers")
+    args = parser.parse_args()
+
+    server = FakeLLMServer(args.latency_ms, args.answer_words, args.host, args.port)
+    print(f"Fake LLM listening on {server.base_url} (latency {args.latency_ms:.0f} ms)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
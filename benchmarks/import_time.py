@@ -0,0 +1,107 @@
+"""
+Start-up time regression check for the run_crew entry point.
+
+Imports resume_job_match_ai.main in a fresh interpreter with
+``python -X importtime`` and fails when the cumulative import time is over
+the budget or when one of the heavy dependencies (crewai, crewai_tools,
+litellm, pypdf, ...) is imported eagerly. Those must only load once a tool
+or agent is first used. Also times ``run_crew --validate-only`` end to end.
+
+Usage: python benchmarks/import_time.py [--budget-ms N] [--runs N] [--skip-validate]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List, Tuple
+
+ENTRY_MODULE = "resume_job_match_ai.main"
+# Top-level packages the entry point must not import
+HEAVY_MODULES = ("crewai", "crewai_tools", "litellm", "openai", "pypdf", "pdfkit", "weasyprint", "markdown", "numpy")
+DEFAULT_BUDGET_MS = float(os.environ.get("RESUME_IMPORT_BUDGET_MS", "150"))
+VALIDATE_SCRIPT = "import sys; sys.argv = ['run_crew', '--validate-only']; from resume_job_match_ai.main import run; run()"
+
+
+def import_profile(module: str = ENTRY_MODULE) -> Tuple[float, Dict[str, float]]:
+    """
+    Imports a module in a fresh interpreter with ``-X importtime``.
+
+    Returns:
+        Tuple[float, Dict[str, float]]: Cumulative import time of the module
+            in milliseconds, and the cumulative time of every module imported
+            on the way.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = {}
+    for line in completed.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = int(cumulative) / 1000
+    return modules[module], modules
+
+
+def heavy_imports(modules: Dict[str, float]) -> List[str]:
+    """Returns the heavy packages among the imported modules"""
+    return sorted({name.split(".")[0] for name in modules} & set(HEAVY_MODULES))
+
+
+def time_validate(runs: int) -> float:
+    """Best wall time of ``run_crew --validate-only`` in milliseconds, in a scratch directory"""
+    import time
+
+    workdir = tempfile.mkdtemp(prefix="resume-import-")
+    os.makedirs(os.path.join(workdir, "input"))
+    with open(os.path.join(workdir, "input", "cv.pdf"), "wb") as file:
+        file.write(b"%PDF-1.4\n%%EOF\n")
+    with open(os.path.join(workdir, "input", "jd.txt"), "w", encoding="utf-8") as file:
+        file.write("Senior Python Developer\n\nRequirements: Python, SQL, Docker\n")
+
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", VALIDATE_SCRIPT], cwd=workdir, capture_output=True, check=True)
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the import time of the CLI entry point")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="Allowed cumulative import time")
+    parser.add_argument("--runs", type=int, default=5, help="Imports timed; the fastest one counts")
+    parser.add_argument("--skip-validate", action="store_true", help="Do not time run_crew --validate-only")
+    args = parser.parse_args()
+
+    profiles = [import_profile() for _ in range(args.runs)]
+    import_ms, modules = min(profiles, key=lambda profile: profile[0])
+    slowest = sorted(modules.items(), key=lambda item: item[1], reverse=True)[1:6]
+    print(f"⏱️ import {ENTRY_MODULE}: {import_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    for name, cumulative_ms in slowest:
+        print(f"   {name:48s} {cumulative_ms:8.1f} ms")
+
+    if not args.skip_validate:
+        print(f"⏱️ run_crew --validate-only: {time_validate(args.runs):.0f} ms including interpreter start-up")
+
+    failures = []
+    if import_ms > args.budget_ms:
+        failures.append(f"import took {import_ms:.1f} ms, over the {args.budget_ms:.0f} ms budget")
+    eager = heavy_imports(modules)
+    if eager:
+        failures.append(f"heavy dependencies imported at start-up: {', '.join(eager)}")
+    for failure in failures:
+        print(f"❌ {failure}")
+    if failures:
+        sys.exit(1)
+    print("✅ Start-up time within budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,314 @@
+"""
+Benchmark suite for the crew's tools and a full crew run.
+
+Times extract_resume on synthetic resumes of several page counts,
+extract_job_description on synthetic job descriptions, save_resume_as_pdf,
+the local memory store, and ResumeJobMatchAi().crew().kickoff against the local fake LLM server
+at one or more latencies. Everything runs in a throwaway working directory
+with its own caches, and the results are written as JSON so runs on
+different commits can be compared with --baseline.
+
+Usage:
+    python -m benchmarks.run_benchmarks [--pages 1,5,10,25,50] [--latency-ms 0,50]
+        [--modes sequential,dag] [--skip-crew] [--output FILE] [--baseline FILE]
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+RESULTS_VERSION = 1
+DEFAULT_OUTPUT = os.path.join("benchmarks", "results", "latest.json")
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _int_list(value: str) -> List[int]:
+    return [int(item) for item in value.split(",") if item]
+
+
+def _float_list(value: str) -> List[float]:
+    return [float(item) for item in value.split(",") if item]
+
+
+def git_revision() -> Dict[str, object]:
+    """Returns the commit being benchmarked and whether the tree has local changes"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = bool(
+            subprocess.run(
+                ["git", "status", "--porcelain", "--untracked-files=no"],
+                cwd=REPO_ROOT,
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.strip()
+        )
+        return {"commit": commit, "dirty": dirty}
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": None, "dirty": None}
+
+
+def summarize(name: str, params: Dict[str, object], timings_ms: List[float], **extra) -> Dict[str, object]:
+    """Builds one result record from raw timings"""
+    return {
+        "name": name,
+        "params": params,
+        "runs": len(timings_ms),
+        "mean_ms": round(statistics.fmean(timings_ms), 3),
+        "median_ms": round(statistics.median(timings_ms), 3),
+        "min_ms": round(min(timings_ms), 3),
+        "max_ms": round(max(timings_ms), 3),
+        "stdev_ms": round(statistics.stdev(timings_ms), 3) if len(timings_ms) > 1 else 0.0,
+        **extra,
+    }
+
+
+def time_calls(function: Callable[[], object], iterations: int, warmup: int = 1) -> List[float]:
+    """Returns the wall time in milliseconds of each call after the warm-up calls"""
+    for _ in range(warmup):
+        function()
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+@contextlib.contextmanager
+def quiet(log_path: str):
+    """Sends the (very chatty) output of the code under test to a log file"""
+    with open(log_path, "a", encoding="utf-8") as log, contextlib.redirect_stdout(log), contextlib.redirect_stderr(log):
+        yield
+
+
+def bench_tools(corpus: Dict[str, object], iterations: int, log_path: str) -> List[Dict[str, object]]:
+    """Times the three tools the agents call"""
+    from resume_job_match_ai.tools import extract_job_description, extract_resume, save_resume_as_pdf
+    from resume_job_match_ai.tools.pdf_renderer import RendererUnavailableError, get_renderer
+
+    from .synthetic import make_resume_markdown
+
+    results = []
+    for pages, path in sorted(corpus["resumes"].items()):
+        os.environ["RESUME_EXTRACTION_CACHE"] = "0"
+        with quiet(log_path):
+            timings = time_calls(lambda: extract_resume.run(resume_path=path), iterations)
+        results.append(summarize("extract_resume", {"pages": pages, "cache": False}, timings))
+
+        os.environ["RESUME_EXTRACTION_CACHE"] = "1"
+        with quiet(log_path):
+            timings = time_calls(lambda: extract_resume.run(resume_path=path), iterations)
+        results.append(summarize("extract_resume", {"pages": pages, "cache": True}, timings))
+        print(f"⏱️ extract_resume {pages:3d} pages: {results[-2]['mean_ms']:.1f} ms cold, {results[-1]['mean_ms']:.2f} ms cached")
+
+    jd_timings = []
+    with quiet(log_path):
+        for jd_path in corpus["jds"]:
+            jd_timings += time_calls(lambda: extract_job_description.run(jd_path=jd_path), iterations)
+    results.append(summarize("extract_job_description", {"jds": len(corpus["jds"])}, jd_timings))
+    print(f"⏱️ extract_job_description: {results[-1]['mean_ms']:.2f} ms")
+
+    from . import bench_markdown
+
+    for pipeline, mean_ms in bench_markdown.run(iterations=iterations * 20).items():
+        results.append({"name": "markdown_to_html", "params": {"pipeline": pipeline}, "mean_ms": mean_ms})
+    print(f"⏱️ markdown_to_html: {results[-3]['mean_ms']:.2f} ms per call, {results[-2]['mean_ms']:.2f} ms reused")
+
+    markdown_content = make_resume_markdown(seed=1)
+    try:
+        with quiet(log_path):
+            renderer = get_renderer()
+    except RendererUnavailableError as e:
+        results.append({"name": "save_resume_as_pdf", "params": {}, "skipped": str(e).splitlines()[0]})
+        print("⏭️ save_resume_as_pdf: skipped, no PDF renderer installed")
+        return results
+
+    for cache in (False, True):
+        os.environ["RESUME_RENDER_CACHE"] = "1" if cache else "0"
+        with quiet(log_path):
+            timings = time_calls(lambda: save_resume_as_pdf.run(markdown_content=markdown_content), iterations)
+        results.append(
+            summarize("save_resume_as_pdf", {"backend": renderer.name, "cache": cache}, timings)
+        )
+        print(f"⏱️ save_resume_as_pdf ({renderer.name}, cache {cache}): {results[-1]['mean_ms']:.1f} ms")
+    return results
+
+
+def bench_memory(iterations: int, capacity: int = 2048) -> List[Dict[str, object]]:
+    """Times saving to and searching the local memory store once its ring is full"""
+    from resume_job_match_ai.local_memory import LocalRAGStorage
+
+    from .synthetic import make_resume_markdown
+
+    storage = LocalRAGStorage("benchmark", os.path.join(os.getcwd(), "memory"), capacity=capacity)
+    paragraphs = [paragraph for paragraph in make_resume_markdown(seed=1).split("\n\n") if paragraph.strip()]
+    for index in range(capacity):
+        storage.save(paragraphs[index % len(paragraphs)], {"index": index})
+
+    texts = iter(paragraphs * (iterations * 100 + 1))
+    results = [
+        summarize("memory_save", {"capacity": capacity}, time_calls(lambda: storage.save(next(texts), {}), iterations * 100)),
+        summarize(
+            "memory_search", {"capacity": capacity}, time_calls(lambda: storage.search(next(texts), 3, 0.35), iterations * 100)
+        ),
+    ]
+    print(f"⏱️ local memory ({capacity} items): {results[0]['mean_ms'] * 1000:.0f} µs save, {results[1]['mean_ms'] * 1000:.0f} µs search")
+    return results
+
+
+def bench_crew(
+    corpus: Dict[str, object],
+    latencies_ms: List[float],
+    modes: List[str],
+    runs: int,
+    answer_words: int,
+    log_path: str,
+) -> List[Dict[str, object]]:
+    """Times full crew runs against the fake LLM at each latency and execution mode"""
+    from resume_job_match_ai.crew import ResumeJobMatchAi
+    from resume_job_match_ai.main import build_inputs
+
+    from .fake_llm import FakeLLMServer
+
+    resume_path = corpus["resumes"][min(corpus["resumes"])]
+    jd_path = corpus["jds"][0]
+    results = []
+    for latency_ms in latencies_ms:
+        with FakeLLMServer(latency_ms=latency_ms, answer_words=answer_words) as server:
+            os.environ["OPENAI_API_BASE"] = server.base_url
+            os.environ["OPENAI_BASE_URL"] = server.base_url
+            for mode in modes:
+                timings = []
+                requests_before = dict(server.fake.requests)
+                for _ in range(runs):
+                    with quiet(log_path):
+                        inputs = build_inputs(resume_path, jd_path)
+                        crew = ResumeJobMatchAi(output_dir="output", execution_mode=mode).crew()
+                        start = time.perf_counter()
+                        crew.kickoff(inputs=inputs)
+                        timings.append((time.perf_counter() - start) * 1000)
+                requests = {
+                    endpoint: (count - requests_before.get(endpoint, 0)) / runs
+                    for endpoint, count in server.fake.requests.items()
+                }
+                results.append(
+                    summarize(
+                        "crew_kickoff",
+                        {"latency_ms": latency_ms, "mode": mode},
+                        timings,
+                        requests_per_run=requests,
+                    )
+                )
+                print(
+                    f"⏱️ crew kickoff ({mode}, {latency_ms:.0f} ms latency): "
+                    f"{results[-1]['mean_ms'] / 1000:.2f} s, {requests.get('chat', 0):.0f} chat requests"
+                )
+    return results
+
+
+def compare(results: List[Dict[str, object]], baseline_path: str, threshold: float) -> List[str]:
+    """Prints the change of every result against a baseline file and returns the regressions"""
+    with open(baseline_path, encoding="utf-8") as file:
+        baseline = json.load(file)
+
+    def key(result):
+        return result["name"], json.dumps(result["params"], sort_keys=True)
+
+    previous = {key(result): result for result in baseline["results"] if "mean_ms" in result}
+    print(f"\n📊 Compared with {baseline_path} ({(baseline.get('commit') or 'unknown')[:10]}):")
+    regressions = []
+    for result in results:
+        old = previous.get(key(result))
+        if old is None or "mean_ms" not in result:
+            continue
+        change = (result["mean_ms"] - old["mean_ms"]) / old["mean_ms"] if old["mean_ms"] else 0.0
+        marker = "🔺" if change > threshold else "🔻" if change < -threshold else "  "
+        label = f"{result['name']} {result['params']}"
+        print(f"{marker} {label:60s} {old['mean_ms']:10.2f} -> {result['mean_ms']:10.2f} ms ({change:+.1%})")
+        if change > threshold:
+            regressions.append(label)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the tools and the crew")
+    parser.add_argument("--pages", type=_int_list, default=[1, 5, 10, 25, 50], help="Resume page counts")
+    parser.add_argument("--jds", type=int, default=5, help="Number of synthetic job descriptions")
+    parser.add_argument("--iterations", type=int, default=5, help="Timed calls per tool benchmark")
+    parser.add_argument("--latency-ms", type=_float_list, default=[0.0, 50.0], help="Fake LLM latencies")
+    parser.add_argument("--modes", default="sequential", help="Crew execution modes, comma separated")
+    parser.add_argument("--crew-runs", type=int, default=1, help="Crew runs per latency and mode")
+    parser.add_argument("--answer-words", type=int, default=300, help="Length of fake LLM answers")
+    parser.add_argument("--skip-crew", action="store_true", help="Only benchmark the tools")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="Where to write the JSON results")
+    parser.add_argument("--baseline", help="Results file of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Relative slowdown reported as a regression")
+    args = parser.parse_args()
+
+    output_path = os.path.abspath(args.output)
+    baseline_path = os.path.abspath(args.baseline) if args.baseline else None
+    workdir = tempfile.mkdtemp(prefix="resume-bench-")
+    log_path = os.path.join(workdir, "benchmark.log")
+
+    # Isolate caches, crew memory and outputs before the package reads its settings
+    os.environ.update(
+        {
+            "RESUME_CACHE_DIR": os.path.join(workdir, ".cache"),
+            "CREWAI_STORAGE_DIR": os.path.join(workdir, "storage"),
+            "RESUME_SEARCH_BACKEND": "local",
+            "RESUME_LLM_CACHE": "off",
+            "RESUME_CHECKPOINTS": "0",
+            "RESUME_RATE_LIMITS": "off",
+            "OPENAI_API_KEY": os.environ.get("BENCHMARK_OPENAI_API_KEY", "sk-benchmark"),
+            "CREWAI_DISABLE_TELEMETRY": "true",
+            "OTEL_SDK_DISABLED": "true",
+            "ANONYMIZED_TELEMETRY": "False",
+        }
+    )
+    os.chdir(workdir)
+
+    from .synthetic import generate_corpus
+
+    corpus = generate_corpus(os.path.join(workdir, "input"), args.pages, args.jds)
+    print(f"🧪 Benchmarking in {workdir} (log: {log_path})")
+
+    results = bench_tools(corpus, args.iterations, log_path)
+    results += bench_memory(args.iterations)
+    if not args.skip_crew:
+        modes = [mode for mode in args.modes.split(",") if mode]
+        results += bench_crew(corpus, args.latency_ms, modes, args.crew_runs, args.answer_words, log_path)
+
+    report = {
+        "version": RESULTS_VERSION,
+        **git_revision(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "config": {key: value for key, value in vars(args).items() if key not in ("output", "baseline")},
+        "results": results,
+    }
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+    print(f"📄 Results written to {output_path}")
+
+    if baseline_path:
+        regressions = compare(results, baseline_path, args.threshold)
+        if regressions:
+            print(f"❌ {len(regressions)} regression(s) above {args.threshold:.0%}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
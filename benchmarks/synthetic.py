@@ -0,0 +1,182 @@
+"""
+Synthetic benchmark inputs: multi-page resume PDFs and job descriptions.
+
+Everything is generated locally from a seed, so runs on different commits
+see identical inputs. The PDF writer is a minimal hand-rolled one (Helvetica
+text in plain content streams) so no renderer has to be installed.
+"""
+
+import os
+import random
+from typing import Dict, List, Optional
+
+from resume_job_match_ai.scoring import SKILLS
+
+LINES_PER_PAGE = 60
+ROLES = [
+    "Software Engineer",
+    "Backend Engineer",
+    "Data Engineer",
+    "Machine Learning Engineer",
+    "Site Reliability Engineer",
+    "Platform Engineer",
+]
+COMPANIES = ["Example Corp", "Sample Ltd", "Acme Inc", "Globex", "Initech", "Umbrella Labs"]
+VERBS = ["Built", "Designed", "Led", "Migrated", "Optimized", "Automated", "Maintained", "Scaled"]
+OBJECTS = [
+    "the billing platform",
+    "a real-time analytics pipeline",
+    "the payments API",
+    "internal developer tooling",
+    "the customer data warehouse",
+    "a recommendation service",
+]
+
+
+def _skills(rng: random.Random, count: int) -> List[str]:
+    return rng.sample(sorted(SKILLS), count)
+
+
+def make_resume_lines(pages: int, seed: int = 0) -> List[str]:
+    """Returns the text lines of a synthetic resume filling the given page count"""
+    rng = random.Random(seed)
+    lines = [
+        f"Candidate {seed}",
+        f"{rng.choice(ROLES)} | candidate{seed}@example.com | +1 555 {seed:04d}",
+        "",
+        "SUMMARY",
+        f"Engineer with {rng.randint(2, 15)} years of experience in {', '.join(_skills(rng, 4))}.",
+        "",
+        "SKILLS",
+        ", ".join(_skills(rng, 12)),
+        "",
+        "EXPERIENCE",
+    ]
+    target = pages * LINES_PER_PAGE
+    year = 2025
+    while len(lines) < target:
+        lines.append(f"{rng.choice(ROLES)} - {rng.choice(COMPANIES)} ({year - 2} - {year})")
+        for _ in range(rng.randint(3, 6)):
+            lines.append(
+                f"- {rng.choice(VERBS)} {rng.choice(OBJECTS)} with {', '.join(_skills(rng, 2))}, "
+                f"improving throughput by {rng.randint(5, 80)}%"
+            )
+        lines.append("")
+        year = year - 2 if year > 1995 else 2025
+    return lines[:target]
+
+
+def _escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def write_pdf(path: str, lines: List[str], running_header: Optional[str] = None):
+    """
+    Writes text lines to a PDF with LINES_PER_PAGE lines per page. With a
+    running_header, every page also gets that header line and a
+    "Page N of M" footer, like most exported resumes.
+    """
+    pages = [lines[i : i + LINES_PER_PAGE] for i in range(0, len(lines), LINES_PER_PAGE)] or [[]]
+    if running_header is not None:
+        pages = [
+            [running_header, *page_lines, f"Page {number} of {len(pages)}"]
+            for number, page_lines in enumerate(pages, start=1)
+        ]
+    objects: List[bytes] = []
+
+    def add(body: bytes) -> int:
+        objects.append(body)
+        return len(objects)
+
+    catalog = add(b"")  # placeholders filled once the page ids are known
+    page_tree = add(b"")
+    font = add(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    page_ids = []
+    for page_lines in pages:
+        text = "".join(f"({_escape(line)}) '\n" for line in page_lines)
+        stream = f"BT /F1 9 Tf 12 TL 50 800 Td\n{text}ET".encode("latin-1", "replace")
+        content = add(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        page_ids.append(
+            add(
+                b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 595 842] "
+                b"/Resources << /Font << /F1 %d 0 R >> >> /Contents %d 0 R >>"
+                % (page_tree, font, content)
+            )
+        )
+
+    objects[catalog - 1] = b"<< /Type /Catalog /Pages %d 0 R >>" % page_tree
+    kids = b" ".join(b"%d 0 R" % page_id for page_id in page_ids)
+    objects[page_tree - 1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(page_ids))
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(output)
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    output += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    output += b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        catalog,
+        xref,
+    )
+    with open(path, "wb") as file:
+        file.write(output)
+
+
+def make_job_description(seed: int = 0) -> str:
+    """Returns the text of a synthetic job description"""
+    rng = random.Random(1_000_000 + seed)
+    required = _skills(rng, 6)
+    nice = _skills(rng, 4)
+    return "\n".join(
+        [
+            f"{rng.choice(ROLES)} at {rng.choice(COMPANIES)}",
+            "",
+            "About the role",
+            f"We are looking for an engineer to work on {rng.choice(OBJECTS)}.",
+            "",
+            "Requirements",
+            *[f"- Experience with {skill}" for skill in required],
+            f"- {rng.randint(2, 8)}+ years of professional experience",
+            "",
+            "Nice to have",
+            *[f"- {skill}" for skill in nice],
+        ]
+    )
+
+
+def make_resume_markdown(seed: int = 0) -> str:
+    """Returns a markdown resume like the one the writer agent passes to save_resume_as_pdf"""
+    lines = make_resume_lines(2, seed)
+    body = "\n".join(
+        line if line.startswith("- ") or not line.isupper() else f"### {line.title()}"
+        for line in lines[2:]
+    )
+    return f"# {lines[0]}\n\n{lines[1]}\n\n{body}\n"
+
+
+def generate_corpus(directory: str, page_counts: List[int], jd_count: int) -> Dict[str, object]:
+    """
+    Writes synthetic resumes and job descriptions into directory.
+
+    Returns:
+        Dict[str, object]: ``resumes`` maps page counts to PDF paths, ``jds``
+        lists the job description paths.
+    """
+    os.makedirs(directory, exist_ok=True)
+    resumes = {}
+    for pages in page_counts:
+        path = os.path.join(directory, f"resume_{pages:03d}p.pdf")
+        write_pdf(path, make_resume_lines(pages, seed=pages), running_header=f"Candidate {pages} - Resume")
+        resumes[pages] = path
+
+    jds = []
+    for seed in range(jd_count):
+        path = os.path.join(directory, f"jd_{seed:03d}.txt")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(make_job_description(seed))
+        jds.append(path)
+    return {"resumes": resumes, "jds": jds}
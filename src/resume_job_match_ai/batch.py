@@ -0,0 +1,237 @@
+import contextlib
+import csv
+import json
+import os
+import shutil
+import statistics
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from typing import List, Optional
+
+BATCH_OUTPUT_ROOT = os.path.join("output", "batch")
+
+
+@dataclass
+class BatchJob:
+    """A single resume/job description pair and its output workspace."""
+
+    job_id: str
+    resume_path: str
+    jd_path: str
+    output_dir: str
+    output_root: str = BATCH_OUTPUT_ROOT
+
+
+@dataclass
+class BatchResult:
+    """Outcome and timing of one batch job."""
+
+    job_id: str
+    output_dir: str
+    success: bool
+    started_at: float
+    finished_at: float
+    latency_seconds: float
+    error: Optional[str] = None
+
+
+def load_manifest(manifest_path: str, output_root: str = BATCH_OUTPUT_ROOT) -> List[BatchJob]:
+    """
+    Loads resume/JD pairs from a manifest file.
+
+    The manifest is either a JSON list of objects or a CSV file with a header
+    row. Each entry needs ``resume`` and ``jd`` paths and may set an ``id``
+    that names its output workspace.
+
+    Args:
+        manifest_path (str): Path to a .json or .csv manifest.
+        output_root (str): Directory under which each job gets its workspace.
+
+    Returns:
+        List[BatchJob]: The jobs in manifest order.
+    """
+    if manifest_path.lower().endswith(".csv"):
+        with open(manifest_path, newline="", encoding="utf-8") as file:
+            entries = list(csv.DictReader(file))
+    else:
+        with open(manifest_path, encoding="utf-8") as file:
+            entries = json.load(file)
+
+    jobs = []
+    seen_ids = set()
+    for index, entry in enumerate(entries):
+        resume_path = entry["resume"]
+        jd_path = entry["jd"]
+        job_id = entry.get("id") or "{:04d}-{}-{}".format(
+            index,
+            os.path.splitext(os.path.basename(resume_path))[0],
+            os.path.splitext(os.path.basename(jd_path))[0],
+        )
+        if job_id in (".", "..") or os.path.basename(job_id) != job_id:
+            raise ValueError(f"Job ids must be plain file names: {job_id!r}")
+        if job_id in seen_ids:
+            raise ValueError(f"Duplicate job id in manifest: {job_id}")
+        seen_ids.add(job_id)
+        jobs.append(
+            BatchJob(
+                job_id=job_id,
+                resume_path=resume_path,
+                jd_path=jd_path,
+                output_dir=os.path.join(output_root, job_id),
+                output_root=output_root,
+            )
+        )
+    return jobs
+
+
+def prepare_workspace(output_dir: str, output_root: str = BATCH_OUTPUT_ROOT):
+    """
+    Creates an empty output workspace for a job.
+
+    Raises:
+        ValueError: If output_dir does not resolve to a directory inside output_root.
+    """
+    root = os.path.abspath(output_root)
+    workspace = os.path.abspath(output_dir)
+    if not workspace.startswith(root + os.sep):
+        raise ValueError(f"Workspace {output_dir!r} is outside {output_root!r}")
+    if os.path.exists(output_dir):
+        shutil.rmtree(output_dir)
+    os.makedirs(output_dir)
+
+
+def run_job(job: BatchJob) -> BatchResult:
+    """
+    Runs the crew for one job inside its own workspace.
+
+    Executed in a worker process. The crew's console output is captured to
+    ``run.log`` in the workspace so parallel jobs do not interleave.
+    """
+    from .crew import ResumeJobMatchAi
+    from .main import build_inputs
+
+    started_at = time.time()
+    start = time.perf_counter()
+    error = None
+
+    prepare_workspace(job.output_dir, job.output_root)
+    log_path = os.path.join(job.output_dir, "run.log")
+    with open(log_path, "w", encoding="utf-8") as log_file:
+        with contextlib.redirect_stdout(log_file), contextlib.redirect_stderr(log_file):
+            try:
+                inputs = build_inputs(job.resume_path, job.jd_path)
+                ResumeJobMatchAi(output_dir=job.output_dir).crew().kickoff(inputs=inputs)
+            except Exception as e:
+                traceback.print_exc()
+                error = f"{type(e).__name__}: {e}"
+
+    return BatchResult(
+        job_id=job.job_id,
+        output_dir=job.output_dir,
+        success=error is None,
+        started_at=started_at,
+        finished_at=time.time(),
+        latency_seconds=time.perf_counter() - start,
+        error=error,
+    )
+
+
+def summarize(results: List[BatchResult], wall_seconds: float, workers: int) -> dict:
+    """Builds the throughput and latency summary of a batch"""
+    latencies = sorted(result.latency_seconds for result in results)
+    summary = {
+        "jobs": len(results),
+        "succeeded": sum(1 for result in results if result.success),
+        "failed": sum(1 for result in results if not result.success),
+        "workers": workers,
+        "wall_seconds": round(wall_seconds, 3),
+        "throughput_jobs_per_minute": round(len(results) / wall_seconds * 60, 3)
+        if wall_seconds > 0
+        else 0.0,
+        "latency_seconds": latency_summary(latencies),
+        "results": [asdict(result) for result in results],
+    }
+    return summary
+
+
+def latency_summary(values: List[float]) -> dict:
+    """Mean, p50, p95 and max of a list of durations; empty when there are none"""
+    if not values:
+        return {}
+    values = sorted(values)
+    return {
+        "mean": round(statistics.mean(values), 3),
+        "p50": round(_percentile(values, 50), 3),
+        "p95": round(_percentile(values, 95), 3),
+        "max": round(values[-1], 3),
+    }
+
+
+def _percentile(sorted_values: List[float], percent: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    rank = max(0, min(len(sorted_values) - 1, round(percent / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def run_batch(manifest_path: str, workers: int = 2, output_root: str = BATCH_OUTPUT_ROOT) -> dict:
+    """
+    Runs every pair of a manifest through the crew on a bounded process pool.
+
+    Each job writes to ``<output_root>/<job_id>`` so concurrent runs never
+    overwrite each other's reports or enhanced_resume.pdf. A throughput and
+    latency summary is written to ``<output_root>/batch_summary.json``.
+
+    Args:
+        manifest_path (str): Path to a .json or .csv manifest of pairs.
+        workers (int): Maximum number of jobs running at the same time.
+        output_root (str): Directory holding the per-job workspaces.
+
+    Returns:
+        dict: The batch summary.
+    """
+    jobs = load_manifest(manifest_path, output_root)
+    os.makedirs(output_root, exist_ok=True)
+    print(f"📦 Running {len(jobs)} jobs with {workers} workers...")
+
+    results = []
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(run_job, job): job for job in jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                # The worker process itself died, not just the crew
+                result = BatchResult(
+                    job_id=job.job_id,
+                    output_dir=job.output_dir,
+                    success=False,
+                    started_at=0.0,
+                    finished_at=time.time(),
+                    latency_seconds=0.0,
+                    error=f"{type(e).__name__}: {e}",
+                )
+            results.append(result)
+            status = "✅" if result.success else "❌"
+            print(f"{status} {result.job_id}: {result.latency_seconds:.1f}s")
+
+    summary = summarize(results, time.perf_counter() - start, workers)
+    summary_path = os.path.join(output_root, "batch_summary.json")
+    with open(summary_path, "w", encoding="utf-8") as file:
+        json.dump(summary, file, indent=2)
+
+    print(
+        f"\n📈 BATCH SUMMARY: {summary['succeeded']}/{summary['jobs']} succeeded in "
+        f"{summary['wall_seconds']}s ({summary['throughput_jobs_per_minute']} jobs/min)"
+    )
+    if summary["latency_seconds"]:
+        latency = summary["latency_seconds"]
+        print(
+            f"⏱️ Latency: mean {latency['mean']}s, p50 {latency['p50']}s, "
+            f"p95 {latency['p95']}s, max {latency['max']}s"
+        )
+    print(f"📄 Summary written to: {summary_path}")
+    return summary
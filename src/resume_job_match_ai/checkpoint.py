@@ -0,0 +1,199 @@
+import datetime
+import json
+import os
+import re
+import time
+from typing import Any, Dict, List, Optional
+
+from crewai import Task, TaskOutput
+from crewai.events import crewai_event_bus
+from crewai.events.types.task_events import TaskCompletedEvent, TaskStartedEvent
+from pydantic import Field, PrivateAttr
+
+from .tools.disk_cache import CACHE_ROOT, DiskCache, sha256_hex
+
+# Bump when the key or the stored record changes shape
+CHECKPOINT_VERSION = 1
+# The placeholders crewai interpolates into task and agent templates
+PLACEHOLDER_PATTERN = re.compile(r"\{([A-Za-z_][A-Za-z0-9_\-]*)\}")
+
+
+def checkpoints_enabled() -> bool:
+    """Checkpoints are on unless RESUME_CHECKPOINTS=0"""
+    return os.environ.get("RESUME_CHECKPOINTS", "1") != "0"
+
+
+class TaskCheckpointStore:
+    """
+    Outputs of finished tasks, keyed on everything that produced them.
+
+    A record holds the raw task output and the content hashes of the
+    task's artifacts (files such as the PDF that a tool wrote). Artifact
+    contents are stored once per hash and copied back into place on
+    restore. Both live under the cache directory, outside the output
+    directory that run_crew cleans before every run.
+    """
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: int = 256 * 1024 * 1024):
+        directory = directory or os.path.join(CACHE_ROOT, "checkpoints")
+        self.records = DiskCache(os.path.join(directory, "tasks"), max_bytes, suffix=".json")
+        self.files = DiskCache(os.path.join(directory, "files"), max_bytes, suffix=".bin")
+        self.restored: List[str] = []
+        self.executed: List[str] = []
+
+    @classmethod
+    def from_env(cls) -> Optional["TaskCheckpointStore"]:
+        """
+        Creates the store from RESUME_CHECKPOINTS and
+        RESUME_CHECKPOINT_MAX_MB. Returns None when checkpoints are off.
+        """
+        if not checkpoints_enabled():
+            return None
+        return cls(max_bytes=int(os.environ.get("RESUME_CHECKPOINT_MAX_MB", "256")) * 1024 * 1024)
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """Returns the record stored under key, or None"""
+        data = self.records.get(key)
+        return json.loads(data) if data is not None else None
+
+    def save(self, key: str, task_name: str, raw: str, artifacts: Dict[str, str]):
+        """
+        Stores a task's output and artifacts.
+
+        Args:
+            key (str): Checkpoint key of the execution.
+            task_name (str): Name of the task, for inspection.
+            raw (str): Raw output of the task.
+            artifacts (Dict[str, str]): Artifact name -> path of the file written.
+        """
+        hashes = {}
+        for name, path in artifacts.items():
+            with open(path, "rb") as file:
+                data = file.read()
+            hashes[name] = sha256_hex(data)
+            self.files.put(hashes[name], data)
+        record = {"version": CHECKPOINT_VERSION, "task": task_name, "raw": raw, "artifacts": hashes, "created_at": time.time()}
+        self.records.put(key, json.dumps(record).encode("utf-8"))
+
+    def restore_file(self, digest: str, destination: str) -> bool:
+        """Places a stored artifact at destination; False when it was evicted"""
+        return self.files.copy_to(digest, destination)
+
+    def stats(self) -> Dict[str, List[str]]:
+        """Returns the names of the tasks restored and executed in this process"""
+        return {"restored": list(self.restored), "executed": list(self.executed)}
+
+
+def _fingerprint_value(value: Any) -> Any:
+    # Inputs that name files (the resume and the job description) are keyed
+    # on the file contents, not on the path
+    if isinstance(value, str) and os.path.isfile(value):
+        with open(value, "rb") as file:
+            return {"file_sha256": sha256_hex(file.read())}
+    return value
+
+
+class CheckpointedTask(Task):
+    """
+    crewai Task that is skipped when it already ran with the same inputs.
+
+    The checkpoint key hashes the task and agent templates, the agent's
+    model and tools, the inputs the templates use (file inputs by
+    content) and the context, which holds the outputs of the upstream
+    tasks. On a hit the stored output is returned and written to
+    ``output_file``, and the files listed in ``artifacts`` are put back.
+    A task is only checkpointed once all of its artifacts were written by
+    the execution, so a run whose PDF step failed is redone next time.
+    """
+
+    checkpoint_store: Optional[Any] = Field(default=None, exclude=True)
+    artifacts: List[str] = Field(default_factory=list)
+
+    _inputs: Dict[str, Any] = PrivateAttr(default_factory=dict)
+
+    def interpolate_inputs_and_add_conversation_history(self, inputs: Dict[str, Any]) -> None:
+        self._inputs = dict(inputs or {})
+        super().interpolate_inputs_and_add_conversation_history(inputs)
+
+    def checkpoint_key(self, agent: Any, context: Optional[str], tools: Optional[List[Any]] = None) -> str:
+        """Returns the key of executing this task with agent, context and tools"""
+        templates = {
+            "description": self._original_description or self.description,
+            "expected_output": self._original_expected_output or self.expected_output,
+            "role": getattr(agent, "_original_role", None) or agent.role,
+            "goal": getattr(agent, "_original_goal", None) or agent.goal,
+            "backstory": getattr(agent, "_original_backstory", None) or agent.backstory,
+        }
+        used = set()
+        for template in templates.values():
+            used.update(PLACEHOLDER_PATTERN.findall(template or ""))
+        payload = {
+            "version": CHECKPOINT_VERSION,
+            "task": self.name,
+            "templates": templates,
+            "markdown": self.markdown,
+            "output_format": self._get_output_format().value,
+            "model": getattr(agent.llm, "model", str(agent.llm)),
+            "tools": sorted(tool.name for tool in (tools or self.tools or agent.tools or [])),
+            "inputs": {name: _fingerprint_value(self._inputs.get(name)) for name in sorted(used)},
+            "context": context or "",
+            "artifacts": sorted(os.path.basename(path) for path in self.artifacts),
+        }
+        return sha256_hex(json.dumps(payload, sort_keys=True, default=str).encode("utf-8"))
+
+    def _execute_core(self, agent: Any, context: Optional[str], tools: Optional[List[Any]]) -> TaskOutput:
+        store = self.checkpoint_store
+        agent = agent or self.agent
+        if store is None or agent is None:
+            return super()._execute_core(agent, context, tools)
+
+        key = self.checkpoint_key(agent, context, tools)
+        record = store.load(key)
+        if record is not None:
+            output = self._restore(record, agent, context)
+            if output is not None:
+                print(f"♻️ {self.name}: inputs unchanged, restored from checkpoint {key[:12]}")
+                store.restored.append(self.name)
+                return output
+
+        started = time.time()
+        output = super()._execute_core(agent, context, tools)
+        store.executed.append(self.name)
+        written = {os.path.basename(path): path for path in self.artifacts}
+        missing = [
+            path for path in written.values() if not os.path.exists(path) or os.path.getmtime(path) < started
+        ]
+        if missing:
+            print(f"⚠️ {self.name}: not checkpointed, missing {', '.join(missing)}")
+        else:
+            store.save(key, self.name, output.raw, written)
+        return output
+
+    def _restore(self, record: Dict[str, Any], agent: Any, context: Optional[str]) -> Optional[TaskOutput]:
+        """Rebuilds the task output from a record; None when an artifact is gone"""
+        for path in self.artifacts:
+            digest = record["artifacts"].get(os.path.basename(path))
+            if digest is None or not self.checkpoint_store.restore_file(digest, path):
+                return None
+
+        # The same events as an execution, so tracing and streaming see the task
+        self.agent = agent
+        self.prompt_context = context
+        self.start_time = datetime.datetime.now()
+        crewai_event_bus.emit(self, TaskStartedEvent(context=context, task=self))
+        pydantic_output, json_output = self._export_output(record["raw"])
+        self.output = TaskOutput(
+            name=self.name or self.description,
+            description=self.description,
+            expected_output=self.expected_output,
+            raw=record["raw"],
+            pydantic=pydantic_output,
+            json_dict=json_output,
+            agent=agent.role,
+            output_format=self._get_output_format(),
+        )
+        self.end_time = datetime.datetime.now()
+        if self.output_file:
+            self._save_file(record["raw"])
+        crewai_event_bus.emit(self, TaskCompletedEvent(output=self.output, task=self))
+        return self.output
@@ -1,5 +1,5 @@
 import os
-from typing import List
+from typing import List, Optional
 
 from crewai import Agent, Crew, Process, Task, TaskOutput
 from crewai.agents.agent_builder.base_agent import BaseAgent
@@ -12,10 +12,18 @@ from crewai.project import CrewBase, agent, crew, task
 #     save_resume_as_pdf,
 # )
 # Import tools directly
-from crewai_tools import SerperDevTool
-
+from .checkpoint import CheckpointedTask, TaskCheckpointStore
+from .llm_cache import CachedLLM, LLMResponseCache
+from .local_memory import build_local_memories, memory_backend
+from .profiling import set_report_dir
+from .rate_limit import TokenBucketLimiter
+from .scheduler import EXECUTION_MODES, ContextTrimmingCrew, DagCrew
+from .streaming import start_streaming
 from .tools.file_tools import extract_job_description
-from .tools.pdf_tools import extract_resume, save_resume_as_pdf
+from .tools.knowledge_tools import search_knowledge
+from .tools.pdf_tools import extract_resume, save_resume_as_pdf, set_output_dir
+from .tools.search_tools import create_search_tool
+from .tracing import start_tracing
 
 
 @CrewBase
@@ -27,13 +35,66 @@ class ResumeJobMatchAi:
     tasks_config: dict  # Add this line to define tasks_config
     agents_config: dict  # Add this line to define agents_config
 
-    def __init__(self):
-        # Ensure output directory exists
-        if not os.path.exists("./output"):
-            os.makedirs("./output")
+    def __init__(
+        self,
+        output_dir: str = "output",
+        execution_mode: Optional[str] = None,
+        streaming: Optional[bool] = None,
+        warm: Optional["ResumeJobMatchAi"] = None,
+    ):
+        # Every run writes its reports and PDF into its own workspace.
+        # crewai strips the leading slash of task output files, so the
+        # workspace is kept relative to the working directory.
+        self.output_dir = os.path.relpath(output_dir)
+        if self.output_dir.startswith(".."):
+            raise ValueError(
+                f"Output directory must be inside the working directory: {output_dir}"
+            )
+        if not os.path.exists(self.output_dir):
+            os.makedirs(self.output_dir)
+        set_output_dir(self.output_dir)
+        # Profiling reports (RESUME_PROFILE) go next to this run's outputs
+        set_report_dir(os.environ.get("RESUME_PROFILE_DIR") or self._output_file("profile"))
+
+        # "sequential" runs tasks in tasks.yaml order, "dag" runs independent
+        # tasks concurrently based on their context dependencies
+        self.execution_mode = execution_mode or os.environ.get(
+            "RESUME_EXECUTION_MODE", "sequential"
+        )
+        if self.execution_mode not in EXECUTION_MODES:
+            raise ValueError(
+                f"Unknown execution mode '{self.execution_mode}', expected one of {EXECUTION_MODES}"
+            )
 
-        # Initialize tools as instance variables for better control
-        self.serper_tool = SerperDevTool()
+        # An already built instance (the crew daemon keeps one) lends this
+        # run its caches, rate limiter, search tool and memory stores, so
+        # they are not set up again for every job.
+
+        # Record/replay cache of LLM responses, None unless RESUME_LLM_CACHE is set
+        self.llm_cache = warm.llm_cache if warm is not None else LLMResponseCache.from_env()
+        # Shared provider/model token buckets from the rate_limits section of
+        # agents.yaml; loaded here because CrewBase reads the YAML after __init__
+        self._rate_limiter: Optional[TokenBucketLimiter] = warm.rate_limiter if warm is not None else None
+        # Outputs of finished tasks keyed on their inputs, so a rerun only
+        # executes the tasks whose inputs changed; None when RESUME_CHECKPOINTS=0
+        self.checkpoints = warm.checkpoints if warm is not None else TaskCheckpointStore.from_env()
+        # "local" keeps crew memory in SQLite with hashed vectors (no embedding
+        # calls), "crewai" uses crewai's embedder and vector store, "off" disables it
+        self.memory_backend = memory_backend()
+        # Memory stores of the built crew, reused by instances warmed from this one
+        self.memories: dict = dict(warm.memories) if warm is not None else {}
+        if not self.memories and self.memory_backend == "local":
+            self.memories = build_local_memories()
+        # Spans of tasks, agent steps, LLM and tool calls written to
+        # trace.jsonl, None when RESUME_TRACING=0
+        self.tracer = start_tracing(self.output_dir)
+        # Streams agent output into the report files and to subscribers
+        # while it is generated, None unless RESUME_STREAMING=1
+        self.streamer = start_streaming(streaming)
+
+        # Initialize tools as instance variables for better control.
+        # One cached search tool is shared by the agent and its task.
+        self.search_tool = warm.search_tool if warm is not None else create_search_tool()
 
     @agent
     def resume_analyst(self) -> Agent:
@@ -42,17 +103,17 @@ class ResumeJobMatchAi:
 
         The agent uses the configuration specified in 'agents_config' under
         the 'resume_analyst' key. It operates in verbose mode,
-        with a maximum of 10 requests per minute
-        and a maximum execution time of 5 minutes.
+        is paced by the shared rate limits in agents.yaml
+        and has a maximum execution time of 3 minutes.
 
         Returns:
             Agent: An initialized Agent object for analyzing resumes.
         """
         return Agent(
             config=self.agents_config["resume_analyst"],  # type: ignore[index]
+            llm=self._llm("resume_analyst"),
             verbose=True,
             tools=[extract_resume],
-            max_rpm=1,  # Reduced rate limit
             max_execution_time=180,  # 3 minutes
             allow_delegation=False,  # Prevent delegation issues
             step_callback=self._log_agent_step,
@@ -73,9 +134,9 @@ class ResumeJobMatchAi:
         """
         return Agent(
             config=self.agents_config["matchmaker"],  # type: ignore[index]
+            llm=self._llm("matchmaker"),
             verbose=True,
-            tools=[extract_job_description],
-            max_rpm=1,
+            tools=[extract_job_description, search_knowledge],
             max_execution_time=180,
             allow_delegation=False,
             step_callback=self._log_agent_step,
@@ -87,17 +148,17 @@ class ResumeJobMatchAi:
         Creates and returns an Agent instance configured as a web researcher.
 
         The agent is initialized with the 'web_researcher' configuration from the agents_config,
-        runs in verbose mode, and is limited to 10 requests per minute with a maximum execution
-        time of 5 minutes.
+        runs in verbose mode, and is paced by the shared rate limits in agents.yaml with a maximum
+        execution time of 10 minutes.
 
         Returns:
             Agent: An Agent instance configured for web research tasks.
         """
         return Agent(
             config=self.agents_config["web_researcher"],  # type: ignore[index]
+            llm=self._llm("web_researcher"),
             verbose=True,
-            tools=[self.serper_tool],
-            # max_rpm=1,
+            tools=[self.search_tool, search_knowledge],
             max_execution_time=600,
             allow_delegation=False,
             step_callback=self._log_agent_step,
@@ -109,17 +170,18 @@ class ResumeJobMatchAi:
         Creates and returns an Agent instance configured as a resume writer.
 
         The Agent is initialized with the 'resume_writer' configuration from the agents_config dictionary.
-        It operates in verbose mode, allows up to 10 requests per minute, and has a maximum execution time of 5 minutes.
+        It operates in verbose mode, is paced by the shared rate limits in agents.yaml, and has a maximum
+        execution time of 5 minutes.
 
         Returns:
             Agent: An Agent instance configured for resume writing tasks.
         """
         return Agent(
             config=self.agents_config["resume_writer"],  # type: ignore[index]
+            llm=self._llm("resume_writer"),
             verbose=True,
             tools=[save_resume_as_pdf],
             max_retry_limit=3,
-            max_rpm=1,
             max_execution_time=300,  # 5 minutes for PDF generation
             allow_delegation=False,
             step_callback=self._log_agent_step,
@@ -134,9 +196,10 @@ class ResumeJobMatchAi:
             Task: An instance of Task initialized with the resume analysis configuration and
             set to output the analyst report to 'output/analyst_report.md'.
         """
-        return Task(
+        return CheckpointedTask(
             config=self.tasks_config["resume_analysis_task"],  # type: ignore[index]
-            # output_file="output/analyst_report.md",
+            output_file=self._output_file("analyst_report.md"),
+            checkpoint_store=self.checkpoints,
             tools=[extract_resume],
         )
 
@@ -149,10 +212,11 @@ class ResumeJobMatchAi:
             Task: A Task object initialized with the job matching configuration and
             set to output the report to 'output/job_matching_report.md'.
         """
-        return Task(
+        return CheckpointedTask(
             config=self.tasks_config["job_matching_task"],  # type: ignore[index]
-            # output_file="output/job_matching_report.md",
-            tools=[extract_job_description],
+            output_file=self._output_file("job_matching_report.md"),
+            checkpoint_store=self.checkpoints,
+            tools=[extract_job_description, search_knowledge],
         )
 
     @task
@@ -164,10 +228,11 @@ class ResumeJobMatchAi:
             Task: An instance of the Task class initialized with the web research task configuration
             and specifying the output file as 'output/web_research_summary.md'.
         """
-        return Task(
+        return CheckpointedTask(
             config=self.tasks_config["web_research_task"],  # type: ignore[index]
-            # output_file="output/web_research_summary.md",
-            tools=[SerperDevTool()],
+            output_file=self._output_file("web_research_summary.md"),
+            checkpoint_store=self.checkpoints,
+            tools=[self.search_tool, search_knowledge],
         )
 
     @task
@@ -182,29 +247,94 @@ class ResumeJobMatchAi:
                 'save_resume_as_pdf' tool and includes a callback function to be executed
                 after the task is completed.
         """
-        return Task(
+        return CheckpointedTask(
             config=self.tasks_config["resume_writer_task"],  # type: ignore[index]
-            # output_file="output/resume_advising_report.md",
+            output_file=self._output_file("resume_advising_report.md"),
             callback=self.confirm_resume_writer_completed,
             tools=[save_resume_as_pdf],
+            checkpoint_store=self.checkpoints,
+            # Without the PDF the task is redone on the next run
+            artifacts=[self._output_file("enhanced_resume.pdf")],
         )
 
     @crew
     def crew(self) -> Crew:
         """Creates the ResumeMatchAi crew"""
 
-        return Crew(
+        crew_options = dict(
             agents=self.agents,  # Automatically created by the @agent decorator
             tasks=self.tasks,  # Automatically created by the @task decorator
             process=Process.sequential,
             verbose=True,
             # process=Process.hierarchical, # In case you wanna use that instead https://docs.crewai.com/how-to/Hierarchical/
             # Add memory and planning for better coordination
-            memory=True,
+            memory=self.memory_backend != "off",
             planning=True,
             step_callback=self._crew_step_callback,
+            planning_llm=self._llm(),
+            # Upstream reports are cut to the sections each agent uses,
+            # RESUME_CONTEXT_TRIMMING=0 passes them on in full
+            trim_context=os.environ.get("RESUME_CONTEXT_TRIMMING", "1") != "0",
+            # Memory stores are built once (crewai's each set up an embedding
+            # client) and reused by warm instances
+            **self.memories,
         )
 
+        if self.execution_mode == "dag":
+            crew = DagCrew(
+                **crew_options,
+                max_concurrency=int(os.environ.get("RESUME_DAG_CONCURRENCY", "4")),
+                timings_file=self._output_file("task_timings.json"),
+            )
+        else:
+            crew = ContextTrimmingCrew(**crew_options)
+        if self.memory_backend == "off":
+            return crew
+        self.memories = {
+            "short_term_memory": crew._short_term_memory,
+            "long_term_memory": crew._long_term_memory,
+            "entity_memory": crew._entity_memory,
+        }
+        return crew
+
+    @property
+    def rate_limiter(self) -> Optional[TokenBucketLimiter]:
+        """Token-bucket limiter shared by all agents, built from agents.yaml"""
+        if self._rate_limiter is None:
+            self._rate_limiter = TokenBucketLimiter.from_config(
+                self.agents_config.get("rate_limits")
+            )
+        return self._rate_limiter
+
+    def _llm(self, agent_name: Optional[str] = None):
+        """
+        Returns the LLM for an agent, wrapped with the response cache and the
+        shared rate limiter when enabled, traced when tracing is on and
+        streaming when streaming is on. Without an agent name, returns
+        crewai's default planning model. Returns None when none of them is
+        enabled so the agents.yaml setting applies.
+        """
+        if (
+            self.llm_cache is None
+            and self.rate_limiter is None
+            and self.tracer is None
+            and self.streamer is None
+        ):
+            return None
+        model = self.agents_config[agent_name]["llm"] if agent_name else "gpt-4o-mini"
+        if not isinstance(model, str):
+            return model
+        return CachedLLM(
+            model=model,
+            response_cache=self.llm_cache,
+            rate_limiter=self.rate_limiter,
+            stream=self.streamer is not None,
+        )
+
+    def _output_file(self, filename: str) -> str:
+        """Returns the path of a report inside this run's output directory."""
+        return os.path.join(self.output_dir, filename)
+
     def _crew_step_callback(self, step):
         """Debug callback for crew-level steps"""
         print(f"🚀 CREW STEP: {step[:200]}")
@@ -217,7 +347,7 @@ class ResumeJobMatchAi:
             Agent: {output.agent}
         """)
 
-        pdf_path = "./output/enhanced_resume.pdf"
+        pdf_path = self._output_file("enhanced_resume.pdf")
 
         # Check if PDF was actually created
         if os.path.exists(pdf_path):
@@ -242,7 +372,7 @@ class ResumeJobMatchAi:
             print(
                 "1. The resume_writer agent must ACTUALLY call save_resume_as_pdf tool"
             )
-            print("2. Check that wkhtmltopdf is properly installed")
+            print("2. Check that a PDF renderer (wkhtmltopdf or WeasyPrint) is installed")
             print("3. Verify tool permissions and output directory access")
 
             return False
@@ -251,6 +381,8 @@ class ResumeJobMatchAi:
         """Enhanced debug callback to monitor actual tool usage"""
         step_name = type(step).__name__
         print(f"🔍 DEBUG - Step: {step_name}")
+        if self.tracer is not None:
+            self.tracer.agent_step(step)
 
         # Monitor for actual tool executions
         if hasattr(step, "tool_name"):
@@ -266,7 +398,7 @@ class ResumeJobMatchAi:
                     print(f"📤 Tool output: {step.output}")
 
                     # Check if PDF was actually created
-                    pdf_path = "./output/enhanced_resume.pdf"
+                    pdf_path = self._output_file("enhanced_resume.pdf")
                     if os.path.exists(pdf_path):
                         print("✅ PDF VERIFIED - File exists after tool call")
                     else:
@@ -0,0 +1,336 @@
+import contextlib
+import json
+import os
+import secrets
+import socket
+import socketserver
+import sys
+import threading
+import time
+import traceback
+from typing import Any, Dict, Optional
+
+from .tools.disk_cache import CACHE_ROOT
+
+DEFAULT_SOCKET_PATH = os.environ.get("RESUME_DAEMON_SOCKET", os.path.join(CACHE_ROOT, "crew_daemon.sock"))
+DAEMON_OUTPUT_ROOT = os.path.join("output", "daemon")
+
+# Time this module was imported, the fallback start of the process
+_MODULE_LOADED = time.time()
+
+
+def process_age() -> float:
+    """
+    Seconds since the current process started: interpreter start-up,
+    imports and everything after. Uses /proc where available, otherwise
+    the time since this module was imported.
+    """
+    try:
+        with open("/proc/self/stat", encoding="ascii") as file:
+            # The command name may contain spaces; fields after it are fixed
+            start_ticks = int(file.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/uptime", encoding="ascii") as file:
+            uptime = float(file.read().split()[0])
+        return uptime - start_ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError):
+        return time.time() - _MODULE_LOADED
+
+
+class _RoutedStream:
+    """A sys.stdout/sys.stderr stand-in that writes wherever the router says."""
+
+    def __init__(self, router: "JobOutputRouter", stream):
+        self._router = router
+        self._stream = stream
+
+    def write(self, text: str) -> int:
+        return self._router.target(self._stream).write(text)
+
+    def flush(self):
+        self._router.target(self._stream).flush()
+
+    def __getattr__(self, name: str):
+        return getattr(self._router.target(self._stream), name)
+
+
+class JobOutputRouter:
+    """
+    Sends the console output of the running job to its log file.
+
+    contextlib.redirect_stdout swaps sys.stdout for every thread, so a
+    status request answered during a job would print into that job's log.
+    Instead, sys.stdout and sys.stderr are replaced once by streams that
+    ask the router where to write. While a job runs, its thread writes to
+    the job's log, and so do the threads the crew starts (async tasks, the
+    DAG scheduler), since jobs run one at a time. Threads that called
+    mark_console, such as the socket request handlers, keep writing to the
+    original streams.
+    """
+
+    def __init__(self):
+        self._log = None
+        self._job_thread: Optional[threading.Thread] = None
+        self._local = threading.local()
+        self._installed = False
+
+    def install(self):
+        if not self._installed:
+            sys.stdout = _RoutedStream(self, sys.stdout)
+            sys.stderr = _RoutedStream(self, sys.stderr)
+            self._installed = True
+
+    def mark_console(self):
+        """Keeps the calling thread's output on the console unless it runs the job"""
+        self._local.console = True
+
+    def target(self, stream):
+        log = self._log
+        if log is None:
+            return stream
+        if threading.current_thread() is self._job_thread or not getattr(self._local, "console", False):
+            return log
+        return stream
+
+    @contextlib.contextmanager
+    def capture(self, log_file):
+        """Routes the job's output to log_file for the duration of the block"""
+        self.install()
+        self._job_thread = threading.current_thread()
+        self._log = log_file
+        try:
+            yield
+        finally:
+            self._log = None
+            self._job_thread = None
+
+
+_job_output = JobOutputRouter()
+
+
+class CrewDaemon:
+    """
+    Keeps a built crew warm and runs jobs submitted over a Unix socket.
+
+    Start-up imports crewai, the tools, the PDF renderer and the LLM
+    clients once and builds a template ResumeJobMatchAi. Each job builds
+    its own ResumeJobMatchAi from that template, so it has fresh agents and
+    tasks pointing at its own output directory but shares the caches,
+    search tool, rate limiter and memory stores. Jobs run one at a time
+    because the tools write to a process-wide output directory.
+    """
+
+    def __init__(self, output_root: str = DAEMON_OUTPUT_ROOT):
+        self.output_root = output_root
+        self._job_lock = threading.Lock()
+        self.jobs_served = 0
+        self.template = None
+        self._build_inputs = None
+        self.startup: Dict[str, float] = {}
+
+    def warm_up(self):
+        """Imports and builds everything a job needs and records how long it took"""
+        from .crew import ResumeJobMatchAi
+        from .knowledge_index import get_knowledge_index
+        from .main import build_inputs
+        from .tools.pdf_renderer import RendererUnavailableError, get_renderer
+
+        start = time.perf_counter()
+        try:
+            get_renderer()
+        except RendererUnavailableError as e:
+            print(f"⚠️ No PDF renderer, enhanced_resume.pdf will be missing: {e}")
+        # Jobs then start with the knowledge index synced and mapped
+        get_knowledge_index()
+        self.template = ResumeJobMatchAi(output_dir=os.path.join(self.output_root, "warmup"))
+        self.template.crew()
+        self._build_inputs = build_inputs
+        built = time.perf_counter()
+
+        self.startup = {
+            # What every cold run_crew pays before its first LLM call:
+            # interpreter start-up, imports, renderer detection and crew build
+            "cold_start_seconds": round(process_age(), 3),
+            "crew_build_seconds": round(built - start, 3),
+        }
+        print(
+            f"🔥 Crew warm after {self.startup['cold_start_seconds']:.2f}s "
+            f"(renderer and crew build {self.startup['crew_build_seconds']:.2f}s, the rest is start-up and imports)"
+        )
+
+    def run_job(self, resume_path: str, jd_path: str, output_dir: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Runs the crew for one pair with the warm template.
+
+        The crew's console output goes to ``run.log`` in the job's output
+        directory.
+
+        Returns:
+            Dict[str, Any]: Outcome, output directory and timings of the job.
+        """
+        from .crew import ResumeJobMatchAi
+
+        received = time.perf_counter()
+        job_id = secrets.token_hex(6)
+        output_dir = output_dir or os.path.join(self.output_root, job_id)
+        with self._job_lock:
+            started = time.perf_counter()
+            error = None
+            inputs_seconds = setup_seconds = run_seconds = 0.0
+            os.makedirs(output_dir, exist_ok=True)
+            with open(os.path.join(output_dir, "run.log"), "w", encoding="utf-8") as log_file:
+                with _job_output.capture(log_file):
+                    try:
+                        inputs = self._build_inputs(resume_path, jd_path)
+                        built_inputs = time.perf_counter()
+                        inputs_seconds = built_inputs - started
+                        crew = ResumeJobMatchAi(output_dir=output_dir, warm=self.template).crew()
+                        kickoff = time.perf_counter()
+                        setup_seconds = kickoff - built_inputs
+                        crew.kickoff(inputs=inputs)
+                        run_seconds = time.perf_counter() - kickoff
+                    except Exception as e:
+                        traceback.print_exc()
+                        error = f"{type(e).__name__}: {e}"
+            self.jobs_served += 1
+
+        status = "✅" if error is None else "❌"
+        print(f"{status} Job {job_id}: setup {setup_seconds:.2f}s, run {run_seconds:.1f}s")
+        return {
+            "job_id": job_id,
+            "success": error is None,
+            "error": error,
+            "output_dir": os.path.abspath(output_dir),
+            "wait_seconds": round(started - received, 3),
+            "inputs_seconds": round(inputs_seconds, 3),
+            # Building the crew from the warm template: the warm start
+            "setup_seconds": round(setup_seconds, 3),
+            "run_seconds": round(run_seconds, 3),
+            **self.startup,
+        }
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Answers one client request: ``run``, ``status`` or ``stop``"""
+        command = request.get("command", "run")
+        if command == "status":
+            return {"jobs_served": self.jobs_served, "busy": self._job_lock.locked(), **self.startup}
+        if command == "run":
+            missing = [name for name in ("resume", "jd") if not request.get(name)]
+            if missing:
+                return {"success": False, "error": f"Missing {', '.join(missing)}"}
+            output_dir = request.get("output_dir")
+            if output_dir is not None:
+                # Jobs write below the daemon's working directory
+                output_dir = os.path.relpath(output_dir)
+                if os.path.isabs(output_dir) or output_dir in (".", "..") or output_dir.startswith(".." + os.sep):
+                    return {"success": False, "error": f"output_dir must be below {os.getcwd()}"}
+            return self.run_job(request["resume"], request["jd"], output_dir)
+        return {"success": False, "error": f"Unknown command '{command}'"}
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """One JSON request line in, one JSON response line out."""
+
+    server: "CrewDaemonServer"
+
+    def handle(self):
+        _job_output.mark_console()
+        line = self.rfile.readline()
+        if not line:
+            return
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as e:
+            response = {"success": False, "error": f"Invalid request: {e}"}
+        else:
+            if request.get("command") == "stop":
+                response = {"success": True}
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+            else:
+                response = self.server.crew_daemon.handle(request)
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+if hasattr(socket, "AF_UNIX"):
+
+    class CrewDaemonServer(socketserver.ThreadingUnixStreamServer):
+        """Unix socket front end of a CrewDaemon."""
+
+        daemon_threads = True
+
+        def __init__(self, socket_path: str, crew_daemon: CrewDaemon):
+            self.crew_daemon = crew_daemon
+            super().__init__(socket_path, _RequestHandler)
+
+
+def _check_socket(socket_path: str):
+    """Removes a stale socket file, refuses to start next to a live daemon"""
+    if not os.path.exists(socket_path):
+        return
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            probe.connect(socket_path)
+    except OSError:
+        os.unlink(socket_path)
+        return
+    raise RuntimeError(f"A crew daemon is already listening on {socket_path}")
+
+
+def serve_daemon(socket_path: str = DEFAULT_SOCKET_PATH, output_root: str = DAEMON_OUTPUT_ROOT):
+    """
+    Warms up a crew and serves jobs on a Unix socket until stopped.
+
+    Args:
+        socket_path (str): Path of the Unix socket to listen on.
+        output_root (str): Directory holding one output directory per job.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        raise RuntimeError("The crew daemon needs Unix domain sockets, which this platform lacks")
+    _check_socket(socket_path)
+    os.makedirs(os.path.dirname(os.path.abspath(socket_path)), exist_ok=True)
+
+    _job_output.mark_console()
+    crew_daemon = CrewDaemon(output_root)
+    crew_daemon.warm_up()
+    server = CrewDaemonServer(socket_path, crew_daemon)
+    print(f"🛰️ Crew daemon listening on {socket_path}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n⚠️ Crew daemon stopped by user")
+    finally:
+        server.server_close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+def request_daemon(request: Dict[str, Any], socket_path: str = DEFAULT_SOCKET_PATH) -> Dict[str, Any]:
+    """
+    Sends one request to a running daemon and waits for its answer.
+
+    Raises:
+        ConnectionError: When no daemon listens on socket_path.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        try:
+            connection.connect(socket_path)
+        except (FileNotFoundError, ConnectionRefusedError) as e:
+            raise ConnectionError(f"No crew daemon listening on {socket_path}; start it with crew_daemon") from e
+        connection.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        with connection.makefile("rb") as reader:
+            line = reader.readline()
+    if not line:
+        raise ConnectionError("The crew daemon closed the connection without answering")
+    return json.loads(line)
+
+
+def submit_job(
+    resume_path: str,
+    jd_path: str,
+    output_dir: Optional[str] = None,
+    socket_path: str = DEFAULT_SOCKET_PATH,
+) -> Dict[str, Any]:
+    """Runs a resume/JD pair on the daemon; paths are sent as absolute paths"""
+    request = {"command": "run", "resume": os.path.abspath(resume_path), "jd": os.path.abspath(jd_path)}
+    if output_dir is not None:
+        request["output_dir"] = os.path.abspath(output_dir)
+    return request_daemon(request, socket_path)
@@ -0,0 +1,176 @@
+import heapq
+import json
+import math
+import os
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from .scoring import tokenize
+from .tools.disk_cache import CACHE_ROOT, atomic_write_bytes
+
+INDEX_VERSION = 1
+DEFAULT_INDEX_PATH = os.path.join(CACHE_ROOT, "jd_index.json")
+JD_EXTENSIONS = (".txt", ".md")
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+
+class JobIndex:
+    """
+    Persistent inverted index over a corpus of job descriptions.
+
+    Postings map each term to the documents containing it with their term
+    frequency; every document keeps its length (the BM25 length norm), its
+    file mtime and size, and its unique terms so it can be removed without a
+    rebuild. Queries rank documents with BM25, touching only the postings of
+    the query terms.
+    """
+
+    def __init__(self, path: str = DEFAULT_INDEX_PATH):
+        self.path = path
+        self.postings: Dict[str, Dict[str, int]] = {}
+        self.documents: Dict[str, dict] = {}
+        self.total_length = 0
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_INDEX_PATH) -> "JobIndex":
+        """Loads an index from disk, or returns an empty one if none exists"""
+        index = cls(path)
+        if not os.path.exists(path):
+            return index
+        with open(path, encoding="utf-8") as file:
+            data = json.load(file)
+        if data.get("version") != INDEX_VERSION:
+            print(f"⚠️ Ignoring index with unsupported version: {path}")
+            return index
+        index.postings = data["postings"]
+        index.documents = data["documents"]
+        index.total_length = sum(document["length"] for document in index.documents.values())
+        return index
+
+    def save(self):
+        """Writes the index to disk atomically"""
+        data = {
+            "version": INDEX_VERSION,
+            "documents": self.documents,
+            "postings": self.postings,
+        }
+        atomic_write_bytes(self.path, json.dumps(data, separators=(",", ":")).encode("utf-8"))
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self.documents
+
+    def add(self, doc_id: str, text: str, mtime: float = 0.0, size: int = 0):
+        """Adds or replaces a document"""
+        if doc_id in self.documents:
+            self.remove(doc_id)
+
+        counts = Counter(tokenize(text))
+        for term, frequency in counts.items():
+            self.postings.setdefault(term, {})[doc_id] = frequency
+        length = sum(counts.values())
+        self.documents[doc_id] = {
+            "length": length,
+            "mtime": mtime,
+            "size": size,
+            "terms": sorted(counts),
+        }
+        self.total_length += length
+
+    def remove(self, doc_id: str):
+        """Removes a document and its postings"""
+        document = self.documents.pop(doc_id, None)
+        if document is None:
+            return
+        for term in document["terms"]:
+            postings = self.postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(doc_id, None)
+            if not postings:
+                del self.postings[term]
+        self.total_length -= document["length"]
+
+    def sync_directory(self, directory: str) -> Dict[str, int]:
+        """
+        Brings the index in line with a directory of job descriptions.
+
+        Only new or modified files (by mtime and size) are tokenized, and
+        files that disappeared are removed. Document ids are paths relative
+        to the directory.
+
+        Returns:
+            Dict[str, int]: Number of added, updated, removed and unchanged files.
+        """
+        stats = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+        seen = set()
+        for root, _, files in os.walk(directory):
+            for filename in sorted(files):
+                if not filename.lower().endswith(JD_EXTENSIONS):
+                    continue
+                path = os.path.join(root, filename)
+                doc_id = os.path.relpath(path, directory)
+                seen.add(doc_id)
+                stat = os.stat(path)
+                document = self.documents.get(doc_id)
+                if document and document["mtime"] == stat.st_mtime and document["size"] == stat.st_size:
+                    stats["unchanged"] += 1
+                    continue
+                with open(path, encoding="utf-8") as file:
+                    self.add(doc_id, file.read(), mtime=stat.st_mtime, size=stat.st_size)
+                stats["updated" if document else "added"] += 1
+
+        for doc_id in [doc_id for doc_id in self.documents if doc_id not in seen]:
+            self.remove(doc_id)
+            stats["removed"] += 1
+        return stats
+
+    def search(self, query_text: str, k: int = 10) -> List[Tuple[str, float]]:
+        """
+        Returns the top-k documents for a query text, best first.
+
+        Args:
+            query_text (str): Usually the text returned by extract_resume.
+            k (int): Number of results.
+
+        Returns:
+            List[Tuple[str, float]]: Document ids with their BM25 scores.
+        """
+        if not self.documents:
+            return []
+
+        document_count = len(self.documents)
+        average_length = self.total_length / document_count or 1.0
+        scores: Dict[str, float] = {}
+        for term, query_frequency in Counter(tokenize(query_text)).items():
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (document_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            # Repeated query terms count, but with diminishing weight
+            weight = idf * (1 + math.log(query_frequency))
+            for doc_id, frequency in postings.items():
+                length = self.documents[doc_id]["length"]
+                denominator = frequency + K1 * (1 - B + B * length / average_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + weight * frequency * (K1 + 1) / denominator
+
+        top = heapq.nlargest(k, scores.items(), key=lambda item: item[1])
+        return [(doc_id, round(score, 4)) for doc_id, score in top]
+
+
+def build_index(directory: str, index_path: Optional[str] = None) -> JobIndex:
+    """Loads the index, syncs it with a job description directory and saves it"""
+    index = JobIndex.load(index_path or DEFAULT_INDEX_PATH)
+    stats = index.sync_directory(directory)
+    if stats["added"] or stats["updated"] or stats["removed"]:
+        index.save()
+    print(
+        f"🗂️ Job index: {len(index)} documents, {len(index.postings)} terms "
+        f"({stats['added']} added, {stats['updated']} updated, {stats['removed']} removed)"
+    )
+    return index
@@ -0,0 +1,299 @@
+import contextlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .scoring import EMBEDDING_DIM, embed
+from .tools.disk_cache import CACHE_ROOT, sha256_hex
+
+INDEX_VERSION = 1
+KNOWLEDGE_DIR = os.environ.get("RESUME_KNOWLEDGE_DIR", "knowledge")
+DEFAULT_INDEX_DIR = os.path.join(CACHE_ROOT, "knowledge")
+KNOWLEDGE_EXTENSIONS = (".txt", ".md")
+# Paragraphs are merged into chunks of up to this many characters
+CHUNK_CHARS = 1200
+# How often a long-running process looks for changed knowledge files
+REFRESH_SECONDS = float(os.environ.get("RESUME_KNOWLEDGE_REFRESH_SECONDS", "30"))
+
+_index: Optional["KnowledgeIndex"] = None
+_index_lock = threading.Lock()
+
+
+def chunk_text(text: str, max_chars: int = CHUNK_CHARS) -> List[str]:
+    """
+    Splits a document into chunks of whole paragraphs of up to max_chars.
+    A paragraph longer than that becomes a chunk of its own.
+    """
+    chunks: List[str] = []
+    current = ""
+    for paragraph in re.split(r"\n\s*\n", text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        if current and len(current) + len(paragraph) + 2 > max_chars:
+            chunks.append(current)
+            current = paragraph
+        else:
+            current = f"{current}\n\n{paragraph}" if current else paragraph
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+class KnowledgeIndex:
+    """
+    On-disk embedding index of the knowledge directory.
+
+    Chunk embeddings (see scoring.embed) are rows of a float32 matrix in
+    ``vectors-<generation>.f32``, which is memory-mapped, so opening the
+    index reads no vectors whatever its size. A SQLite database holds the
+    chunk table (row, file, text) and the mtime, size and content hash of
+    every indexed file. ``sync`` re-embeds only files whose contents
+    changed and copies the rows of the others into the next generation of
+    the matrix. A lookup is one matrix-vector product and a partial sort.
+    """
+
+    def __init__(self, directory: str = KNOWLEDGE_DIR, index_dir: str = DEFAULT_INDEX_DIR, dim: int = EMBEDDING_DIM):
+        self.directory = directory
+        self.index_dir = index_dir
+        self.dim = dim
+        self.generation = -1
+        self.vectors: Optional[np.ndarray] = None
+        self.synced_at = 0.0
+        self._lock = threading.Lock()
+        os.makedirs(index_dir, exist_ok=True)
+        self._connection = sqlite3.connect(
+            os.path.join(index_dir, "chunks.sqlite"), timeout=30, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY, mtime REAL NOT NULL, size INTEGER NOT NULL,
+                sha256 TEXT NOT NULL, first_row INTEGER NOT NULL, row_count INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS chunks (
+                row INTEGER PRIMARY KEY, path TEXT NOT NULL, position INTEGER NOT NULL, text TEXT NOT NULL
+            );
+            """
+        )
+
+    def _meta(self) -> Dict[str, str]:
+        return dict(self._connection.execute("SELECT key, value FROM meta").fetchall())
+
+    def _vectors_path(self, generation: int) -> str:
+        return os.path.join(self.index_dir, f"vectors-{generation}.f32")
+
+    def _open(self, meta: Dict[str, str]):
+        """Maps the matrix of the generation recorded in meta"""
+        self.generation = int(meta.get("generation", -1))
+        rows = int(meta.get("rows", 0))
+        self.vectors = None
+        if rows and self.generation >= 0:
+            self.vectors = np.memmap(
+                self._vectors_path(self.generation), dtype=np.float32, mode="r", shape=(rows, self.dim)
+            )
+
+    @contextlib.contextmanager
+    def _write_lock(self) -> Iterator[None]:
+        """Serializes rebuilds across processes sharing the index"""
+        with open(os.path.join(self.index_dir, ".lock"), "w") as lock_file:
+            try:
+                import fcntl
+
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            except ImportError:
+                pass
+            yield
+
+    def _scan(self) -> Dict[str, os.stat_result]:
+        files = {}
+        if not os.path.isdir(self.directory):
+            return files
+        for root, _, filenames in os.walk(self.directory):
+            for filename in filenames:
+                if filename.lower().endswith(KNOWLEDGE_EXTENSIONS):
+                    path = os.path.join(root, filename)
+                    files[os.path.relpath(path, self.directory)] = os.stat(path)
+        return files
+
+    def sync(self) -> Dict[str, int]:
+        """
+        Brings the index in line with the knowledge directory.
+
+        Files are compared by mtime and size first, and by content hash
+        when those differ, so touching a file does not re-embed it. When
+        anything changed, a new generation of the matrix is written and
+        the old one is removed.
+
+        Returns:
+            Dict[str, int]: Number of added, updated, removed and unchanged files.
+        """
+        with self._lock, self._write_lock():
+            stats = self._sync()
+            self._open(self._meta())
+            self.synced_at = time.time()
+        return stats
+
+    def _sync(self) -> Dict[str, int]:
+        stats = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+        meta = self._meta()
+        compatible = meta.get("version") == str(INDEX_VERSION) and meta.get("dim") == str(self.dim)
+        if compatible and int(meta.get("rows", 0)):
+            # Without the matrix the kept rows cannot be copied, so every file is embedded again
+            compatible = os.path.exists(self._vectors_path(int(meta.get("generation", -1))))
+        indexed = {
+            row[0]: row
+            for row in self._connection.execute("SELECT path, mtime, size, sha256, first_row, row_count FROM files")
+        } if compatible else {}
+
+        kept: Dict[str, tuple] = {}
+        changed: Dict[str, Tuple[os.stat_result, str, str]] = {}
+        touched: Dict[str, os.stat_result] = {}
+        for path, stat in sorted(self._scan().items()):
+            entry = indexed.get(path)
+            if entry is not None and entry[1] == stat.st_mtime and entry[2] == stat.st_size:
+                kept[path] = entry
+                continue
+            with open(os.path.join(self.directory, path), encoding="utf-8", errors="replace") as file:
+                text = file.read()
+            digest = sha256_hex(text.encode("utf-8"))
+            if entry is not None and entry[3] == digest:
+                kept[path] = entry
+                touched[path] = stat
+                continue
+            changed[path] = (stat, digest, text)
+            stats["updated" if entry is not None else "added"] += 1
+        stats["removed"] = len(set(indexed) - set(kept) - set(changed))
+        stats["unchanged"] = len(kept)
+
+        if touched:
+            with self._connection:
+                self._connection.executemany(
+                    "UPDATE files SET mtime = ?, size = ? WHERE path = ?",
+                    [(stat.st_mtime, stat.st_size, path) for path, stat in touched.items()],
+                )
+        if not changed and not stats["removed"] and compatible:
+            return stats
+
+        # Rows of unchanged files are copied, only changed files are embedded
+        old_vectors = None
+        if compatible:
+            self._open(meta)
+            old_vectors = self.vectors
+        blocks: List[np.ndarray] = []
+        chunk_rows: List[tuple] = []
+        file_rows: List[tuple] = []
+        row = 0
+        for path in sorted(set(kept) | set(changed)):
+            if path in kept:
+                _, mtime, size, digest, first_row, row_count = kept[path]
+                if path in touched:
+                    mtime, size = touched[path].st_mtime, touched[path].st_size
+                texts = [
+                    text
+                    for (text,) in self._connection.execute(
+                        "SELECT text FROM chunks WHERE row >= ? AND row < ? ORDER BY row",
+                        (first_row, first_row + row_count),
+                    )
+                ]
+                if row_count:
+                    block = np.asarray(old_vectors[first_row:first_row + row_count])
+                else:
+                    # A file without text has no rows, and the matrix may not exist
+                    block = np.empty((0, self.dim))
+            else:
+                stat, digest, text = changed[path]
+                mtime, size = stat.st_mtime, stat.st_size
+                texts = chunk_text(text)
+                block = np.stack([embed(chunk, self.dim) for chunk in texts]) if texts else np.empty((0, self.dim))
+            blocks.append(block.astype(np.float32, copy=False))
+            chunk_rows += [(row + position, path, position, chunk) for position, chunk in enumerate(texts)]
+            file_rows.append((path, mtime, size, digest, row, len(texts)))
+            row += len(texts)
+
+        generation = int(meta.get("generation", -1)) + 1
+        if row:
+            vectors = np.memmap(self._vectors_path(generation), dtype=np.float32, mode="w+", shape=(row, self.dim))
+            vectors[:] = np.concatenate(blocks)
+            vectors.flush()
+            del vectors
+        with self._connection:
+            self._connection.execute("DELETE FROM chunks")
+            self._connection.execute("DELETE FROM files")
+            self._connection.executemany("INSERT INTO chunks (row, path, position, text) VALUES (?, ?, ?, ?)", chunk_rows)
+            self._connection.executemany(
+                "INSERT INTO files (path, mtime, size, sha256, first_row, row_count) VALUES (?, ?, ?, ?, ?, ?)",
+                file_rows,
+            )
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                [("version", str(INDEX_VERSION)), ("dim", str(self.dim)), ("generation", str(generation)), ("rows", str(row))],
+            )
+        # Readers that still map an old generation keep it until they reopen
+        for filename in os.listdir(self.index_dir):
+            if filename.startswith("vectors-") and filename != os.path.basename(self._vectors_path(generation)):
+                os.unlink(os.path.join(self.index_dir, filename))
+        return stats
+
+    def ensure_fresh(self, max_age: float = REFRESH_SECONDS):
+        """Syncs the index unless that was done less than max_age seconds ago"""
+        if time.time() - self.synced_at >= max_age:
+            stats = self.sync()
+            if stats["added"] or stats["updated"] or stats["removed"]:
+                print(
+                    f"📚 Knowledge index: {len(self)} chunks ({stats['added']} files added, "
+                    f"{stats['updated']} updated, {stats['removed']} removed)"
+                )
+
+    def __len__(self) -> int:
+        return 0 if self.vectors is None else len(self.vectors)
+
+    def search(self, query: str, k: int = 4, min_score: float = 0.05) -> List[Dict[str, object]]:
+        """
+        Returns the k chunks most similar to query, best first.
+
+        Returns:
+            List[Dict[str, object]]: File path, chunk position, cosine
+                similarity and text of every hit.
+        """
+        with self._lock:
+            meta = self._meta()
+            if int(meta.get("generation", -1)) != self.generation:
+                # Another process rebuilt the index
+                self._open(meta)
+            if self.vectors is None or k <= 0:
+                return []
+            scores = self.vectors @ embed(query, self.dim)
+            count = min(k, len(scores))
+            top = np.argpartition(-scores, count - 1)[:count]
+            rows = [int(row) for row in top[np.argsort(-scores[top])] if scores[row] >= min_score]
+            if not rows:
+                return []
+            chunks = {
+                row[0]: row
+                for row in self._connection.execute(
+                    f"SELECT row, path, position, text FROM chunks WHERE row IN ({','.join('?' * len(rows))})", rows
+                )
+            }
+        return [
+            {"path": chunks[row][1], "position": chunks[row][2], "score": round(float(scores[row]), 4), "text": chunks[row][3]}
+            for row in rows
+            if row in chunks
+        ]
+
+
+def get_knowledge_index() -> KnowledgeIndex:
+    """Returns the process-wide index of the knowledge directory, synced when stale"""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = KnowledgeIndex()
+    _index.ensure_fresh()
+    return _index
@@ -0,0 +1,173 @@
+import json
+import os
+from typing import Any, Dict, List, Optional, Union
+
+from crewai import LLM
+
+from .rate_limit import TokenBucketLimiter
+from .sqlite_cache import SQLiteCache
+from .streaming import emit_cached_response, stream_call
+from .tracing import UsageRecorder, llm_span
+from .tools.disk_cache import CACHE_ROOT, sha256_hex
+
+# off: no caching, record: read-through cache, replay: cache only, fail on a miss
+LLM_CACHE_MODES = ("off", "record", "replay")
+
+
+class CacheMissError(RuntimeError):
+    """Raised in replay mode when a prompt has no recorded response."""
+
+
+class LLMResponseCache:
+    """
+    Record/replay store of LLM responses.
+
+    Responses are keyed on the model, the rendered messages, the tool schemas
+    and the sampling parameters, so any change to a prompt or agent
+    configuration results in a new entry.
+    """
+
+    def __init__(
+        self,
+        mode: str = "record",
+        path: Optional[str] = None,
+        ttl_seconds: float = 7 * 24 * 3600,
+        max_bytes: int = 512 * 1024 * 1024,
+    ):
+        if mode not in LLM_CACHE_MODES:
+            raise ValueError(f"Unknown LLM cache mode '{mode}', expected one of {LLM_CACHE_MODES}")
+        self.mode = mode
+        self.store = SQLiteCache(
+            path or os.path.join(CACHE_ROOT, "llm_cache.sqlite"),
+            table="llm_responses",
+            ttl_seconds=ttl_seconds,
+            max_bytes=max_bytes,
+        )
+
+    @classmethod
+    def from_env(cls) -> Optional["LLMResponseCache"]:
+        """
+        Creates the cache from RESUME_LLM_CACHE (off/record/replay),
+        RESUME_LLM_CACHE_TTL_HOURS and RESUME_LLM_CACHE_MAX_MB.
+        Returns None when caching is off.
+        """
+        mode = os.environ.get("RESUME_LLM_CACHE", "off")
+        if mode == "off":
+            return None
+        return cls(
+            mode=mode,
+            ttl_seconds=float(os.environ.get("RESUME_LLM_CACHE_TTL_HOURS", "168")) * 3600,
+            max_bytes=int(os.environ.get("RESUME_LLM_CACHE_MAX_MB", "512")) * 1024 * 1024,
+        )
+
+    @staticmethod
+    def key(
+        model: str,
+        messages: Union[str, List[Dict[str, Any]]],
+        tools: Optional[List[dict]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Returns the cache key of a call"""
+        payload = json.dumps(
+            {"model": model, "messages": messages, "tools": tools, "params": params},
+            sort_keys=True,
+            default=str,
+        )
+        return sha256_hex(payload.encode("utf-8"))
+
+    def get(self, key: str) -> Optional[str]:
+        """Returns the recorded response, or None"""
+        value = self.store.get(key)
+        return value.decode("utf-8") if value is not None else None
+
+    def put(self, key: str, response: str):
+        """Records a response"""
+        if self.mode == "record":
+            self.store.put(key, response.encode("utf-8"))
+
+    def stats(self) -> Dict[str, int]:
+        """Returns hit/miss counters"""
+        return self.store.stats()
+
+
+class CachedLLM(LLM):
+    """
+    crewai LLM that answers repeated prompts from an LLMResponseCache and
+    paces the calls that reach the provider through a shared rate limiter.
+
+    Only plain text responses are recorded; calls that execute a native
+    tool function return other types and always go to the provider. Every
+    call is wrapped in an ``llm.call`` span when tracing is active. With
+    ``stream=True``, cached responses are published as one stream chunk.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        response_cache: Optional[LLMResponseCache] = None,
+        rate_limiter: Optional[TokenBucketLimiter] = None,
+        **kwargs,
+    ):
+        super().__init__(model=model, **kwargs)
+        self.response_cache = response_cache
+        self.rate_limiter = rate_limiter
+
+    def _cache_params(self) -> Dict[str, Any]:
+        response_format = self.response_format
+        if response_format is not None and hasattr(response_format, "model_json_schema"):
+            response_format = response_format.model_json_schema()
+        return {
+            "temperature": self.temperature,
+            "top_p": self.top_p,
+            "stop": self.stop,
+            "max_tokens": self.max_tokens,
+            "max_completion_tokens": self.max_completion_tokens,
+            "seed": self.seed,
+            "response_format": response_format,
+            "reasoning_effort": self.reasoning_effort,
+        }
+
+    def call(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+        from_task: Optional[Any] = None,
+        from_agent: Optional[Any] = None,
+    ) -> Union[str, Any]:
+        with llm_span(self.model, messages, task=from_task) as span, stream_call(from_task):
+            key = None
+            if self.response_cache is not None:
+                key = self.response_cache.key(self.model, messages, tools, self._cache_params())
+                cached = self.response_cache.get(key)
+                if cached is not None:
+                    if span is not None:
+                        span.set("cache.hit", True)
+                        span.set("bytes.out", len(cached.encode("utf-8")))
+                    if self.stream:
+                        emit_cached_response(self, cached, task=from_task, agent=from_agent)
+                    return cached
+                if self.response_cache.mode == "replay":
+                    raise CacheMissError(
+                        f"No recorded response for {self.model} (key {key[:12]}) in replay mode"
+                    )
+
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(self.model)
+
+            if span is not None:
+                callbacks = [*(callbacks or []), UsageRecorder(span)]
+            response = super().call(
+                messages,
+                tools=tools,
+                callbacks=callbacks,
+                available_functions=available_functions,
+                from_task=from_task,
+                from_agent=from_agent,
+            )
+            if span is not None:
+                span.set("bytes.out", len(str(response).encode("utf-8")))
+            if key is not None and isinstance(response, str) and response:
+                self.response_cache.put(key, response)
+            return response
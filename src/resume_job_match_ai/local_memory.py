@@ -0,0 +1,189 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from crewai.memory import EntityMemory, LongTermMemory, ShortTermMemory
+from crewai.memory.storage.interface import Storage
+from crewai.memory.storage.ltm_sqlite_storage import LTMSQLiteStorage
+
+from .scoring import EMBEDDING_DIM, embed
+from .tools.disk_cache import CACHE_ROOT
+
+# local: SQLite and hashed vectors on disk, crewai: crewai's embedder and
+# vector store, off: no crew memory
+MEMORY_BACKENDS = ("local", "crewai", "off")
+DEFAULT_MEMORY_DIR = os.path.join(CACHE_ROOT, "memory")
+
+
+def memory_backend() -> str:
+    """Returns the memory backend selected by RESUME_MEMORY_BACKEND (default ``local``)"""
+    backend = os.environ.get("RESUME_MEMORY_BACKEND", "local")
+    if backend not in MEMORY_BACKENDS:
+        raise ValueError(f"Unknown memory backend '{backend}', expected one of {MEMORY_BACKENDS}")
+    return backend
+
+
+class LocalRAGStorage(Storage):
+    """
+    crewai memory storage in SQLite with vectors in a memory-mapped ring.
+
+    The texts and metadata are rows of a SQLite table and the embeddings
+    are rows of a float32 matrix memory-mapped from disk. The n-th item
+    goes into slot ``n % capacity``, overwriting the oldest one, so the
+    store never holds more than ``capacity`` items. A search is one
+    matrix-vector product over the filled slots. Several processes can
+    share the files: slots are assigned inside a SQLite write transaction.
+    """
+
+    def __init__(
+        self,
+        type: str,
+        directory: str = DEFAULT_MEMORY_DIR,
+        capacity: int = 2048,
+        dim: int = EMBEDDING_DIM,
+    ):
+        if not type.isidentifier():
+            raise ValueError(f"Invalid memory type: {type}")
+        self.type = type
+        self.capacity = capacity
+        self.dim = dim
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+        self._connection = sqlite3.connect(
+            os.path.join(directory, "memory.sqlite"), timeout=30, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        # Memory can be rebuilt, so commits skip the fsync
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {type} ("
+            "slot INTEGER PRIMARY KEY, seq INTEGER NOT NULL, text TEXT NOT NULL, "
+            "metadata TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+        self._connection.execute(f"CREATE INDEX IF NOT EXISTS {type}_seq ON {type} (seq)")
+
+        # The width is part of the file name; a capacity change shows in the size
+        path = os.path.join(directory, f"{type}-{dim}.f32")
+        size = capacity * dim * 4
+        fresh = not os.path.exists(path) or os.path.getsize(path) != size
+        if fresh:
+            with self._lock:
+                self._connection.execute(f"DELETE FROM {type}")
+        self._vectors = np.memmap(path, dtype=np.float32, mode="w+" if fresh else "r+", shape=(capacity, dim))
+
+    def save(self, value: Any, metadata: Dict[str, Any]) -> None:
+        text = str(value)
+        vector = embed(text, self.dim)
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                seq = self._connection.execute(f"SELECT COALESCE(MAX(seq) + 1, 0) FROM {self.type}").fetchone()[0]
+                slot = seq % self.capacity
+                self._vectors[slot] = vector
+                self._connection.execute(
+                    f"INSERT OR REPLACE INTO {self.type} (slot, seq, text, metadata, created_at) VALUES (?, ?, ?, ?, ?)",
+                    (slot, seq, text, json.dumps(metadata or {}, default=str), time.time()),
+                )
+                self._connection.execute("COMMIT")
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+
+    def search(self, query: str, limit: int = 3, score_threshold: float = 0.35) -> List[Dict[str, Any]]:
+        """
+        Returns up to ``limit`` items with a cosine similarity of at least
+        ``score_threshold``, best first, shaped like crewai's RAG results.
+        """
+        with self._lock:
+            # Slots fill in order until the ring wraps around
+            next_seq = self._connection.execute(f"SELECT COALESCE(MAX(seq) + 1, 0) FROM {self.type}").fetchone()[0]
+            filled = min(next_seq, self.capacity)
+            if not filled:
+                return []
+            scores = self._vectors[:filled] @ embed(query, self.dim)
+            count = min(limit, filled)
+            top = np.argpartition(-scores, count - 1)[:count]
+            top = top[np.argsort(-scores[top])]
+            slots = [int(slot) for slot in top if scores[slot] >= score_threshold]
+            if not slots:
+                return []
+            rows = self._connection.execute(
+                f"SELECT slot, seq, text, metadata FROM {self.type} WHERE slot IN ({','.join('?' * len(slots))})",
+                slots,
+            ).fetchall()
+        by_slot = {row[0]: row for row in rows}
+        return [
+            {
+                "id": str(by_slot[slot][1]),
+                "metadata": json.loads(by_slot[slot][3]),
+                "context": by_slot[slot][2],
+                "score": round(float(scores[slot]), 4),
+            }
+            for slot in slots
+            if slot in by_slot
+        ]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._connection.execute(f"DELETE FROM {self.type}")
+            self._vectors[:] = 0
+            self._vectors.flush()
+
+    def count(self) -> int:
+        """Returns the number of stored items"""
+        # Not __len__: crewai falls back to its own storage when a store is falsy
+        with self._lock:
+            return self._connection.execute(f"SELECT COUNT(*) FROM {self.type}").fetchone()[0]
+
+
+class BoundedLTMStorage(LTMSQLiteStorage):
+    """
+    crewai's long-term memory table, indexed by task description and
+    pruned to the newest ``max_rows`` rows on every save.
+    """
+
+    def __init__(self, db_path: str, max_rows: int = 5000):
+        self.max_rows = max_rows
+        super().__init__(db_path=db_path)
+
+    def _initialize_db(self):
+        super()._initialize_db()
+        with sqlite3.connect(self.db_path) as connection:
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS long_term_memories_task ON long_term_memories (task_description)"
+            )
+
+    def save(self, task_description: str, metadata: Dict[str, Any], datetime: str, score: Any) -> None:
+        super().save(task_description, metadata, datetime, score)
+        with sqlite3.connect(self.db_path) as connection:
+            connection.execute(
+                "DELETE FROM long_term_memories WHERE id <= "
+                "(SELECT COALESCE(MAX(id), 0) - ? FROM long_term_memories)",
+                (self.max_rows,),
+            )
+
+
+def build_local_memories(directory: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Creates the crew's short-term, long-term and entity memory on the
+    local backend, as keyword arguments for Crew. RESUME_MEMORY_DIR,
+    RESUME_MEMORY_CAPACITY (items per store) and RESUME_MEMORY_LTM_ROWS
+    bound where and how much is kept.
+    """
+    directory = directory or os.environ.get("RESUME_MEMORY_DIR", DEFAULT_MEMORY_DIR)
+    capacity = int(os.environ.get("RESUME_MEMORY_CAPACITY", "2048"))
+    return {
+        "short_term_memory": ShortTermMemory(storage=LocalRAGStorage("short_term", directory, capacity)),
+        "entity_memory": EntityMemory(storage=LocalRAGStorage("entities", directory, capacity)),
+        "long_term_memory": LongTermMemory(
+            storage=BoundedLTMStorage(
+                os.path.join(directory, "long_term_memory.sqlite"),
+                max_rows=int(os.environ.get("RESUME_MEMORY_LTM_ROWS", "5000")),
+            )
+        ),
+    }
@@ -1,12 +1,20 @@
-import asyncio
+import argparse
+import json
 import os
 import shutil
 import sys
 import traceback
 import warnings
+from typing import Optional
 
-# Import both implementations
-from .crew import ResumeJobMatchAi
+# crewai, the crew and numpy are imported by the functions that need them,
+# so validation and the other local commands start in milliseconds
+from .profiling import PROFILE_MODES, enable_profiling, profile_stage
+from .streaming import print_stream_summary
+from .tools.file_tools import read_job_description
+from .tools.pdf_renderer import renderer_stats
+from .tools.pdf_tools import extract_resume_text, get_extraction_cache, get_render_cache
+from .tracing import print_trace_summary
 
 warnings.filterwarnings(
     "ignore",
@@ -15,19 +23,27 @@ warnings.filterwarnings(
     message="There is no current event loop",
 )
 
-# Fix for Windows
-if sys.platform.startswith("win"):
-    asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
-
-# Create event loop if none exists
-try:
-    asyncio.get_running_loop()
-except RuntimeError:
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-
 OUTPUT_DIR = "output"
 INPUT_DIR = "input"
+CONFIG_DIR = os.path.join(os.path.dirname(__file__), "config")
+# Inputs build_inputs passes to the crew, and so the placeholders tasks may use
+INPUT_KEYS = ("resume", "jd", "match_prescreen", "candidate_profile", "resume_details", "job_requirements")
+
+
+def ensure_event_loop():
+    """Create the event loop crewai expects, once a crew is about to run"""
+    import asyncio
+
+    # Fix for Windows
+    if sys.platform.startswith("win"):
+        asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+
+    # Create event loop if none exists
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
 
 
 def setup_directories():
@@ -88,9 +104,125 @@ def verify_input_files(resume_path: str, jd_path: str):
     return True
 
 
-def run_with_debugging():
+def validate_config() -> list:
+    """
+    Check the agent and task YAML without building the crew.
+
+    Returns:
+        list: Problems found, empty when the configuration is usable.
+    """
+    import re
+
+    import yaml
+
+    issues = []
+    try:
+        with open(os.path.join(CONFIG_DIR, "agents.yaml"), encoding="utf-8") as file:
+            agents = yaml.safe_load(file) or {}
+        with open(os.path.join(CONFIG_DIR, "tasks.yaml"), encoding="utf-8") as file:
+            tasks = yaml.safe_load(file) or {}
+    except (OSError, yaml.YAMLError) as e:
+        return [f"Cannot read configuration: {e}"]
+
+    for name, task in tasks.items():
+        if task.get("agent") not in agents:
+            issues.append(f"Task {name} uses unknown agent: {task.get('agent')}")
+        for upstream in task.get("context") or []:
+            if upstream not in tasks:
+                issues.append(f"Task {name} has unknown context task: {upstream}")
+        text = f"{task.get('description', '')} {task.get('expected_output', '')}"
+        for placeholder in sorted(set(re.findall(r"\{([A-Za-z_][A-Za-z0-9_]*)\}", text))):
+            if placeholder not in INPUT_KEYS:
+                issues.append(f"Task {name} expects an input build_inputs does not provide: {placeholder}")
+    return issues
+
+
+def validate_inputs(resume_path: str, jd_path: str) -> bool:
+    """
+    Validate-only mode: check the input files and the configuration the way
+    a run would, without importing crewai or calling any LLM.
+    """
+    import time
+
+    start = time.perf_counter()
+    ok = verify_input_files(resume_path, jd_path)
+    issues = []
+    if ok:
+        with open(resume_path, "rb") as file:
+            if not file.read(5).startswith(b"%PDF-"):
+                issues.append(f"Resume is not a valid PDF: {resume_path}")
+        try:
+            if not read_job_description(jd_path).strip():
+                issues.append(f"Job description is empty: {jd_path}")
+        except UnicodeDecodeError:
+            issues.append(f"Job description is not UTF-8 text: {jd_path}")
+    issues += validate_config()
+
+    for issue in issues:
+        print(f"  - {issue}")
+    ok = ok and not issues
+    status = "✅ Inputs and configuration are valid" if ok else "❌ Validation failed"
+    print(f"{status} ({(time.perf_counter() - start) * 1000:.0f} ms)")
+    return ok
+
+
+def build_inputs(resume_path: str, jd_path: str) -> dict:
+    """
+    Build the crew kickoff inputs for a resume/job description pair.
+
+    Everything that can be computed locally is computed here, once: the
+    match pre-screen, the structured candidate profile and job
+    requirements (compact JSON) and the resume sections the profile does
+    not cover. The tasks use these instead of the raw text; the extract
+    tools remain as a fallback for when local parsing fails.
+    """
+    from .models import parse_job_description, parse_resume, resume_details
+
+    inputs = {
+        "resume": resume_path,
+        "jd": jd_path,
+        "match_prescreen": "- Local match score: unavailable",
+        "candidate_profile": "{}",
+        "resume_details": "",
+        "job_requirements": "{}",
+    }
+    try:
+        resume_text = extract_resume_text(resume_path)
+        jd_text = read_job_description(jd_path)
+    except Exception as e:
+        print(f"⚠️ Local pre-processing unavailable: {e}")
+        return inputs
+
+    inputs["match_prescreen"] = prescreen_pair(resume_text, jd_text)
+    inputs["candidate_profile"] = parse_resume(resume_text).to_json()
+    inputs["resume_details"] = resume_details(resume_text)
+    inputs["job_requirements"] = parse_job_description(jd_text).to_json()
+    print(
+        f"🧾 Parsed profile ({len(inputs['candidate_profile']) + len(inputs['resume_details'])} chars) and requirements "
+        f"({len(inputs['job_requirements'])} chars) from {len(resume_text) + len(jd_text)} chars of text"
+    )
+    return inputs
+
+
+def prescreen_pair(resume_text: str, jd_text: str) -> str:
+    """
+    Score the pair locally so the matchmaker starts from a deterministic baseline.
+    Returns the markdown breakdown passed into the job_matching_task context.
+    """
+    from .scoring import score_match
+
+    match = score_match(resume_text, jd_text)
+    print(f"🧮 Local match score: {match.score:.0f}/100 ({match.elapsed_ms:.1f} ms)")
+    return match.to_markdown()
+
+
+def run_with_debugging(streaming: Optional[bool] = None):
     """
     Run the crew with enhanced debugging and fallback options
+
+    Args:
+        streaming (bool): Stream agent output into the reports while it is
+            generated; None defers to RESUME_STREAMING.
     """
     print("🚀 Starting Resume Job Match AI with debugging...")
     print("=" * 60)
@@ -104,7 +236,9 @@ def run_with_debugging():
     jd_path = "./input/jd.txt"
 
     # Verify input files
-    if not verify_input_files(resume_path, jd_path):
+    with profile_stage("verify_inputs"):
+        inputs_ok = verify_input_files(resume_path, jd_path)
+    if not inputs_ok:
         print("\n💡 Please ensure you have:")
         print("  1. A PDF resume file at: ./input/cv.pdf")
         print("  2. A job description text file at: ./input/jd.txt")
@@ -114,22 +248,30 @@ def run_with_debugging():
     print("\n🤖 STEP 3: Running CrewAI approach...")
     print("-" * 40)
     try:
-        inputs = {
-            "resume": resume_path,
-            "jd": jd_path,
-        }
+        with profile_stage("build_inputs"):
+            inputs = build_inputs(resume_path, jd_path)
 
         print(f"📋 Inputs: {inputs}")
 
         # Initialize and run crew
-        crew_instance = ResumeJobMatchAi()
-        result = crew_instance.crew().kickoff(inputs=inputs)
+        with profile_stage("crew_setup"):
+            from .crew import ResumeJobMatchAi
+
+            ensure_event_loop()
+            crew_instance = ResumeJobMatchAi(output_dir=OUTPUT_DIR, streaming=streaming)
+            crew = crew_instance.crew()
+        with profile_stage("crew_kickoff"):
+            result = crew.kickoff(inputs=inputs)
 
         print("✅ CrewAI execution completed")
         print(f"📄 Result: {result}")
 
         # Check outputs
-        check_outputs()
+        with profile_stage("check_outputs"):
+            check_outputs()
+        report_cache_stats(crew_instance)
+        report_trace(crew_instance, crew)
+        report_streaming(crew_instance)
 
         return True
 
@@ -198,12 +340,363 @@ def check_outputs():
         return False
 
 
+def report_cache_stats(crew_instance=None):
+    """Report hit/miss counters of the on-disk caches"""
+    cache = get_extraction_cache()
+    if cache is not None:
+        stats = cache.stats()
+        print(
+            f"♻️ Extraction cache: {stats['hits']} hits, {stats['misses']} misses, "
+            f"{stats['evictions']} evictions"
+        )
+
+    cache = get_render_cache()
+    if cache is not None:
+        stats = cache.stats()
+        print(f"♻️ Render cache: {stats['hits']} hits, {stats['misses']} misses")
+
+    if crew_instance is not None and crew_instance.llm_cache is not None:
+        stats = crew_instance.llm_cache.stats()
+        print(
+            f"♻️ LLM cache ({crew_instance.llm_cache.mode}): {stats['hits']} hits, "
+            f"{stats['misses']} misses, {stats['entries']} entries"
+        )
+
+    if crew_instance is not None and crew_instance.checkpoints is not None:
+        stats = crew_instance.checkpoints.stats()
+        print(
+            f"♻️ Task checkpoints: {len(stats['restored'])} restored, {len(stats['executed'])} executed"
+            + (f" ({', '.join(stats['executed'])})" if stats["executed"] else "")
+        )
+
+    if crew_instance is not None and crew_instance.rate_limiter is not None:
+        stats = crew_instance.rate_limiter.stats()
+        print(
+            f"⏳ Rate limiter: {stats['requests']} provider requests, "
+            f"{stats['total_wait_seconds']:.1f}s spent waiting"
+        )
+
+    stats = renderer_stats()
+    if stats is not None and stats["renders"]:
+        print(
+            f"🖨️ PDF renderer ({stats['backend']}): {stats['renders']} renders, "
+            f"{stats['mean_seconds']:.2f}s mean"
+        )
+
+
+def report_trace(crew_instance, crew):
+    """Print the per-task span summary and the critical path of the run"""
+    if crew_instance.tracer is None:
+        return
+    from .scheduler import build_task_graph
+
+    # Sequential runs chain every task, DAG runs follow the context dependencies
+    graph = build_task_graph(crew.tasks) if crew_instance.execution_mode == "dag" else None
+    print_trace_summary(crew_instance.tracer, graph)
+
+
+def report_streaming(crew_instance):
+    """Print and save time to first token and first answer byte per task"""
+    if crew_instance.streamer is None:
+        return
+    print_stream_summary(crew_instance.streamer)
+    timings_path = os.path.join(crew_instance.output_dir, "stream_timings.json")
+    with open(timings_path, "w", encoding="utf-8") as file:
+        json.dump(crew_instance.streamer.timings(), file, indent=2)
+    print(f"📄 Stream timings written to: {timings_path}")
+
+
+def prescreen():
+    """
+    Pre-screen entry point - scores a resume against job descriptions without any LLM call
+
+    Usage: prescreen <resume.pdf> <jd.txt> [<jd.txt> ...] [--min-score N] [--json]
+    """
+    from .scoring import rank_job_descriptions
+
+    parser = argparse.ArgumentParser(
+        description="Rank job descriptions for a resume with the local scorer"
+    )
+    parser.add_argument("resume", help="PDF resume")
+    parser.add_argument("jds", nargs="+", help="Job description text files")
+    parser.add_argument(
+        "--min-score", type=float, default=0.0, help="Hide pairs scoring below this"
+    )
+    parser.add_argument("--json", action="store_true", help="Print JSON instead of a table")
+    args = parser.parse_args()
+
+    resume_text = extract_resume_text(args.resume)
+    ranking = rank_job_descriptions(
+        resume_text, {jd_path: read_job_description(jd_path) for jd_path in args.jds}
+    )
+    ranking = [(jd_path, match) for jd_path, match in ranking if match.score >= args.min_score]
+
+    if args.json:
+        print(json.dumps([{"jd": jd_path, **match.to_dict()} for jd_path, match in ranking], indent=2))
+        return
+
+    for jd_path, match in ranking:
+        print(
+            f"{match.score:5.1f}  {jd_path}  "
+            f"(similarity {match.similarity:.2f}, skills {match.skill_coverage:.0%}, "
+            f"missing: {', '.join(match.missing_skills) or 'none'})"
+        )
+
+
+def match_jobs():
+    """
+    Retrieval entry point - finds the top-k job descriptions of a directory for a resume
+
+    Usage: match_jobs <resume.pdf> <jd_dir> [--k N] [--index PATH] [--manifest OUT.json]
+    """
+    from .jd_index import DEFAULT_INDEX_PATH, build_index
+
+    parser = argparse.ArgumentParser(
+        description="Retrieve the best matching job descriptions from an inverted index"
+    )
+    parser.add_argument("resume", help="PDF resume")
+    parser.add_argument("jd_dir", help="Directory of job description text files")
+    parser.add_argument("--k", type=int, default=10, help="Number of results")
+    parser.add_argument("--index", default=DEFAULT_INDEX_PATH, help="Index file")
+    parser.add_argument(
+        "--manifest", help="Write the results as a run_batch manifest to this file"
+    )
+    args = parser.parse_args()
+
+    index = build_index(args.jd_dir, args.index)
+    results = index.search(extract_resume_text(args.resume), k=args.k)
+
+    for rank, (doc_id, score) in enumerate(results, start=1):
+        print(f"{rank:3d}. {score:8.3f}  {doc_id}")
+
+    if args.manifest:
+        manifest = [
+            {"resume": args.resume, "jd": os.path.join(args.jd_dir, doc_id)}
+            for doc_id, _ in results
+        ]
+        with open(args.manifest, "w", encoding="utf-8") as file:
+            json.dump(manifest, file, indent=2)
+        print(f"📄 Batch manifest written to: {args.manifest}")
+
+
+def index_knowledge():
+    """
+    Knowledge entry point - builds or refreshes the embedding index of the knowledge directory
+
+    Usage: index_knowledge [--directory DIR] [--query TEXT] [--k N]
+    """
+    import time
+
+    from .knowledge_index import DEFAULT_INDEX_DIR, KNOWLEDGE_DIR, KnowledgeIndex
+
+    parser = argparse.ArgumentParser(description="Index the knowledge directory for the Knowledge Search tool")
+    parser.add_argument("--directory", default=KNOWLEDGE_DIR, help="Knowledge directory")
+    parser.add_argument("--index-dir", default=DEFAULT_INDEX_DIR, help="Where the index is kept")
+    parser.add_argument("--query", help="Look up this text after indexing")
+    parser.add_argument("--k", type=int, default=4, help="Number of results for --query")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    index = KnowledgeIndex(args.directory, args.index_dir)
+    stats = index.sync()
+    print(
+        f"📚 Knowledge index: {len(index)} chunks from {stats['added'] + stats['updated'] + stats['unchanged']} files "
+        f"({stats['added']} added, {stats['updated']} updated, {stats['removed']} removed) "
+        f"in {time.perf_counter() - start:.2f}s"
+    )
+
+    if args.query:
+        start = time.perf_counter()
+        hits = index.search(args.query, k=args.k)
+        print(f"🔎 {len(hits)} results in {(time.perf_counter() - start) * 1000:.2f} ms")
+        for rank, hit in enumerate(hits, start=1):
+            preview = " ".join(hit["text"].split())[:100]
+            print(f"{rank:3d}. {hit['score']:.3f}  {hit['path']}#{hit['position']}  {preview}")
+
+
+def render_resumes():
+    """
+    Bulk render entry point - converts many markdown resumes to PDFs in one renderer session
+
+    Usage: render_resumes <resume.md> [<resume.md> ...] [--output-dir DIR]
+    """
+    from .tools.pdf_tools import save_resumes_as_pdf
+
+    parser = argparse.ArgumentParser(description="Render markdown resumes to PDF in bulk")
+    parser.add_argument("resumes", nargs="+", help="Markdown resume files")
+    parser.add_argument("--output-dir", default=OUTPUT_DIR, help="Directory for the PDFs")
+    args = parser.parse_args()
+
+    documents = {}
+    for path in args.resumes:
+        name = os.path.splitext(os.path.basename(path))[0]
+        if name in documents:
+            raise SystemExit(f"❌ Duplicate resume name: {name}")
+        with open(path, encoding="utf-8") as file:
+            documents[name] = file.read()
+
+    save_resumes_as_pdf(documents, args.output_dir)
+
+
+def run_batch():
+    """
+    Batch entry point - runs every resume/JD pair of a manifest on a worker pool
+
+    Usage: run_batch <manifest.json|manifest.csv> [--workers N] [--output-root DIR]
+    """
+    from .batch import BATCH_OUTPUT_ROOT
+    from .batch import run_batch as run_manifest
+
+    parser = argparse.ArgumentParser(
+        description="Run many resume/JD pairs through the crew"
+    )
+    parser.add_argument("manifest", help="JSON or CSV file with resume and jd columns")
+    parser.add_argument("--workers", type=int, default=2, help="Concurrent jobs")
+    parser.add_argument(
+        "--output-root",
+        default=BATCH_OUTPUT_ROOT,
+        help="Directory holding one output workspace per job",
+    )
+    args = parser.parse_args()
+
+    try:
+        summary = run_manifest(args.manifest, workers=args.workers, output_root=args.output_root)
+    except KeyboardInterrupt:
+        print("\n⚠️ Operation cancelled by user")
+        sys.exit(130)
+    if summary["failed"]:
+        sys.exit(1)
+
+
+def serve():
+    """
+    Service entry point - accepts resume/JD uploads over HTTP and runs them on a worker pool
+
+    Usage: serve [--host HOST] [--port N] [--workers N] [--queue-size N] [--output-root DIR]
+    """
+    from .service import SERVICE_OUTPUT_ROOT
+    from .service import serve as serve_jobs
+
+    parser = argparse.ArgumentParser(description="Run the crew as a local HTTP job service")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on")
+    parser.add_argument("--port", type=int, default=8000, help="Port to listen on")
+    parser.add_argument("--workers", type=int, default=2, help="Concurrent crew runs")
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=8,
+        help="Jobs that may wait for a worker before uploads are rejected with 429",
+    )
+    parser.add_argument(
+        "--output-root",
+        default=SERVICE_OUTPUT_ROOT,
+        help="Directory holding one workspace per job",
+    )
+    args = parser.parse_args()
+
+    serve_jobs(args.host, args.port, args.workers, args.queue_size, args.output_root)
+
+
+def crew_daemon():
+    """
+    Daemon entry point - keeps a warm crew and runs jobs sent over a Unix socket
+
+    Usage: crew_daemon [--socket PATH] [--output-root DIR]
+    """
+    from .daemon import DAEMON_OUTPUT_ROOT, DEFAULT_SOCKET_PATH, serve_daemon
+
+    parser = argparse.ArgumentParser(description="Serve crew runs from a warm process")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET_PATH, help="Unix socket to listen on")
+    parser.add_argument(
+        "--output-root",
+        default=DAEMON_OUTPUT_ROOT,
+        help="Directory holding one output directory per job",
+    )
+    args = parser.parse_args()
+
+    serve_daemon(args.socket, args.output_root)
+
+
+def crew_submit():
+    """
+    Daemon client entry point - runs a resume/JD pair on the warm crew daemon
+
+    Usage: crew_submit <resume.pdf> <jd.txt> [--output-dir DIR] [--socket PATH] [--status] [--stop]
+    """
+    import time
+
+    from .daemon import DEFAULT_SOCKET_PATH, request_daemon, submit_job
+
+    parser = argparse.ArgumentParser(description="Run a resume/JD pair on the crew daemon")
+    parser.add_argument("resume", nargs="?", help="PDF resume")
+    parser.add_argument("jd", nargs="?", help="Job description text file")
+    parser.add_argument("--output-dir", help="Output directory (inside the daemon's working directory)")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET_PATH, help="Unix socket of the daemon")
+    parser.add_argument("--status", action="store_true", help="Show the daemon's start-up timings")
+    parser.add_argument("--stop", action="store_true", help="Stop the daemon")
+    args = parser.parse_args()
+
+    try:
+        if args.status or args.stop:
+            command = "stop" if args.stop else "status"
+            print(json.dumps(request_daemon({"command": command}, args.socket), indent=2))
+            return
+        if not (args.resume and args.jd):
+            parser.error("resume and jd are required to submit a job")
+        start = time.perf_counter()
+        result = submit_job(args.resume, args.jd, args.output_dir, args.socket)
+    except ConnectionError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    total = time.perf_counter() - start
+    if result["success"]:
+        print(f"✅ Job {result['job_id']} finished in {total:.1f}s: {result['output_dir']}")
+    else:
+        print(f"❌ Job failed: {result['error']}")
+    if "setup_seconds" in result:
+        print(
+            f"⚡ Warm start: crew built in {result['setup_seconds']:.2f}s "
+            f"(cold start: {result['cold_start_seconds']:.2f}s, of which "
+            f"{result['crew_build_seconds']:.2f}s renderer and crew build)"
+        )
+    if not result["success"]:
+        sys.exit(1)
+
+
 def run():
     """
     Main entry point - runs with debugging and fallbacks
+
+    Usage: run_crew [--profile [cpu|memory|all]] [--stream] [--validate-only]
     """
+    parser = argparse.ArgumentParser(description="Tailor ./input/cv.pdf to ./input/jd.txt")
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="all",
+        choices=PROFILE_MODES,
+        help="Write cProfile/tracemalloc reports per stage and tool to output/profile",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        default=None,
+        help="Write agent output into the reports while it is generated",
+    )
+    parser.add_argument(
+        "--validate-only",
+        action="store_true",
+        help="Check the input files and configuration, then exit without running the crew",
+    )
+    args = parser.parse_args()
+    if args.validate_only:
+        sys.exit(0 if validate_inputs("./input/cv.pdf", "./input/jd.txt") else 1)
+    if args.profile is not None:
+        enable_profiling(args.profile)
+
     try:
-        success = run_with_debugging()
+        success = run_with_debugging(streaming=args.stream)
         if success:
             print("\n🎉 MISSION ACCOMPLISHED!")
         else:
@@ -211,7 +704,7 @@ def run():
 
             # Provide troubleshooting tips
             print("\n🔧 TROUBLESHOOTING TIPS:")
-            print("1. Ensure wkhtmltopdf is installed and in PATH")
+            print("1. Ensure wkhtmltopdf (or WKHTMLTOPDF_PATH) or WeasyPrint is available")
             print("2. Check that input files exist and are readable")
             print("3. Verify CrewAI and dependencies are properly installed")
             print("4. Try running the explicit pipeline separately")
@@ -224,6 +717,57 @@ def run():
         traceback.print_exc()
 
 
+def train():
+    """
+    Train the crew for a given number of iterations.
+
+    Usage: train <n_iterations> <filename>
+    """
+    from .crew import ResumeJobMatchAi
+
+    ensure_event_loop()
+    inputs = build_inputs("./input/cv.pdf", "./input/jd.txt")
+    try:
+        ResumeJobMatchAi(output_dir=OUTPUT_DIR).crew().train(
+            n_iterations=int(sys.argv[1]), filename=sys.argv[2], inputs=inputs
+        )
+    except Exception as e:
+        raise Exception(f"An error occurred while training the crew: {e}")
+
+
+def replay():
+    """
+    Replay the crew execution from a specific task.
+
+    Usage: replay <task_id>
+    """
+    from .crew import ResumeJobMatchAi
+
+    ensure_event_loop()
+    try:
+        ResumeJobMatchAi(output_dir=OUTPUT_DIR).crew().replay(task_id=sys.argv[1])
+    except Exception as e:
+        raise Exception(f"An error occurred while replaying the crew: {e}")
+
+
+def test():
+    """
+    Test the crew execution and return the results.
+
+    Usage: test <n_iterations> <eval_llm>
+    """
+    from .crew import ResumeJobMatchAi
+
+    ensure_event_loop()
+    inputs = build_inputs("./input/cv.pdf", "./input/jd.txt")
+    try:
+        ResumeJobMatchAi(output_dir=OUTPUT_DIR).crew().test(
+            n_iterations=int(sys.argv[1]), eval_llm=sys.argv[2], inputs=inputs
+        )
+    except Exception as e:
+        raise Exception(f"An error occurred while testing the crew: {e}")
+
+
 # import asyncio
 # import os
 # import shutil
@@ -0,0 +1,329 @@
+import json
+import re
+import time
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, List, Optional, Tuple
+
+from .preprocess import normalize_whitespace, select_sections, split_sections
+from .scoring import extract_skills
+
+# Caps that keep the serialized profile small
+MAX_ROLES = 8
+MAX_HIGHLIGHTS = 3
+MAX_SKILLS = 40
+MAX_RESPONSIBILITIES = 8
+MAX_LIST_ITEMS = 10
+MAX_TEXT = 300
+
+EMAIL_PATTERN = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+PHONE_PATTERN = re.compile(r"\+?\d[\d ()./-]{7,}\d")
+LINK_PATTERN = re.compile(r"(?:https?://)?(?:www\.)?(?:linkedin\.com|github\.com|gitlab\.com)/[\w./-]+", re.IGNORECASE)
+YEAR_PATTERN = re.compile(r"\b(?:19|20)\d{2}\b")
+DOCUMENT_TITLE_PATTERN = re.compile(r"\b(?:resume|résumé|curriculum vitae|cv)\b", re.IGNORECASE)
+PRESENT_PATTERN = re.compile(r"\b(?:present|current|now|today)\b", re.IGNORECASE)
+BULLET_PATTERN = re.compile(r"^\s*(?:[-*•–▪◦]|\d+[.)])\s+")
+ROLE_SEPARATORS = re.compile(r"\s+(?:-|–|—|\||@|at)\s+|,\s+")
+DEGREE_PATTERN = re.compile(
+    r"\b(?:b\.?sc|m\.?sc|b\.?a|m\.?a|b\.?eng|m\.?eng|b\.?tech|m\.?tech|ph\.?d|mba|bachelor|master|doctor|associate|diploma|degree)\b",
+    re.IGNORECASE,
+)
+YEARS_REQUIRED_PATTERN = re.compile(r"(\d{1,2})\s*\+?\s*(?:years|yrs)", re.IGNORECASE)
+
+# Resume sections that CandidateProfile covers; resume_details passes on the rest
+PROFILE_SECTIONS = frozenset(
+    {"header", "contact", "summary", "experience", "education", "skills", "certifications", "references", "confirmation"}
+)
+
+# Job description headings, matched at the start of a short line
+JD_SECTION_PATTERNS = {
+    "required": re.compile(r"^(?:requirements|required|qualifications|must have|what you need|what we're looking for|you have|minimum qualifications)\b", re.IGNORECASE),
+    "preferred": re.compile(r"^(?:nice to have|preferred|bonus|good to have|pluses|preferred qualifications)\b", re.IGNORECASE),
+    "responsibilities": re.compile(r"^(?:responsibilities|what you'll do|what you will do|about the role|the role|your role|duties)\b", re.IGNORECASE),
+}
+
+
+def _compact(value: Any) -> Any:
+    """Drops empty fields recursively so the JSON only carries what was found"""
+    if hasattr(value, "__dataclass_fields__"):
+        return {
+            item.name: _compact(getattr(value, item.name))
+            for item in fields(value)
+            if getattr(value, item.name) not in (None, "", [], {})
+        }
+    if isinstance(value, list):
+        return [_compact(item) for item in value]
+    return value
+
+
+class _Serializable:
+    __slots__ = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the non-empty fields as plain dicts and lists"""
+        return _compact(self)
+
+    def to_json(self) -> str:
+        """Returns the compact JSON form passed to the agents"""
+        return json.dumps(self.to_dict(), ensure_ascii=False, separators=(",", ":"))
+
+
+@dataclass(slots=True)
+class Role(_Serializable):
+    """One position from the experience section. An end of None means current."""
+
+    title: str
+    company: str = ""
+    start: Optional[int] = None
+    end: Optional[int] = None
+    highlights: List[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class Education(_Serializable):
+    """One degree or diploma."""
+
+    degree: str
+    institution: str = ""
+    year: Optional[int] = None
+
+
+@dataclass(slots=True)
+class CandidateProfile(_Serializable):
+    """Locally parsed facts about a candidate."""
+
+    name: str = ""
+    headline: str = ""
+    email: str = ""
+    phone: str = ""
+    links: List[str] = field(default_factory=list)
+    summary: str = ""
+    skills: List[str] = field(default_factory=list)
+    roles: List[Role] = field(default_factory=list)
+    education: List[Education] = field(default_factory=list)
+    certifications: List[str] = field(default_factory=list)
+    years_experience: Optional[float] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CandidateProfile":
+        data = dict(data)
+        data["roles"] = [Role(**role) for role in data.get("roles", [])]
+        data["education"] = [Education(**entry) for entry in data.get("education", [])]
+        return cls(**data)
+
+
+@dataclass(slots=True)
+class JobRequirements(_Serializable):
+    """Locally parsed requirements of a job description."""
+
+    title: str = ""
+    company: str = ""
+    required_skills: List[str] = field(default_factory=list)
+    preferred_skills: List[str] = field(default_factory=list)
+    min_years: Optional[int] = None
+    responsibilities: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "JobRequirements":
+        return cls(**data)
+
+
+def _clip(text: str, limit: int = MAX_TEXT) -> str:
+    text = " ".join(text.split())
+    return text if len(text) <= limit else text[: limit - 1].rstrip() + "…"
+
+
+def _lines(text: str) -> List[str]:
+    return [line.strip().lstrip("#").strip() for line in text.splitlines() if line.strip()]
+
+
+def _unbullet(line: str) -> str:
+    return BULLET_PATTERN.sub("", line).strip()
+
+
+def _year_range(line: str) -> Tuple[Optional[int], Optional[int], bool]:
+    """Returns (start, end, found) for the years mentioned in a line"""
+    years = [int(year) for year in YEAR_PATTERN.findall(line)]
+    if not years:
+        return None, None, False
+    if PRESENT_PATTERN.search(line):
+        return years[0], None, True
+    return years[0], years[-1] if len(years) > 1 else years[0], True
+
+
+def _strip_dates(line: str) -> str:
+    """Cuts a line at its first date ("Jan 2020 - Present", "(2016)")"""
+    match = re.search(r"(?:\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+)?\b(?:19|20)\d{2}\b", line, re.IGNORECASE)
+    if match:
+        line = line[: match.start()]
+    return line.strip(" -–—|,(")
+
+
+def parse_roles(text: str) -> List[Role]:
+    """
+    Parses an experience section: a line with a year that is not a bullet
+    starts a role ("Title - Company (2019 - 2022)", "Title at Company,
+    2020 - Present"), and the bullets below it are its highlights. Only
+    the first MAX_ROLES roles, the most recent in a typical resume, are kept.
+    """
+    roles: List[Role] = []
+    for line in _lines(text):
+        line = re.sub(r"\*\*|__", "", line)
+        start, end, has_years = _year_range(line)
+        if has_years and not BULLET_PATTERN.match(line):
+            if len(roles) >= MAX_ROLES:
+                break
+            parts = [part for part in ROLE_SEPARATORS.split(_strip_dates(line), maxsplit=1) if part]
+            roles.append(
+                Role(
+                    title=_clip(parts[0] if parts else line, 120),
+                    company=_clip(parts[1], 120) if len(parts) > 1 else "",
+                    start=start,
+                    end=end,
+                )
+            )
+        elif roles and BULLET_PATTERN.match(line) and len(roles[-1].highlights) < MAX_HIGHLIGHTS:
+            roles[-1].highlights.append(_clip(_unbullet(line), 200))
+    return roles
+
+
+def years_of_experience(roles: List[Role], current_year: Optional[int] = None) -> Optional[float]:
+    """Total years covered by the roles, counting overlapping roles once"""
+    current_year = current_year or time.localtime().tm_year
+    spans = sorted(
+        (role.start, role.end if role.end is not None else current_year)
+        for role in roles
+        if role.start is not None
+    )
+    if not spans:
+        return None
+    total, (span_start, span_end) = 0, spans[0]
+    for start, end in spans[1:]:
+        if start > span_end:
+            total += span_end - span_start
+            span_start, span_end = start, end
+        else:
+            span_end = max(span_end, end)
+    total += span_end - span_start
+    return float(max(total, 0))
+
+
+def parse_education(text: str) -> List[Education]:
+    """Parses degree lines ("B.Sc. Computer Science, Example University (2016)")"""
+    entries: List[Education] = []
+    for line in _lines(text):
+        line = _unbullet(line)
+        if not DEGREE_PATTERN.search(line) or len(entries) >= MAX_LIST_ITEMS:
+            continue
+        years = YEAR_PATTERN.findall(line)
+        parts = [part for part in ROLE_SEPARATORS.split(_strip_dates(line), maxsplit=1) if part]
+        entries.append(
+            Education(
+                degree=_clip(parts[0] if parts else line, 120),
+                institution=_clip(parts[1], 120) if len(parts) > 1 else "",
+                year=int(years[-1]) if years else None,
+            )
+        )
+    return entries
+
+
+def parse_resume(text: str) -> CandidateProfile:
+    """
+    Builds a CandidateProfile from extracted resume text with regular
+    expressions and the section splitter; no LLM involved. Fields that
+    cannot be found are left empty.
+    """
+    text = normalize_whitespace(text)
+    sections: Dict[str, str] = {}
+    for section in split_sections(text):
+        sections[section.category] = "\n".join(filter(None, (sections.get(section.category), section.text)))
+
+    # The name and headline are the first lines, skipping a "Resume" title line
+    header_lines = [line for line in _lines(text)[:6] if not DOCUMENT_TITLE_PATTERN.search(line)]
+    contact_text = "\n".join(header_lines + [sections.get("contact", "")])
+    name = ""
+    if header_lines and not EMAIL_PATTERN.search(header_lines[0]) and len(header_lines[0].split()) <= 5:
+        name = header_lines[0]
+    headline = ""
+    if len(header_lines) > 1:
+        candidate = header_lines[1].split("|")[0].strip()
+        if candidate and not EMAIL_PATTERN.search(candidate) and not PHONE_PATTERN.search(candidate):
+            headline = _clip(candidate, 120)
+
+    email = EMAIL_PATTERN.search(contact_text) or EMAIL_PATTERN.search(text)
+    phone = PHONE_PATTERN.search(contact_text)
+    roles = parse_roles(sections.get("experience", ""))
+
+    # Skills listed in the skills section first, then those mentioned elsewhere
+    listed = extract_skills(sections.get("skills", ""))
+    mentioned = [skill for skill in extract_skills(text) if skill not in listed]
+
+    return CandidateProfile(
+        name=name,
+        headline=headline,
+        email=email.group(0) if email else "",
+        phone=" ".join(phone.group(0).split()) if phone else "",
+        links=sorted(set(LINK_PATTERN.findall(text)))[:MAX_LIST_ITEMS],
+        summary=_clip(sections.get("summary", "")),
+        skills=(listed + mentioned)[:MAX_SKILLS],
+        roles=roles,
+        education=parse_education(sections.get("education", "")),
+        certifications=[_clip(_unbullet(line), 120) for line in _lines(sections.get("certifications", ""))][:MAX_LIST_ITEMS],
+        years_experience=years_of_experience(roles),
+    )
+
+
+def resume_details(text: str) -> str:
+    """
+    Returns the resume sections that parse_resume does not structure
+    (projects, publications, languages, volunteer work, ...), so the
+    agents get them as text next to the profile instead of the whole resume.
+    """
+    return select_sections(normalize_whitespace(text), PROFILE_SECTIONS)
+
+
+def _jd_sections(text: str) -> Dict[str, str]:
+    """Splits a job description at requirement, preference and responsibility headings"""
+    sections: Dict[str, List[str]] = {}
+    current = "intro"
+    for line in _lines(text):
+        heading = line.lstrip("#* ").rstrip(":*").strip()
+        if not BULLET_PATTERN.match(line) and len(heading) <= 40:
+            matched = next((name for name, pattern in JD_SECTION_PATTERNS.items() if pattern.match(heading)), None)
+            if matched is not None:
+                current = matched
+                continue
+        sections.setdefault(current, []).append(line)
+    return {name: "\n".join(lines) for name, lines in sections.items()}
+
+
+def parse_job_description(text: str) -> JobRequirements:
+    """
+    Builds JobRequirements from a job description: title and company from
+    the first line, known skills from the requirement and preference
+    sections, and the minimum years of experience.
+    """
+    text = normalize_whitespace(text)
+    sections = _jd_sections(text)
+    first_line = _lines(text)[0].lstrip("# ") if text.strip() else ""
+    title, _, company = first_line.partition(" at ")
+
+    preferred_text = sections.get("preferred", "")
+    required_text = sections.get("required") or "\n".join(
+        body for name, body in sections.items() if name != "preferred"
+    )
+    required = extract_skills(required_text)
+    preferred = [skill for skill in extract_skills(preferred_text) if skill not in required]
+    years = [int(match) for match in YEARS_REQUIRED_PATTERN.findall(required_text or text)]
+
+    return JobRequirements(
+        title=_clip(title, 120),
+        company=_clip(company, 120),
+        required_skills=required,
+        preferred_skills=preferred,
+        min_years=min(years) if years else None,
+        responsibilities=[
+            _clip(_unbullet(line), 200)
+            for line in _lines(sections.get("responsibilities", ""))
+            if BULLET_PATTERN.match(line)
+        ][:MAX_RESPONSIBILITIES],
+    )
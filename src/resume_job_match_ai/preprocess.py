@@ -0,0 +1,270 @@
+import math
+import re
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional, Sequence
+
+try:
+    import tiktoken
+except ImportError:  # token counts fall back to a characters/4 estimate
+    tiktoken = None
+
+# Bump when cleaning changes so cached extractions are redone
+PREPROCESS_VERSION = "2"
+
+# Lines at the top and bottom of each page that may be running headers/footers
+EDGE_LINES = 3
+
+# Separator crewai puts between upstream task outputs in a task's context
+CONTEXT_DIVIDER = "\n\n----------\n\n"
+
+# Heading texts (lowercase, without markup) that start each section category
+SECTION_ALIASES: Dict[str, Sequence[str]] = {
+    "contact": ("contact", "contact information", "contact details", "personal information", "personal details"),
+    "summary": ("summary", "professional summary", "profile", "professional profile", "objective", "career objective", "about me", "overview"),
+    "experience": ("experience", "work experience", "professional experience", "employment", "employment history", "work history", "career history"),
+    "education": ("education", "academic background", "education and training", "qualifications"),
+    "skills": ("skills", "technical skills", "key skills", "core competencies", "competencies", "technologies", "skills and tools", "frameworks and tools"),
+    "projects": ("projects", "key projects", "selected projects", "personal projects"),
+    "certifications": ("certifications", "certificates", "licenses and certifications", "accomplishments", "achievements", "awards", "honors", "awards and certifications"),
+    "publications": ("publications", "presentations", "publications and presentations", "talks"),
+    "languages": ("languages",),
+    "volunteer": ("volunteer", "volunteering", "volunteer work", "volunteer experience"),
+    "interests": ("interests", "hobbies", "hobbies and interests", "personal interests"),
+    "references": ("references",),
+    "confirmation": ("confirmation", "extraction status", "parsing status", "parsing confirmation", "confirmation message"),
+}
+
+# Sections of upstream task outputs that the agent of each task does not use.
+# Tasks not listed receive their context unchanged apart from whitespace.
+CONTEXT_DROPPED_SECTIONS: Dict[str, FrozenSet[str]] = {
+    "job_matching_task": frozenset({"contact", "volunteer", "interests", "references", "confirmation"}),
+    "resume_writer_task": frozenset({"confirmation"}),
+}
+
+_ALIAS_PATTERN = re.compile(
+    r"^(?:"
+    + "|".join(
+        re.escape(alias)
+        for alias in sorted(
+            (alias for aliases in SECTION_ALIASES.values() for alias in aliases), key=len, reverse=True
+        )
+    )
+    + r")\b"
+)
+_ALIAS_CATEGORY = {alias: category for category, aliases in SECTION_ALIASES.items() for alias in aliases}
+_MARKDOWN_HEADING = re.compile(r"^(#{1,6})\s+(.+?)\s*#*\s*$")
+_BOLD_HEADING = re.compile(r"^\*\*([^*]+?):?\*\*:?\s*$")
+# "Page 2", "Page 2 of 3", "2 of 3" and "2/3"; a bare number is only taken
+# for a page number when it matches the page's position (see _is_page_number)
+_PAGE_NUMBER = re.compile(
+    r"^[-– ]*(?:page\s*\d+(?:\s*(?:/|of)\s*\d+)?|\d+\s*(?:/|of)\s*\d+)[-– ]*$", re.IGNORECASE
+)
+_BARE_NUMBER = re.compile(r"^[-– ]*(\d{1,3})[-– ]*$")
+
+_encoding = None  # tiktoken encoding, False when unavailable
+
+
+@dataclass
+class Section:
+    """A run of lines under one heading, classified by SECTION_ALIASES."""
+
+    category: str
+    heading: str
+    text: str
+
+
+def estimate_tokens(text: str) -> int:
+    """Counts tokens with tiktoken's cl100k_base when available, else ~4 characters per token"""
+    global _encoding
+    if _encoding is None:
+        _encoding = False
+        if tiktoken is not None:
+            try:
+                _encoding = tiktoken.get_encoding("cl100k_base")
+            except Exception:
+                # The encoding is downloaded on first use, which fails offline
+                pass
+    if _encoding:
+        return len(_encoding.encode(text, disallowed_special=()))
+    return math.ceil(len(text) / 4)
+
+
+def report_tokens(label: str, before: str, after: str) -> Dict[str, int]:
+    """Prints and returns the token counts of a text before and after trimming"""
+    before_tokens, after_tokens = estimate_tokens(before), estimate_tokens(after)
+    saved = 100 * (before_tokens - after_tokens) / before_tokens if before_tokens else 0.0
+    print(f"✂️ {label}: {before_tokens} -> {after_tokens} tokens (-{saved:.0f}%)")
+    return {"before": before_tokens, "after": after_tokens}
+
+
+def normalize_whitespace(text: str) -> str:
+    """
+    Collapses runs of spaces and blank lines, strips trailing whitespace and
+    drops characters PDF extraction leaves behind (form feeds, soft hyphens,
+    non-breaking and zero-width spaces).
+    """
+    text = text.replace("\r\n", "\n").replace("\r", "\n").replace("\f", "\n")
+    text = text.replace("\u00ad", "").replace("\u200b", "").replace("\u00a0", " ").replace("\t", " ")
+    text = re.sub(r"[ ]{2,}", " ", text)
+    text = re.sub(r" *\n *", "\n", text)
+    text = re.sub(r"\n{3,}", "\n\n", text)
+    return text.strip() + "\n"
+
+
+def _edge_key(line: str) -> str:
+    # Page numbers and dates differ between pages of the same running header
+    return re.sub(r"\d+", "#", line.strip().lower())
+
+
+def _is_page_number(line: str, page_index: int) -> bool:
+    """
+    True for a labelled page number, or for a bare number equal to the
+    page's position (counting the first page as 1, or as unnumbered), so
+    a lone year such as "2019" at a page edge is kept.
+    """
+    if _PAGE_NUMBER.match(line):
+        return True
+    bare = _BARE_NUMBER.match(line)
+    return bare is not None and int(bare.group(1)) in (page_index + 1, page_index) and int(bare.group(1)) > 0
+
+
+def remove_repeated_lines(pages: Sequence[str], edge_lines: int = EDGE_LINES) -> List[str]:
+    """
+    Removes running headers and footers from extracted PDF pages.
+
+    A line near the top or bottom of a page is dropped when a line with the
+    same text (ignoring digits) sits near the edge of at least half of the
+    pages, except for its first occurrence, which usually is the real
+    header of the document. Page numbers at page edges are dropped.
+
+    Args:
+        pages (Sequence[str]): Text of each page, in order.
+        edge_lines (int): Number of non-empty lines per page edge to inspect.
+
+    Returns:
+        List[str]: The pages without the repeated lines.
+    """
+    page_lines = [page.splitlines() for page in pages]
+
+    def edges(lines: List[str]) -> List[int]:
+        filled = [index for index, line in enumerate(lines) if line.strip()]
+        return sorted(set(filled[:edge_lines] + filled[-edge_lines:]))
+
+    counts: Dict[str, int] = {}
+    for lines in page_lines:
+        for key in {_edge_key(lines[index]) for index in edges(lines)}:
+            counts[key] = counts.get(key, 0) + 1
+    threshold = max(2, math.ceil(len(pages) / 2))
+    # Lines without letters ("2019", "3") all share a key once digits are
+    # ignored, so only _is_page_number decides about them
+    repeated = {key for key, count in counts.items() if count >= threshold and re.search(r"[^\W\d_]", key)}
+
+    seen = set()
+    cleaned = []
+    for page_index, lines in enumerate(page_lines):
+        drop = set()
+        for index in edges(lines):
+            line = lines[index].strip()
+            key = _edge_key(line)
+            if _is_page_number(line, page_index):
+                drop.add(index)
+            elif key in repeated:
+                if key in seen:
+                    drop.add(index)
+                seen.add(key)
+        cleaned.append("\n".join(line for index, line in enumerate(lines) if index not in drop))
+    return cleaned
+
+
+def clean_resume_pages(pages: Sequence[str]) -> str:
+    """Joins extracted pages into one text without running headers, footers and stray whitespace"""
+    return normalize_whitespace("\n".join(remove_repeated_lines(pages)))
+
+
+def classify_heading(heading: str) -> Optional[str]:
+    """Returns the section category of a heading, or None if it is not a known section"""
+    text = re.sub(r"[*_`#:]+", " ", heading).lower().replace("&", "and")
+    text = re.sub(r"^\s*(?:\d+[.)]|[ivx]+[.)])\s*", "", text)
+    text = " ".join(text.split())
+    if not text or len(text.split()) > 6:
+        return None
+    match = _ALIAS_PATTERN.match(text)
+    return _ALIAS_CATEGORY[match.group(0)] if match else None
+
+
+def _heading(line: str):
+    """Returns (level, text) when a line is a heading: markdown, bold or a plain resume heading"""
+    stripped = line.strip()
+    match = _MARKDOWN_HEADING.match(stripped)
+    if match:
+        return len(match.group(1)), match.group(2)
+    match = _BOLD_HEADING.match(stripped)
+    if match:
+        return 7, match.group(1)
+    # Plain-text resumes: a short line that is exactly a known section name
+    if stripped and len(stripped) <= 40 and classify_heading(stripped) is not None:
+        bare = stripped.rstrip(":").strip().lower().replace("&", "and")
+        if bare in _ALIAS_CATEGORY:
+            return 7, stripped
+    return None
+
+
+def split_sections(text: str) -> List[Section]:
+    """
+    Splits a resume or markdown report into sections at its headings.
+
+    Text before the first heading is ``header`` (usually name and contact
+    details). A heading that is not a known section name, like a job title
+    under Experience, stays in the enclosing section when it is nested
+    deeper than that section's heading, and starts an ``other`` section
+    otherwise.
+    """
+    sections: List[Section] = []
+    category, heading, level = "header", "", 0
+    lines: List[str] = []
+
+    def close():
+        if lines or heading:
+            sections.append(Section(category, heading, "\n".join(lines)))
+
+    for line in text.splitlines():
+        found = _heading(line)
+        if found is not None:
+            found_level, found_text = found
+            found_category = classify_heading(found_text)
+            if found_category is not None or found_level <= level or category == "header":
+                close()
+                category = found_category or "other"
+                heading, level, lines = line, found_level, []
+                continue
+        lines.append(line)
+    close()
+    return sections
+
+
+def select_sections(text: str, dropped: FrozenSet[str]) -> str:
+    """Returns text without the sections whose category is in dropped"""
+    kept = []
+    for section in split_sections(text):
+        if section.category in dropped:
+            continue
+        kept.append("\n".join(part for part in (section.heading, section.text) if part))
+    return normalize_whitespace("\n".join(kept))
+
+
+def trim_context(task_name: str, context: str) -> str:
+    """
+    Trims the upstream outputs passed to a task down to the sections its
+    agent uses (CONTEXT_DROPPED_SECTIONS) and reports the token counts.
+    """
+    if not context:
+        return context
+    dropped = CONTEXT_DROPPED_SECTIONS.get(task_name, frozenset())
+    # Each upstream output is trimmed on its own so a dropped section never
+    # swallows the start of the next output
+    trimmed = CONTEXT_DIVIDER.join(
+        (select_sections(output, dropped) if dropped else normalize_whitespace(output)).strip()
+        for output in context.split(CONTEXT_DIVIDER)
+    )
+    report_tokens(f"Context for {task_name}", context, trimmed)
+    return trimmed
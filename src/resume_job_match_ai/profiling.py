@@ -0,0 +1,167 @@
+import contextlib
+import cProfile
+import functools
+import io
+import itertools
+import os
+import pstats
+import re
+import threading
+import time
+import tracemalloc
+from typing import Callable, Optional
+
+# cpu: cProfile per stage, memory: tracemalloc top allocators, all: both
+PROFILE_MODES = ("off", "cpu", "memory", "all")
+TOP_FUNCTIONS = 30
+TOP_ALLOCATIONS = 20
+
+_mode = "off"
+_report_dir = os.path.join("output", "profile")
+_report_counter = itertools.count(1)
+_active = threading.local()
+_tracemalloc_lock = threading.Lock()
+_NO_PROFILE = contextlib.nullcontext()
+
+
+def enable_profiling(mode: str = "all", report_dir: Optional[str] = None):
+    """
+    Turns stage profiling on or off for this process.
+
+    Args:
+        mode (str): One of PROFILE_MODES; "1" is accepted as "all".
+        report_dir (str): Directory for the .pstats and .txt reports.
+    """
+    global _mode, _report_dir
+    mode = "all" if mode == "1" else mode
+    if mode not in PROFILE_MODES:
+        raise ValueError(f"Unknown profiling mode '{mode}', expected one of {PROFILE_MODES}")
+    _mode = mode
+    if report_dir is not None:
+        _report_dir = report_dir
+
+
+def set_report_dir(report_dir: str):
+    """Writes the reports of later stages into report_dir"""
+    global _report_dir
+    _report_dir = report_dir
+
+
+def profiling_enabled() -> bool:
+    """Whether stages are currently being profiled"""
+    return _mode != "off"
+
+
+def _safe_name(stage: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", stage).strip("_") or "stage"
+
+
+def _cpu_report(profiler: cProfile.Profile) -> str:
+    buffer = io.StringIO()
+    stats = pstats.Stats(profiler, stream=buffer)
+    stats.sort_stats("cumulative").print_stats(TOP_FUNCTIONS)
+    return buffer.getvalue()
+
+
+def _memory_report(before: tracemalloc.Snapshot, after: tracemalloc.Snapshot, peak: int) -> str:
+    lines = [f"Peak traced memory: {peak / 1024 / 1024:.1f} MB (process-wide)"]
+    ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    after, before = after.filter_traces(ignore), before.filter_traces(ignore)
+    for diff in after.compare_to(before, "lineno")[:TOP_ALLOCATIONS]:
+        lines.append(f"  {diff}")
+    return "\n".join(lines) + "\n"
+
+
+@contextlib.contextmanager
+def _profiled_stage(stage: str):
+    # cProfile only sees the thread it is enabled in; a stage nested in one
+    # that is already profiled in this thread is part of the outer report
+    if getattr(_active, "stage", None) is not None:
+        yield
+        return
+
+    before = None
+    if _mode in ("memory", "all"):
+        with _tracemalloc_lock:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+        tracemalloc.reset_peak()
+        before = tracemalloc.take_snapshot()
+
+    profiler = None
+    if _mode in ("cpu", "all"):
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Python 3.12+ allows a single active profiler per process
+            profiler = None
+
+    _active.stage = stage
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        _active.stage = None
+        if profiler is not None:
+            profiler.disable()
+        memory = None
+        if before is not None:
+            # Snapshot before writing the report so its allocations are not counted
+            memory = _memory_report(before, tracemalloc.take_snapshot(), tracemalloc.get_traced_memory()[1])
+        _write_report(stage, elapsed, profiler, memory)
+
+
+def _write_report(
+    stage: str,
+    elapsed: float,
+    profiler: Optional[cProfile.Profile],
+    memory: Optional[str],
+):
+    os.makedirs(_report_dir, exist_ok=True)
+    base = os.path.join(_report_dir, f"{next(_report_counter):03d}-{_safe_name(stage)}")
+
+    sections = [f"Stage: {stage}\nWall time: {elapsed:.3f}s\nThread: {threading.current_thread().name}\n"]
+    if profiler is not None:
+        profiler.dump_stats(base + ".pstats")
+        sections.append(f"== cProfile, top {TOP_FUNCTIONS} by cumulative time ==\n{_cpu_report(profiler)}")
+    elif _mode in ("cpu", "all"):
+        sections.append("== cProfile ==\nSkipped: another profiler was active in this process\n")
+    if memory is not None:
+        sections.append(f"== tracemalloc, top {TOP_ALLOCATIONS} allocation sites during the stage ==\n{memory}")
+
+    with open(base + ".txt", "w", encoding="utf-8") as file:
+        file.write("\n".join(sections))
+    print(f"🔬 Profiled {stage} in {elapsed:.2f}s: {base}.txt")
+
+
+def profile_stage(stage: str):
+    """
+    Context manager that profiles the enclosed block as one stage.
+
+    When profiling is off it returns a shared no-op context, so stage
+    boundaries cost nothing in normal runs.
+    """
+    if _mode == "off":
+        return _NO_PROFILE
+    return _profiled_stage(stage)
+
+
+def profiled(stage: str) -> Callable:
+    """Decorator form of profile_stage for tools and other stage functions"""
+
+    def decorator(function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if _mode == "off":
+                return function(*args, **kwargs)
+            with _profiled_stage(stage):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+enable_profiling(os.environ.get("RESUME_PROFILE", "off"), os.environ.get("RESUME_PROFILE_DIR"))
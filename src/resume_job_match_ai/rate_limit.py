@@ -0,0 +1,148 @@
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from .tools.disk_cache import CACHE_ROOT
+
+
+@dataclass
+class RateLimit:
+    """Token bucket refilled at ``requests_per_minute`` holding up to ``burst`` tokens."""
+
+    requests_per_minute: float
+    burst: int = 1
+
+    @property
+    def rate_per_second(self) -> float:
+        return self.requests_per_minute / 60.0
+
+
+def provider_of(model: str) -> str:
+    """Returns the provider prefix of a model name (crewai defaults to openai)"""
+    return model.split("/", 1)[0] if "/" in model else "openai"
+
+
+class TokenBucketLimiter:
+    """
+    Token-bucket rate limiter shared by every agent, thread and process.
+
+    Buckets are keyed by provider ("openai") and by full model name
+    ("openai/gpt-5-nano"); a call takes one token from each configured bucket
+    that applies to its model. Bucket state lives in a SQLite database, so
+    concurrent runs on the same machine that share an API key also share
+    the limit. Time spent waiting is recorded per bucket.
+    """
+
+    def __init__(self, limits: Dict[str, RateLimit], path: Optional[str] = None):
+        self.limits = limits
+        self.path = path or os.path.join(CACHE_ROOT, "rate_limits.sqlite")
+        self.wait_seconds: Dict[str, float] = {}
+        self.total_wait_seconds = 0.0
+        self.acquired = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with self._connection() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS buckets ("
+                "key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL)"
+            )
+
+    @classmethod
+    def from_config(cls, config: Optional[dict]) -> Optional["TokenBucketLimiter"]:
+        """
+        Builds the limiter from the ``rate_limits`` section of agents.yaml.
+        Returns None if no limits are configured or RESUME_RATE_LIMITS=off.
+        """
+        if not config or os.environ.get("RESUME_RATE_LIMITS", "on") == "off":
+            return None
+        limits = {
+            key: RateLimit(
+                requests_per_minute=float(value["requests_per_minute"]),
+                burst=int(value.get("burst", 1)),
+            )
+            for key, value in config.items()
+        }
+        return cls(limits, os.environ.get("RESUME_RATE_LIMIT_DB"))
+
+    def _connection(self) -> sqlite3.Connection:
+        """One connection per thread; SQLite serializes writers across processes"""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            self._local.connection = connection
+        return connection
+
+    def buckets_for(self, model: str) -> List[str]:
+        """Returns the configured bucket keys that apply to a model"""
+        return [key for key in (provider_of(model), model) if key in self.limits]
+
+    def acquire(self, model: str) -> float:
+        """
+        Blocks until a request to model is allowed and takes its tokens.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        keys = self.buckets_for(model)
+        if not keys:
+            return 0.0
+
+        waited = 0.0
+        connection = self._connection()
+        while True:
+            now = time.time()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                levels = {}
+                for key in keys:
+                    limit = self.limits[key]
+                    row = connection.execute(
+                        "SELECT tokens, updated_at FROM buckets WHERE key = ?", (key,)
+                    ).fetchone()
+                    tokens = float(limit.burst) if row is None else row[0]
+                    if row is not None:
+                        tokens = min(limit.burst, tokens + (now - row[1]) * limit.rate_per_second)
+                    levels[key] = tokens
+
+                shortfall = max(
+                    (1.0 - tokens) / self.limits[key].rate_per_second
+                    for key, tokens in levels.items()
+                )
+                granted = shortfall <= 0
+                for key, tokens in levels.items():
+                    connection.execute(
+                        "INSERT OR REPLACE INTO buckets (key, tokens, updated_at) VALUES (?, ?, ?)",
+                        (key, tokens - 1.0 if granted else tokens, now),
+                    )
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+
+            if granted:
+                break
+            time.sleep(shortfall)
+            waited += shortfall
+
+        with self._lock:
+            self.acquired += 1
+            self.total_wait_seconds += waited
+            for key in keys:
+                self.wait_seconds[key] = self.wait_seconds.get(key, 0.0) + waited
+        if waited > 0.5:
+            print(f"⏳ Rate limit: waited {waited:.1f}s for {model}")
+        return waited
+
+    def stats(self) -> Dict[str, float]:
+        """Returns the number of acquired requests and the wait time per bucket"""
+        with self._lock:
+            return {
+                "requests": self.acquired,
+                "total_wait_seconds": round(self.total_wait_seconds, 3),
+                **{f"wait_seconds[{key}]": round(value, 3) for key, value in self.wait_seconds.items()},
+            }
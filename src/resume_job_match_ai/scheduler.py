@@ -0,0 +1,208 @@
+import contextvars
+import json
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from crewai import Crew, Task, TaskOutput
+from crewai.utilities.formatter import aggregate_raw_outputs_from_tasks
+from pydantic import PrivateAttr
+
+from .preprocess import trim_context
+
+EXECUTION_MODES = ("sequential", "dag")
+
+
+@dataclass
+class TaskTiming:
+    """Start and end timestamps of one task execution."""
+
+    name: str
+    agent: str
+    depends_on: List[str]
+    started_at: float
+    finished_at: float
+    duration_seconds: float = field(init=False)
+
+    def __post_init__(self):
+        self.duration_seconds = round(self.finished_at - self.started_at, 3)
+
+
+def build_task_graph(tasks: List[Task]) -> Dict[str, List[str]]:
+    """
+    Builds the dependency graph of a crew's tasks from their ``context``.
+
+    A task whose context is an explicit list depends exactly on those tasks;
+    an empty list means it depends on nothing. A task without a context
+    keeps crewai's sequential semantics and depends on every earlier task.
+
+    Returns:
+        Dict[str, List[str]]: Task name -> names of the tasks it waits for.
+    """
+    graph: Dict[str, List[str]] = {}
+    for index, task in enumerate(tasks):
+        if isinstance(task.context, list):
+            graph[task.name] = [upstream.name for upstream in task.context]
+        else:
+            graph[task.name] = [earlier.name for earlier in tasks[:index]]
+
+    for name, dependencies in graph.items():
+        for dependency in dependencies:
+            if dependency not in graph:
+                raise ValueError(f"Task '{name}' depends on unknown task '{dependency}'")
+    return graph
+
+
+def critical_path(timings: List[TaskTiming], graph: Dict[str, List[str]]) -> Tuple[List[str], float]:
+    """
+    Returns the longest chain of dependent tasks by measured duration.
+
+    This is the lower bound on wall-clock time with unlimited concurrency.
+    """
+    durations = {timing.name: timing.duration_seconds for timing in timings}
+    best: Dict[str, Tuple[float, List[str]]] = {}
+
+    def longest(name: str) -> Tuple[float, List[str]]:
+        if name not in best:
+            chains = [longest(dependency) for dependency in graph.get(name, []) if dependency in durations]
+            length, chain = max(chains, default=(0.0, []))
+            best[name] = (length + durations[name], chain + [name])
+        return best[name]
+
+    length, chain = max((longest(name) for name in durations), default=(0.0, []))
+    return chain, round(length, 3)
+
+
+class ContextTrimmingCrew(Crew):
+    """
+    Crew that trims the upstream outputs passed to each task down to the
+    sections its agent uses (see preprocess.CONTEXT_DROPPED_SECTIONS) and
+    reports the context tokens before and after.
+    """
+
+    trim_context: bool = True
+
+    def _trimmed_context(self, task: Task, context: str) -> str:
+        if not self.trim_context:
+            return context
+        return trim_context(task.name, context)
+
+    def _get_context(self, task: Task, task_outputs: List[TaskOutput]) -> str:
+        return self._trimmed_context(task, super()._get_context(task, task_outputs))
+
+
+class DagCrew(ContextTrimmingCrew):
+    """
+    Crew that runs tasks as a dependency graph instead of a fixed sequence.
+
+    Tasks are started as soon as every task in their ``context`` has
+    finished, on a thread pool of ``max_concurrency`` workers. Tasks that
+    share an agent never run at the same time. Everything else about
+    kickoff (input interpolation, planning, callbacks, events) is inherited
+    from Crew, which calls ``_run_sequential_process`` for Process.sequential.
+    """
+
+    max_concurrency: int = 4
+    timings_file: Optional[str] = None
+
+    _task_timings: List[TaskTiming] = PrivateAttr(default_factory=list)
+
+    @property
+    def task_timings(self) -> List[TaskTiming]:
+        """Timings of the tasks executed by the last kickoff"""
+        return list(self._task_timings)
+
+    def _run_sequential_process(self):
+        graph = build_task_graph(self.tasks)
+        tasks_by_name = {task.name: task for task in self.tasks}
+        outputs: Dict[str, TaskOutput] = {}
+        agent_locks: Dict[int, threading.Lock] = {}
+        self._task_timings = []
+
+        def execute(task_index: int, task: Task) -> Tuple[TaskOutput, TaskTiming]:
+            agent = self._get_agent_to_use(task)
+            if agent is None:
+                raise ValueError(f"No agent available for task: {task.description}")
+            tools = self._prepare_tools(agent, task, task.tools or agent.tools or [])
+            context = self._trimmed_context(
+                task, aggregate_raw_outputs_from_tasks([tasks_by_name[name] for name in graph[task.name]])
+            )
+
+            with agent_locks.setdefault(id(agent), threading.Lock()):
+                self._log_task_start(task, agent.role)
+                started_at = time.time()
+                output = task.execute_sync(agent=agent, context=context, tools=tools)
+                finished_at = time.time()
+
+            self._process_task_result(task, output)
+            self._store_execution_log(task, output, task_index)
+            timing = TaskTiming(
+                name=task.name,
+                agent=agent.role.strip(),
+                depends_on=graph[task.name],
+                started_at=started_at,
+                finished_at=finished_at,
+            )
+            return output, timing
+
+        # Agent locks are created up front so worker threads never race on them
+        for task in self.tasks:
+            if task.agent is not None:
+                agent_locks.setdefault(id(task.agent), threading.Lock())
+
+        start = time.time()
+        pending = list(enumerate(self.tasks))
+        running: Dict[Future, str] = {}
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as pool:
+            while pending or running:
+                for item in list(pending):
+                    task_index, task = item
+                    if all(dependency in outputs for dependency in graph[task.name]):
+                        pending.remove(item)
+                        # Copy the context so crewai's tracing baggage follows the task
+                        task_context = contextvars.copy_context()
+                        future = pool.submit(task_context.run, execute, task_index, task)
+                        running[future] = task.name
+
+                if not running:
+                    raise RuntimeError("Task graph has a dependency cycle")
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    outputs[name], timing = future.result()
+                    self._task_timings.append(timing)
+
+        self._report_timings(graph, time.time() - start)
+        return self._create_crew_output([outputs[task.name] for task in self.tasks])
+
+    def _report_timings(self, graph: Dict[str, List[str]], wall_seconds: float):
+        """Prints the task timeline and writes it to ``timings_file``"""
+        path, path_seconds = critical_path(self._task_timings, graph)
+        sequential_seconds = round(sum(timing.duration_seconds for timing in self._task_timings), 3)
+
+        print("\n⏱️ TASK TIMELINE:")
+        origin = min((timing.started_at for timing in self._task_timings), default=0.0)
+        for timing in sorted(self._task_timings, key=lambda timing: timing.started_at):
+            print(
+                f"  {timing.name:<25} +{timing.started_at - origin:7.2f}s "
+                f"-> +{timing.finished_at - origin:7.2f}s ({timing.duration_seconds:.2f}s)"
+            )
+        print(f"  Wall clock: {wall_seconds:.2f}s | Sum of tasks: {sequential_seconds:.2f}s")
+        print(f"  Critical path: {' -> '.join(path)} ({path_seconds:.2f}s)")
+
+        if self.timings_file:
+            with open(self.timings_file, "w", encoding="utf-8") as file:
+                json.dump(
+                    {
+                        "wall_seconds": round(wall_seconds, 3),
+                        "sum_of_tasks_seconds": sequential_seconds,
+                        "critical_path": path,
+                        "critical_path_seconds": path_seconds,
+                        "tasks": [asdict(timing) for timing in self._task_timings],
+                    },
+                    file,
+                    indent=2,
+                )
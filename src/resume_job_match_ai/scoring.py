@@ -0,0 +1,316 @@
+import math
+import re
+import time
+import zlib
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Weights of the overall 0-100 score
+SIMILARITY_WEIGHT = 0.4
+SKILL_WEIGHT = 0.6
+
+# Resume/JD cosine similarities rarely exceed this, so it maps to full marks
+SIMILARITY_CEILING = 0.5
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*(?:[.\-/][a-z0-9+#]+)*")
+
+STOPWORDS = frozenset(
+    """
+    a about above after all also an and any are as at be been being but by can
+    could did do does doing for from had has have having he her here hers him his
+    how i if in into is it its just me more most my no nor not of off on once only
+    or other our ours out over own per same she should so some such than that the
+    their theirs them then there these they this those through to too under until
+    up very was we were what when where which while who whom why will with would
+    you your yours etc e.g i.e within across using use used work working role
+    team strong ability experience years year plus including new well able must
+    """.split()
+)
+
+SKILLS = frozenset(
+    """
+    python java javascript typescript golang rust c++ c# ruby php scala kotlin
+    sql nosql bash matlab julia dart elixir haskell perl
+    react angular vue svelte next.js node.js express.js django flask fastapi
+    rails laravel .net graphql restful grpc html css sass tailwind redux webpack
+    postgresql mysql sqlite mongodb redis cassandra elasticsearch dynamodb
+    snowflake bigquery redshift kafka rabbitmq spark hadoop airflow dbt flink
+    aws azure gcp docker kubernetes terraform ansible jenkins helm linux git
+    ci/cd devops microservices serverless prometheus grafana datadog
+    pandas numpy scipy scikit-learn tensorflow pytorch keras jax xgboost
+    langchain llamaindex crewai llm llms nlp rag transformers huggingface
+    opencv mlops mlflow tableau powerbi jira agile scrum kanban
+    figma selenium cypress pytest junit jest playwright
+    """.split()
+)
+
+# Skills whose names are everyday words or single letters ("go the extra
+# mile", "excel at", "R&D"). They are matched on the original text only in
+# the spellings and contexts that mean the technology.
+_NOT_SENTENCE_START = r"(?<![.!?]\s)(?<!^)"
+CONTEXTUAL_SKILLS = {
+    "go": re.compile(_NOT_SENTENCE_START + r"\bGo\b(?![-'])(?!\s+(?:the|to|ahead|beyond|above|further)\b)", re.MULTILINE),
+    "r": re.compile(
+        r"\bR\s+(?:programming|language|studio|shiny|packages?|scripts?)\b|\bRStudio\b"
+        r"|\b(?:programming|written|coding|scripts?|analysis|models?|modell?ing|statistics)\s+in\s+R\b(?![\w&'-])"
+    ),
+    "c": re.compile(
+        r"\bC\s*/\s*C\+\+|\bC\s+(?:programming|language|developer|code)\b|\b(?:ANSI|embedded|Embedded)\s+C\b(?![\w+#'-])"
+        r"|\b(?:programming|written|coding)\s+in\s+C\b(?![\w+#'-])"
+    ),
+    "swift": re.compile(r"\bSwiftUI\b|\bSwift\s*(?:/\s*iOS|\(iOS\)|programming|language|developer)\b|\biOS\s*/\s*Swift\b"),
+    "spring": re.compile(r"(?i)\bspring\s+(?:boot|framework|mvc|cloud|security|data)\b"),
+    "rest": re.compile(r"\bREST\b|(?i:\brest(?:ful)?\s+(?:apis?|services?|endpoints?)\b)"),
+    "express": re.compile(r"(?i)\bexpress(?:\.?js)\b"),
+    "excel": re.compile(r"(?i)\b(?:ms|microsoft|advanced)\s+excel\b|\bexcel\s+(?:spreadsheets?|vba|macros|formulas)\b"),
+}
+
+# Single-letter and ambiguous names that also count as a bare item of a
+# list such as "Python, R, SQL", but only next to another known skill
+LIST_ITEM_SKILLS = {"R": "r", "C": "c", "Swift": "swift"}
+_LIST_SEPARATORS = re.compile(r"\s*(?:[,;|/()\u2022:]|\band\b|\bor\b)\s*")
+
+MULTIWORD_SKILLS = (
+    "machine learning",
+    "deep learning",
+    "computer vision",
+    "natural language processing",
+    "data science",
+    "data engineering",
+    "data analysis",
+    "distributed systems",
+    "system design",
+    "prompt engineering",
+    "project management",
+    "product management",
+    "unit testing",
+    "test automation",
+    "cloud computing",
+    "ai agents",
+    "generative ai",
+    "power bi",
+    "google cloud",
+)
+
+SKILL_ALIASES = {"golang": "go", "express.js": "express", "restful": "rest"}
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Lowercases text and splits it into terms, keeping tech spellings such
+    as ``c++``, ``c#``, ``node.js`` and ``ci/cd`` intact and dropping
+    stopwords.
+    """
+    return [
+        token
+        for token in TOKEN_PATTERN.findall(text.lower())
+        if token not in STOPWORDS and (len(token) > 1 or token in SKILLS)
+    ]
+
+
+def _list_item_skills(text: str) -> List[str]:
+    """Returns the LIST_ITEM_SKILLS that are items of a list of known skills"""
+    found = []
+    for line in text.splitlines():
+        items = [item for item in _LIST_SEPARATORS.split(line.strip()) if item]
+        named = [LIST_ITEM_SKILLS[item] for item in items if item in LIST_ITEM_SKILLS]
+        if named and any(item.lower() in SKILLS for item in items):
+            found += named
+    return found
+
+
+def extract_skills(text: str, tokens: Optional[Sequence[str]] = None) -> List[str]:
+    """
+    Returns the known skills mentioned in text, sorted alphabetically.
+    ``golang``, ``express.js`` and ``restful`` are reported as ``go``,
+    ``express`` and ``rest``.
+    """
+    if tokens is None:
+        tokens = tokenize(text)
+    lowered = " ".join(text.lower().split())
+    found = set()
+    for token in tokens:
+        # "python/sql" and "c/c++" name several skills, "ci/cd" is one
+        for term in (token,) if token in SKILLS or "/" not in token else token.split("/"):
+            if term in SKILLS:
+                found.add(SKILL_ALIASES.get(term, term))
+    found.update(skill for skill in MULTIWORD_SKILLS if skill in lowered)
+    found.update(skill for skill, pattern in CONTEXTUAL_SKILLS.items() if pattern.search(text))
+    found.update(_list_item_skills(text))
+    return sorted(found)
+
+
+def _chunks(text: str) -> List[str]:
+    """Splits a document into paragraph-sized chunks for IDF statistics."""
+    chunks = [chunk for chunk in re.split(r"\n\s*\n", text) if chunk.strip()]
+    if len(chunks) < 2:
+        chunks = [line for line in text.splitlines() if line.strip()]
+    return chunks or [text]
+
+
+def tfidf_cosine(resume_tokens: List[str], jd_tokens: List[str], corpus: List[List[str]]) -> float:
+    """
+    Cosine similarity of the TF-IDF vectors of two token lists.
+
+    IDF is computed over ``corpus``, the paragraph chunks of both documents,
+    so terms that appear everywhere (names, boilerplate) carry little weight.
+    """
+    vocabulary: Dict[str, int] = {}
+    for tokens in (resume_tokens, jd_tokens):
+        for token in tokens:
+            vocabulary.setdefault(token, len(vocabulary))
+    if not vocabulary:
+        return 0.0
+
+    size = len(vocabulary)
+    document_frequency = np.zeros(size, dtype=np.float64)
+    for chunk in corpus:
+        indices = [vocabulary[token] for token in set(chunk) if token in vocabulary]
+        document_frequency[indices] += 1
+    idf = np.log((len(corpus) + 1) / (document_frequency + 1)) + 1.0
+
+    def vector(tokens: List[str]) -> np.ndarray:
+        counts = np.bincount([vocabulary[token] for token in tokens], minlength=size).astype(np.float64)
+        return np.log1p(counts) * idf
+
+    resume_vector = vector(resume_tokens)
+    jd_vector = vector(jd_tokens)
+    norm = np.linalg.norm(resume_vector) * np.linalg.norm(jd_vector)
+    if norm == 0:
+        return 0.0
+    return float(resume_vector @ jd_vector / norm)
+
+
+# Width of the hashed term vectors
+EMBEDDING_DIM = 512
+
+# Term -> (column, sign), bounded so a long-lived daemon does not grow it forever
+_term_slots: Dict[str, tuple] = {}
+_TERM_SLOTS_LIMIT = 100_000
+
+
+def _slot(term: str, dim: int) -> tuple:
+    slot = _term_slots.get(term)
+    if slot is None:
+        # crc32 is stable across processes, unlike hash()
+        digest = zlib.crc32(term.encode("utf-8"))
+        slot = (digest % dim, 1.0 if digest & 0x80000000 else -1.0)
+        if len(_term_slots) >= _TERM_SLOTS_LIMIT:
+            _term_slots.clear()
+        _term_slots[term] = slot
+    return slot
+
+
+def embed(text: str, dim: int = EMBEDDING_DIM) -> np.ndarray:
+    """
+    Hashing-vectorizer embedding of a text.
+
+    Terms (see tokenize) are hashed into ``dim`` signed columns
+    with sublinear term frequency, and the vector is L2-normalized, so the
+    dot product of two embeddings is their cosine similarity. Needs no
+    model and no network.
+    """
+    vector = np.zeros(dim, dtype=np.float32)
+    counts = Counter(tokenize(text))
+    if not counts:
+        return vector
+    columns = np.empty(len(counts), dtype=np.intp)
+    weights = np.empty(len(counts), dtype=np.float32)
+    for position, (term, count) in enumerate(counts.items()):
+        column, sign = _slot(term, dim)
+        columns[position] = column
+        weights[position] = sign * (1.0 + math.log(count))
+    np.add.at(vector, columns, weights)
+    norm = float(np.linalg.norm(vector))
+    if norm:
+        vector /= norm
+    return vector
+
+
+@dataclass
+class MatchScore:
+    """Deterministic match score of a resume against a job description."""
+
+    score: float
+    similarity: float
+    skill_coverage: float
+    matched_skills: List[str] = field(default_factory=list)
+    missing_skills: List[str] = field(default_factory=list)
+    additional_skills: List[str] = field(default_factory=list)
+    elapsed_ms: float = 0.0
+
+    def to_dict(self) -> dict:
+        """Returns the score as a JSON-serializable dict"""
+        return asdict(self)
+
+    def to_markdown(self) -> str:
+        """Renders the score as a short markdown block for agent context"""
+
+        def listing(skills: List[str]) -> str:
+            return ", ".join(skills) if skills else "none"
+
+        return (
+            f"- Local match score: {self.score:.0f}/100\n"
+            f"- Text similarity (TF-IDF cosine): {self.similarity:.2f}\n"
+            f"- Required skill coverage: {self.skill_coverage:.0%}\n"
+            f"- Matched skills: {listing(self.matched_skills)}\n"
+            f"- Missing skills: {listing(self.missing_skills)}\n"
+            f"- Additional candidate skills: {listing(self.additional_skills)}"
+        )
+
+
+def score_match(resume_text: str, jd_text: str) -> MatchScore:
+    """
+    Scores how well a resume matches a job description, without any LLM.
+
+    The score combines the TF-IDF cosine similarity of the two texts with
+    the share of the job's known skills that also appear in the resume.
+    The same inputs always give the same score.
+
+    Args:
+        resume_text (str): Text returned by extract_resume.
+        jd_text (str): Text returned by extract_job_description.
+
+    Returns:
+        MatchScore: Overall score (0-100) with its breakdown.
+    """
+    start = time.perf_counter()
+    resume_tokens = tokenize(resume_text)
+    jd_tokens = tokenize(jd_text)
+    corpus = [tokenize(chunk) for chunk in _chunks(resume_text) + _chunks(jd_text)]
+
+    similarity = tfidf_cosine(resume_tokens, jd_tokens, corpus)
+
+    resume_skills = set(extract_skills(resume_text, resume_tokens))
+    jd_skills = set(extract_skills(jd_text, jd_tokens))
+    matched = sorted(resume_skills & jd_skills)
+    missing = sorted(jd_skills - resume_skills)
+    additional = sorted(resume_skills - jd_skills)
+    # Without recognizable skills in the JD, rely on text similarity alone
+    coverage = len(matched) / len(jd_skills) if jd_skills else min(1.0, similarity / SIMILARITY_CEILING)
+
+    score = 100 * (
+        SIMILARITY_WEIGHT * min(1.0, similarity / SIMILARITY_CEILING) + SKILL_WEIGHT * coverage
+    )
+    return MatchScore(
+        score=round(score, 1),
+        similarity=round(similarity, 4),
+        skill_coverage=round(coverage, 4),
+        matched_skills=matched,
+        missing_skills=missing,
+        additional_skills=additional,
+        elapsed_ms=round((time.perf_counter() - start) * 1000, 3),
+    )
+
+
+def rank_job_descriptions(resume_text: str, jd_texts: Dict[str, str]) -> List[Tuple[str, MatchScore]]:
+    """
+    Scores one resume against many job descriptions, best match first.
+
+    Useful to pre-screen pairs before sending any of them to the crew.
+    """
+    scores = [(name, score_match(resume_text, jd_text)) for name, jd_text in jd_texts.items()]
+    return sorted(scores, key=lambda item: (-item[1].score, item[0]))
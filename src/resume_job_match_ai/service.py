@@ -0,0 +1,456 @@
+import collections
+import json
+import mimetypes
+import multiprocessing
+import os
+import queue
+import re
+import secrets
+import shutil
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Deque, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from .batch import BatchJob, BatchResult, latency_summary, run_job
+
+SERVICE_OUTPUT_ROOT = os.path.join("output", "service")
+MAX_UPLOAD_BYTES = 20 * 1024 * 1024
+# Wait and service times of the last jobs used for the metrics
+METRICS_WINDOW = 1000
+STREAM_CHUNK_BYTES = 64 * 1024
+# Finished jobs and their workspaces are removed after this many seconds,
+# and beyond this many finished jobs the oldest go first
+JOB_TTL_SECONDS = float(os.environ.get("RESUME_SERVICE_JOB_TTL", "3600"))
+MAX_FINISHED_JOBS = int(os.environ.get("RESUME_SERVICE_MAX_JOBS", "200"))
+REPORT_FILES = (
+    "analyst_report.md",
+    "job_matching_report.md",
+    "web_research_summary.md",
+    "resume_advising_report.md",
+)
+PDF_FILE = "enhanced_resume.pdf"
+
+_JOB_ID = re.compile(r"^[0-9a-f]{12}$")
+
+
+class QueueFullError(RuntimeError):
+    """Raised when a job is submitted while the job queue is at capacity."""
+
+
+@dataclass
+class ServiceJob:
+    """A submitted resume/job description pair and its progress."""
+
+    job_id: str
+    workspace: str
+    state: str = "queued"  # queued, running, succeeded or failed
+    submitted_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    error: Optional[str] = None
+
+    @property
+    def output_dir(self) -> str:
+        return os.path.join(self.workspace, "output")
+
+    @property
+    def finished(self) -> bool:
+        return self.state in ("succeeded", "failed")
+
+    def files(self) -> List[str]:
+        """Names of the files written to the output workspace so far"""
+        if not os.path.isdir(self.output_dir):
+            return []
+        return sorted(
+            name for name in os.listdir(self.output_dir) if os.path.isfile(os.path.join(self.output_dir, name))
+        )
+
+    def to_dict(self) -> dict:
+        wait = (self.started_at or time.time()) - self.submitted_at
+        service = (self.finished_at or time.time()) - self.started_at if self.started_at else None
+        return {
+            "job_id": self.job_id,
+            "state": self.state,
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "wait_seconds": round(wait, 3),
+            "service_seconds": round(service, 3) if service is not None else None,
+            "error": self.error,
+            "files": {name: f"/jobs/{self.job_id}/files/{name}" for name in self.files()},
+        }
+
+
+class JobService:
+    """
+    Runs uploaded resume/job description pairs on a pool of crew workers.
+
+    Jobs wait in a bounded queue; when it is full, submit raises
+    QueueFullError so callers can push back instead of piling up work. One
+    dispatcher thread per worker takes jobs off the queue and runs them with
+    batch.run_job in a worker process, each in its own workspace under
+    output_root. Finished jobs are kept for job_ttl seconds, and at most
+    max_finished_jobs of them, after which the job and its workspace are
+    removed.
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        queue_size: int = 8,
+        output_root: str = SERVICE_OUTPUT_ROOT,
+        job_ttl: float = JOB_TTL_SECONDS,
+        max_finished_jobs: int = MAX_FINISHED_JOBS,
+    ):
+        self.workers = workers
+        self.queue_size = queue_size
+        self.output_root = output_root
+        self.job_ttl = job_ttl
+        self.max_finished_jobs = max_finished_jobs
+        self._queue: "queue.Queue[Optional[ServiceJob]]" = queue.Queue(maxsize=queue_size)
+        self._jobs: Dict[str, ServiceJob] = {}
+        self._lock = threading.Lock()
+        self._running = 0
+        self._counters = collections.Counter()
+        self._wait_seconds: Deque[float] = collections.deque(maxlen=METRICS_WINDOW)
+        self._service_seconds: Deque[float] = collections.deque(maxlen=METRICS_WINDOW)
+        # Worker processes are spawned, not forked, since the HTTP server
+        # and the dispatchers are already running threads
+        self._pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        self._dispatchers = [
+            threading.Thread(target=self._dispatch, name=f"dispatcher-{index}", daemon=True)
+            for index in range(workers)
+        ]
+        os.makedirs(output_root, exist_ok=True)
+        for dispatcher in self._dispatchers:
+            dispatcher.start()
+
+    def submit(self, resume_pdf: bytes, jd_text: bytes) -> ServiceJob:
+        """
+        Queues a resume/job description pair.
+
+        Args:
+            resume_pdf (bytes): Contents of the PDF resume.
+            jd_text (bytes): Contents of the job description text file.
+
+        Returns:
+            ServiceJob: The queued job.
+
+        Raises:
+            QueueFullError: When queue_size jobs are already waiting.
+        """
+        self._evict_finished()
+        job_id = secrets.token_hex(6)
+        job = ServiceJob(job_id=job_id, workspace=os.path.join(self.output_root, job_id))
+        input_dir = os.path.join(job.workspace, "input")
+        os.makedirs(input_dir)
+        with open(os.path.join(input_dir, "cv.pdf"), "wb") as file:
+            file.write(resume_pdf)
+        with open(os.path.join(input_dir, "jd.txt"), "wb") as file:
+            file.write(jd_text)
+
+        with self._lock:
+            try:
+                self._queue.put_nowait(job)
+            except queue.Full:
+                self._counters["rejected"] += 1
+                shutil.rmtree(job.workspace, ignore_errors=True)
+                raise QueueFullError(f"Job queue is full ({self.queue_size} jobs waiting)")
+            self._jobs[job_id] = job
+            self._counters["submitted"] += 1
+        print(f"📥 Queued job {job_id} ({self._queue.qsize()}/{self.queue_size} waiting)")
+        return job
+
+    def get(self, job_id: str) -> Optional[ServiceJob]:
+        """Returns a submitted job, or None"""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _evict_finished(self):
+        """Removes finished jobs past job_ttl, and the oldest beyond max_finished_jobs"""
+        now = time.time()
+        with self._lock:
+            finished = sorted(
+                (job for job in self._jobs.values() if job.finished), key=lambda job: job.finished_at or 0.0
+            )
+            excess = len(finished) - self.max_finished_jobs
+            evicted = [
+                job
+                for index, job in enumerate(finished)
+                if index < excess or now - (job.finished_at or now) > self.job_ttl
+            ]
+            for job in evicted:
+                del self._jobs[job.job_id]
+            self._counters["evicted"] += len(evicted)
+        for job in evicted:
+            shutil.rmtree(job.workspace, ignore_errors=True)
+
+    def _dispatch(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            with self._lock:
+                job.state = "running"
+                job.started_at = time.time()
+                self._running += 1
+            batch_job = BatchJob(
+                job_id=job.job_id,
+                resume_path=os.path.join(job.workspace, "input", "cv.pdf"),
+                jd_path=os.path.join(job.workspace, "input", "jd.txt"),
+                output_dir=job.output_dir,
+                output_root=job.workspace,
+            )
+            try:
+                result: BatchResult = self._pool.submit(run_job, batch_job).result()
+                error = result.error
+            except Exception as e:
+                # The worker process itself died, not just the crew
+                error = f"{type(e).__name__}: {e}"
+            with self._lock:
+                job.finished_at = time.time()
+                job.error = error
+                job.state = "succeeded" if error is None else "failed"
+                self._running -= 1
+                self._counters[job.state] += 1
+                self._wait_seconds.append(job.started_at - job.submitted_at)
+                self._service_seconds.append(job.finished_at - job.started_at)
+            status = "✅" if error is None else "❌"
+            print(f"{status} Job {job.job_id}: {job.finished_at - job.started_at:.1f}s")
+            self._evict_finished()
+
+    def metrics(self) -> dict:
+        """Queue depth, job counts and wait/service time statistics"""
+        with self._lock:
+            return {
+                "queue_depth": self._queue.qsize(),
+                "queue_capacity": self.queue_size,
+                "running": self._running,
+                "workers": self.workers,
+                "jobs_submitted": self._counters["submitted"],
+                "jobs_rejected": self._counters["rejected"],
+                "jobs_succeeded": self._counters["succeeded"],
+                "jobs_failed": self._counters["failed"],
+                "jobs_evicted": self._counters["evicted"],
+                "wait_seconds": latency_summary(list(self._wait_seconds)),
+                "service_seconds": latency_summary(list(self._service_seconds)),
+            }
+
+    def shutdown(self):
+        """Stops the dispatchers once the queued jobs have run"""
+        for _ in self._dispatchers:
+            self._queue.put(None)
+        for dispatcher in self._dispatchers:
+            dispatcher.join()
+        self._pool.shutdown()
+
+
+def prometheus_metrics(metrics: dict) -> str:
+    """Renders JobService.metrics in the Prometheus text exposition format"""
+    lines = []
+    for name in ("queue_depth", "queue_capacity", "running", "workers"):
+        lines += [f"# TYPE resume_service_{name} gauge", f"resume_service_{name} {metrics[name]}"]
+    lines.append("# TYPE resume_service_jobs_total counter")
+    for outcome in ("submitted", "rejected", "succeeded", "failed", "evicted"):
+        lines.append(f'resume_service_jobs_total{{outcome="{outcome}"}} {metrics["jobs_" + outcome]}')
+    for name in ("wait_seconds", "service_seconds"):
+        lines.append(f"# TYPE resume_service_{name} summary")
+        for statistic, value in metrics[name].items():
+            if statistic.startswith("p"):
+                lines.append(f'resume_service_{name}{{quantile="{int(statistic[1:]) / 100}"}} {value}')
+            else:
+                lines.append(f"resume_service_{name}_{statistic} {value}")
+    return "\n".join(lines) + "\n"
+
+
+def parse_upload(content_type: str, body: bytes) -> Dict[str, Tuple[Optional[str], bytes]]:
+    """
+    Parses a multipart/form-data body.
+
+    Returns:
+        Dict[str, Tuple[Optional[str], bytes]]: Field name to (file name, contents).
+    """
+    if not content_type.lower().startswith("multipart/form-data"):
+        raise ValueError("Expected a multipart/form-data upload")
+    message = BytesParser(policy=HTTP).parsebytes(
+        b"Content-Type: " + content_type.encode("latin-1") + b"\r\n\r\n" + body
+    )
+    if not message.is_multipart():
+        raise ValueError("Malformed multipart body")
+    fields = {}
+    for part in message.iter_parts():
+        name = part.get_param("name", header="content-disposition")
+        if name:
+            fields[name] = (part.get_filename(), part.get_payload(decode=True) or b"")
+    return fields
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """
+    POST /jobs                   multipart upload with ``resume`` (PDF) and ``jd`` fields
+    GET  /jobs/<id>              job status and the files written so far
+    GET  /jobs/<id>/result       the reports once the job is finished
+    GET  /jobs/<id>/files/<name> one report or the PDF, streamed
+    GET  /metrics                Prometheus metrics, JSON with ?format=json
+    """
+
+    server: "JobServer"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, payload: dict, status: int = 200, headers: Optional[Dict[str, str]] = None):
+        body = json.dumps(payload, indent=2).encode("utf-8")
+        self._send_bytes(body, "application/json", status, headers)
+
+    def _send_bytes(self, body: bytes, content_type: str, status: int = 200, headers: Optional[Dict[str, str]] = None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _error(self, status: int, message: str, headers: Optional[Dict[str, str]] = None):
+        self._send_json({"error": message}, status, headers)
+
+    def do_POST(self):
+        if urlparse(self.path).path != "/jobs":
+            return self._error(404, "Not found")
+        try:
+            length = int(self.headers.get("Content-Length", ""))
+        except ValueError:
+            length = -1
+        if length < 0:
+            # Without a valid length the body cannot be read or skipped
+            self.close_connection = True
+            return self._error(400, "Missing or invalid Content-Length")
+        if length > MAX_UPLOAD_BYTES:
+            # The body is not read, so the connection cannot be reused
+            self.close_connection = True
+            return self._error(413, f"Upload larger than {MAX_UPLOAD_BYTES} bytes")
+        body = self.rfile.read(length)
+
+        try:
+            fields = parse_upload(self.headers.get("Content-Type", ""), body)
+        except ValueError as e:
+            return self._error(400, str(e))
+        resume = fields.get("resume", (None, b""))[1]
+        jd = fields.get("jd", (None, b""))[1]
+        if not resume.startswith(b"%PDF"):
+            return self._error(400, "Field 'resume' must be a PDF file")
+        if not jd.strip():
+            return self._error(400, "Field 'jd' must hold the job description")
+
+        try:
+            job = self.server.service.submit(resume, jd)
+        except QueueFullError as e:
+            return self._error(429, str(e), {"Retry-After": str(self.server.retry_after)})
+        self._send_json(job.to_dict(), 202, {"Location": f"/jobs/{job.job_id}"})
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        parts = [part for part in url.path.split("/") if part]
+        if parts == ["metrics"]:
+            metrics = self.server.service.metrics()
+            if parse_qs(url.query).get("format") == ["json"]:
+                return self._send_json(metrics)
+            return self._send_bytes(prometheus_metrics(metrics).encode("utf-8"), "text/plain; version=0.0.4")
+        if len(parts) < 2 or parts[0] != "jobs" or not _JOB_ID.match(parts[1]):
+            return self._error(404, "Not found")
+        job = self.server.service.get(parts[1])
+        if job is None:
+            return self._error(404, f"Unknown job {parts[1]}")
+
+        if len(parts) == 2:
+            return self._send_json(job.to_dict())
+        if parts[2:] == ["result"]:
+            return self._send_result(job)
+        if len(parts) == 4 and parts[2] == "files":
+            return self._send_file(job, parts[3])
+        return self._error(404, "Not found")
+
+    def _send_result(self, job: ServiceJob):
+        if not job.finished:
+            return self._send_json(job.to_dict(), 202, {"Retry-After": str(self.server.retry_after)})
+        result = job.to_dict()
+        reports = {}
+        for name in REPORT_FILES:
+            path = os.path.join(job.output_dir, name)
+            if os.path.exists(path):
+                with open(path, encoding="utf-8") as file:
+                    reports[name] = file.read()
+        result["reports"] = reports
+        result["pdf"] = result["files"].get(PDF_FILE)
+        self._send_json(result)
+
+    def _send_file(self, job: ServiceJob, name: str):
+        if name not in job.files():
+            return self._error(404, f"No file {name} for job {job.job_id}")
+        path = os.path.join(job.output_dir, name)
+        content_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+        if name.endswith(".md"):
+            content_type = "text/markdown; charset=utf-8"
+        with open(path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(size))
+            self.end_headers()
+            # Reports may still be growing while a streaming job runs, so
+            # exactly the announced number of bytes is sent
+            remaining = size
+            while remaining > 0:
+                chunk = file.read(min(STREAM_CHUNK_BYTES, remaining))
+                if not chunk:
+                    break
+                self.wfile.write(chunk)
+                remaining -= len(chunk)
+
+
+class JobServer(ThreadingHTTPServer):
+    """HTTP front end of a JobService; every request is handled in its own thread."""
+
+    daemon_threads = True
+
+    def __init__(self, service: JobService, host: str = "127.0.0.1", port: int = 8000, retry_after: int = 30):
+        super().__init__((host, port), _Handler)
+        self.service = service
+        self.retry_after = retry_after
+
+
+def serve(
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    workers: int = 2,
+    queue_size: int = 8,
+    output_root: str = SERVICE_OUTPUT_ROOT,
+):
+    """
+    Runs the job service until interrupted.
+
+    Args:
+        host (str): Interface to listen on.
+        port (int): Port to listen on.
+        workers (int): Crew runs executing at the same time.
+        queue_size (int): Jobs that may wait for a worker before uploads get 429.
+        output_root (str): Directory holding one workspace per job.
+    """
+    service = JobService(workers=workers, queue_size=queue_size, output_root=output_root)
+    server = JobServer(service, host, port)
+    print(f"🌐 Job service listening on http://{host}:{server.server_port} ({workers} workers, queue of {queue_size})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n⚠️ Shutting down, waiting for running jobs...")
+    finally:
+        server.server_close()
+        service.shutdown()
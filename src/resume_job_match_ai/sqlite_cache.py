@@ -0,0 +1,104 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+
+class SQLiteCache:
+    """
+    Key/value cache in a SQLite table with TTL expiry and a size budget.
+
+    SQLite handles locking, so one database file can be shared by every
+    process of a batch. Entries older than ``ttl_seconds`` are treated as
+    misses and deleted; once the table holds more than ``max_bytes`` of
+    values, the least recently used entries are evicted.
+    """
+
+    def __init__(self, path: str, table: str, ttl_seconds: float, max_bytes: int):
+        if not table.isidentifier():
+            raise ValueError(f"Invalid table name: {table}")
+        self.path = path
+        self.table = table
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, "
+                "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._connection.execute(
+                f"CREATE INDEX IF NOT EXISTS {table}_accessed ON {table} (accessed_at)"
+            )
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Returns the value for key, or None if missing or expired"""
+        now = time.time()
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                f"SELECT value, created_at FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and now - row[1] > self.ttl_seconds:
+                self._connection.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self._connection.execute(
+                f"UPDATE {self.table} SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self.hits += 1
+            return row[0]
+
+    def put(self, key: str, value: bytes):
+        """Stores value under key and evicts old entries if over budget"""
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, value, len(value), now, now),
+            )
+            total = self._connection.execute(
+                f"SELECT COALESCE(SUM(size), 0) FROM {self.table}"
+            ).fetchone()[0]
+            if total > self.max_bytes:
+                self._evict(total)
+
+    def _evict(self, total: int):
+        """Deletes least recently used entries until under the size budget"""
+        rows = self._connection.execute(
+            f"SELECT key, size FROM {self.table} ORDER BY accessed_at"
+        ).fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._connection.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+            total -= size
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Returns hit/miss/eviction counters and the number of stored entries"""
+        with self._lock:
+            entries = self._connection.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": entries,
+            }
+
+    def clear(self):
+        """Removes every entry"""
+        with self._lock, self._connection:
+            self._connection.execute(f"DELETE FROM {self.table}")
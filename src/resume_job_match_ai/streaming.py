@@ -0,0 +1,328 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from .tracing import current_span
+
+# Text the ReAct prompt puts before the agent's answer; what follows it is
+# what crewai saves to the task's output_file once the task is done
+FINAL_ANSWER_MARKER = "Final Answer:"
+
+_active_streamer: Optional["OutputStreamer"] = None
+_handlers_installed = False
+_install_lock = threading.Lock()
+
+
+def streaming_enabled() -> bool:
+    """Streaming is off unless RESUME_STREAMING=1"""
+    return os.environ.get("RESUME_STREAMING", "0") == "1"
+
+
+@dataclass(frozen=True)
+class StreamChunk:
+    """
+    A piece of agent output delivered to stream subscribers.
+
+    ``answer`` is True for text after the final-answer marker, which is the
+    text written to the task's output file. The last chunk of a task has
+    ``done`` set and no text.
+    """
+
+    task: str
+    text: str
+    answer: bool
+    elapsed: float
+    done: bool = False
+
+
+@dataclass
+class _TaskStream:
+    name: str
+    output_file: Optional[str]
+    started_at: float = field(default_factory=time.perf_counter)
+    first_chunk_at: Optional[float] = None
+    first_answer_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    chunks: int = 0
+    answer_chars: int = 0
+    call_text: str = ""
+    in_answer: bool = False
+    answer_started: bool = False
+    file: Any = None
+
+
+class OutputStreamer:
+    """
+    Writes agent output to the task output files while it is generated and
+    hands every chunk to the subscribers.
+
+    As soon as the final answer of a task starts to stream, its text is
+    written to the task's ``output_file``, so a consumer can read partial
+    reports. crewai overwrites the file with the finished output at the end
+    of the task. Time to the first token and to the first answer byte is
+    recorded per task.
+    """
+
+    def __init__(self):
+        self._tasks: Dict[str, _TaskStream] = {}
+        self._subscribers: List[Callable[[StreamChunk], None]] = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, target: Any, loop: Any = None):
+        """
+        Adds a subscriber for the chunks of every task.
+
+        Args:
+            target: A callable taking a StreamChunk, or a queue (``queue.Queue``
+                or ``asyncio.Queue``) the chunks are put into without blocking.
+            loop: Event loop of an asyncio subscriber; chunks are then handed
+                over with ``call_soon_threadsafe`` since agents run in worker
+                threads.
+        """
+        deliver = target.put_nowait if hasattr(target, "put_nowait") else target
+        if loop is not None:
+            callback = deliver
+
+            def deliver(chunk: StreamChunk):
+                loop.call_soon_threadsafe(callback, chunk)
+
+        with self._lock:
+            self._subscribers.append(deliver)
+
+    def _publish(self, chunk: StreamChunk):
+        for deliver in list(self._subscribers):
+            try:
+                deliver(chunk)
+            except Exception as e:
+                # A broken subscriber must not fail the agent
+                print(f"⚠️ Stream subscriber failed, removing it: {e}")
+                with self._lock:
+                    if deliver in self._subscribers:
+                        self._subscribers.remove(deliver)
+
+    def task_started(self, task_id: str, name: str, output_file: Optional[str]):
+        with self._lock:
+            self._tasks[task_id] = _TaskStream(name, output_file)
+
+    def call_started(self, task_id: str):
+        """Starts a new LLM call of a task; only its own text can hold the answer marker"""
+        stream = self._tasks.get(task_id)
+        if stream is not None:
+            stream.call_text = ""
+            stream.in_answer = False
+
+    def chunk(self, task_id: Optional[str], text: str):
+        """Handles one streamed piece of LLM output of a task"""
+        stream = self._tasks.get(task_id) if task_id is not None else None
+        if stream is None or not text:
+            return
+        now = time.perf_counter()
+        stream.chunks += 1
+        if stream.first_chunk_at is None:
+            stream.first_chunk_at = now
+            print(f"\n📡 {stream.name}: first token after {now - stream.started_at:.2f}s")
+        span = current_span()
+        if span is not None and "gen_ai.response.first_chunk_ms" not in span.attributes:
+            span.set("gen_ai.response.first_chunk_ms", round((time.time_ns() - span.start_ns) / 1e6, 1))
+
+        answer = ""
+        if stream.in_answer:
+            answer = text
+        else:
+            # The marker may be split across chunks
+            searched_from = max(0, len(stream.call_text) - len(FINAL_ANSWER_MARKER))
+            stream.call_text += text
+            position = stream.call_text.find(FINAL_ANSWER_MARKER, searched_from)
+            if position >= 0:
+                stream.in_answer = True
+                answer = stream.call_text[position + len(FINAL_ANSWER_MARKER):].lstrip()
+                self._open_answer(stream)
+        if answer:
+            self._write_answer(stream, answer, now)
+
+        self._publish(StreamChunk(stream.name, text, bool(answer), now - stream.started_at))
+
+    def _open_answer(self, stream: _TaskStream):
+        if stream.output_file is None:
+            return
+        self._close_file(stream)
+        directory = os.path.dirname(stream.output_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # A retried call starts the answer over
+        stream.file = open(stream.output_file, "w", encoding="utf-8")
+        stream.answer_chars = 0
+        stream.answer_started = False
+
+    def _write_answer(self, stream: _TaskStream, text: str, now: float):
+        if not stream.answer_started:
+            text = text.lstrip()
+            if not text:
+                return
+            stream.answer_started = True
+            if stream.first_answer_at is None:
+                stream.first_answer_at = now
+        stream.answer_chars += len(text)
+        if stream.file is not None:
+            stream.file.write(text)
+            stream.file.flush()
+
+    @staticmethod
+    def _close_file(stream: _TaskStream):
+        if stream.file is not None:
+            stream.file.close()
+            stream.file = None
+
+    def call_finished(self, task_id: str):
+        stream = self._tasks.get(task_id)
+        if stream is not None:
+            self._close_file(stream)
+
+    def task_finished(self, task_id: str):
+        stream = self._tasks.get(task_id)
+        if stream is None:
+            return
+        self._close_file(stream)
+        stream.finished_at = time.perf_counter()
+        self._publish(StreamChunk(stream.name, "", False, stream.finished_at - stream.started_at, done=True))
+
+    def timings(self) -> List[Dict[str, Any]]:
+        """Returns time to first token and first answer byte of every task, in seconds"""
+
+        def since_start(stream: _TaskStream, moment: Optional[float]) -> Optional[float]:
+            return round(moment - stream.started_at, 3) if moment is not None else None
+
+        return [
+            {
+                "task": stream.name,
+                "first_token_seconds": since_start(stream, stream.first_chunk_at),
+                "first_answer_seconds": since_start(stream, stream.first_answer_at),
+                "total_seconds": since_start(stream, stream.finished_at),
+                "chunks": stream.chunks,
+                "answer_chars": stream.answer_chars,
+            }
+            for stream in sorted(self._tasks.values(), key=lambda stream: stream.started_at)
+        ]
+
+
+def get_streamer() -> Optional[OutputStreamer]:
+    """Returns the streamer of the run in progress, or None"""
+    return _active_streamer
+
+
+def _task_id(task: Any) -> Optional[str]:
+    return str(task.id) if getattr(task, "id", None) is not None else None
+
+
+@contextmanager
+def stream_call(task: Any = None) -> Iterator[Optional[OutputStreamer]]:
+    """Marks the boundaries of one LLM call of a task; yields None when streaming is off"""
+    streamer = _active_streamer
+    task_id = _task_id(task)
+    if streamer is None or task_id is None:
+        yield None
+        return
+    streamer.call_started(task_id)
+    try:
+        yield streamer
+    finally:
+        streamer.call_finished(task_id)
+
+
+def emit_cached_response(source: Any, text: str, task: Any = None, agent: Any = None):
+    """
+    Publishes a response answered from a cache as a single stream chunk, so
+    subscribers and output files see it like a streamed provider response.
+    """
+    from crewai.events import crewai_event_bus
+    from crewai.events.types.llm_events import LLMStreamChunkEvent
+
+    crewai_event_bus.emit(source, event=LLMStreamChunkEvent(chunk=text, from_task=task, from_agent=agent))
+
+
+def install_event_handlers():
+    """
+    Subscribes the streaming hooks to crewai's event bus, once per process.
+    Handlers forward to the active streamer and do nothing without one.
+    """
+    global _handlers_installed
+    with _install_lock:
+        if _handlers_installed:
+            return
+        _handlers_installed = True
+
+    from crewai.events import crewai_event_bus
+    from crewai.events.types.llm_events import LLMStreamChunkEvent
+    from crewai.events.types.task_events import (
+        TaskCompletedEvent,
+        TaskFailedEvent,
+        TaskStartedEvent,
+    )
+
+    def task_id(source, event) -> str:
+        task = getattr(event, "task", None) or source
+        return str(getattr(task, "id", id(task)))
+
+    @crewai_event_bus.on(TaskStartedEvent)
+    def on_task_started(source, event):
+        if _active_streamer is not None:
+            task = event.task or source
+            agent = getattr(task, "agent", None)
+            _active_streamer.task_started(
+                task_id(source, event),
+                getattr(task, "name", None) or getattr(agent, "role", "task").strip(),
+                getattr(task, "output_file", None),
+            )
+
+    @crewai_event_bus.on(LLMStreamChunkEvent)
+    def on_stream_chunk(source, event):
+        if _active_streamer is not None and event.tool_call is None:
+            # crewai stores the task's UUID here, not its string form
+            task_id = str(event.task_id) if event.task_id is not None else None
+            _active_streamer.chunk(task_id, event.chunk)
+
+    @crewai_event_bus.on(TaskCompletedEvent)
+    def on_task_completed(source, event):
+        if _active_streamer is not None:
+            _active_streamer.task_finished(task_id(source, event))
+
+    @crewai_event_bus.on(TaskFailedEvent)
+    def on_task_failed(source, event):
+        if _active_streamer is not None:
+            _active_streamer.task_finished(task_id(source, event))
+
+
+def start_streaming(enabled: Optional[bool] = None) -> Optional[OutputStreamer]:
+    """
+    Makes a new streamer the active one. Returns None when streaming is
+    off (RESUME_STREAMING, unless enabled is given).
+    """
+    global _active_streamer
+    if not (streaming_enabled() if enabled is None else enabled):
+        _active_streamer = None
+        return None
+    install_event_handlers()
+    _active_streamer = OutputStreamer()
+    return _active_streamer
+
+
+def print_stream_summary(streamer: OutputStreamer):
+    """Prints time to first token and to first answer byte per task"""
+
+    def seconds(value: Optional[float]) -> str:
+        return f"{value:8.2f}" if value is not None else f"{'-':>8}"
+
+    rows = streamer.timings()
+    if not rows:
+        return
+    print("\n📡 STREAMING")
+    print("-" * 72)
+    print(f"{'task':32} {'1st tok s':>9} {'1st ans s':>9} {'total s':>8} {'chunks':>6}")
+    for row in rows:
+        print(
+            f"{str(row['task'])[:32]:32} {seconds(row['first_token_seconds']):>9} "
+            f"{seconds(row['first_answer_seconds']):>9} {seconds(row['total_seconds'])} {row['chunks']:6d}"
+        )
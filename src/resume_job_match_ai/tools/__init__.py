@@ -1,22 +1,66 @@
-from crewai_tools import SerperDevTool
-
-from .file_tools import extract_job_description
-from .pdf_tools import extract_resume, save_resume_as_pdf
-
-# Register all tools for CrewAI project system
-# The keys must match exactly what you use in YAML files
-tool_functions = {
-    "extract_resume": extract_resume,
-    "save_resume_as_pdf": save_resume_as_pdf,
-    "extract_job_description": extract_job_description,
-    "SerperDevTool": SerperDevTool,
+import importlib
+
+# Tools are imported on first access (PEP 562), so importing one tool module,
+# or just disk_cache, does not pull in crewai, crewai_tools and pypdf for all
+# of them. Maps each exported name to the submodule defining it.
+_EXPORTS = {
+    "extract_resume": ".pdf_tools",
+    "extract_resume_text": ".pdf_tools",
+    "iter_resume_pages": ".pdf_tools",
+    "save_resume_as_pdf": ".pdf_tools",
+    "extract_job_description": ".file_tools",
+    "read_job_description": ".file_tools",
+    "search_knowledge": ".knowledge_tools",
+    "CachedSearchTool": ".search_tools",
+    "LocalSearchBackend": ".search_tools",
+    "create_search_tool": ".search_tools",
+    "SerperDevTool": "crewai_tools",
 }
 
+
+def _tool_functions():
+    # Register all tools for CrewAI project system
+    # The keys must match exactly what you use in YAML files
+    return {
+        "extract_resume": __getattr__("extract_resume"),
+        "save_resume_as_pdf": __getattr__("save_resume_as_pdf"),
+        "extract_job_description": __getattr__("extract_job_description"),
+        "search_knowledge": __getattr__("search_knowledge"),
+        "SerperDevTool": __getattr__("SerperDevTool"),
+        "CachedSearchTool": __getattr__("create_search_tool"),
+    }
+
+
+def __getattr__(name: str):
+    if name == "tool_functions":
+        value = _tool_functions()
+    elif name in _EXPORTS:
+        module_name = _EXPORTS[name]
+        module = importlib.import_module(module_name, __name__ if module_name.startswith(".") else None)
+        value = getattr(module, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Later lookups find the attribute without going through __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
 # Export tools for direct import
 __all__ = [
     "extract_resume",
+    "extract_resume_text",
+    "iter_resume_pages",
     "save_resume_as_pdf",
     "extract_job_description",
+    "read_job_description",
+    "search_knowledge",
     "SerperDevTool",
+    "CachedSearchTool",
+    "LocalSearchBackend",
+    "create_search_tool",
     "tool_functions",
 ]
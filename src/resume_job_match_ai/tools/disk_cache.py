@@ -0,0 +1,164 @@
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+from typing import Dict, Optional
+
+CACHE_ROOT = os.environ.get("RESUME_CACHE_DIR", "./.cache")
+
+
+def sha256_hex(*parts: bytes) -> str:
+    """Return the SHA-256 hex digest of the concatenated byte parts."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part)
+    return digest.hexdigest()
+
+
+def atomic_write_bytes(path: str, data: bytes) -> None:
+    """
+    Write bytes to a file atomically.
+
+    The data is written to a temporary file in the same directory and then
+    moved into place with os.replace, so readers never observe a partial file.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            tmp_file.write(data)
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+class DiskCache:
+    """
+    Content-addressed on-disk cache with size-bounded LRU eviction.
+
+    Entries are stored as one file per key. Recency is tracked with the file
+    modification time, which is refreshed on every hit, so the least recently
+    used entries are evicted first once the total size exceeds ``max_bytes``.
+    """
+
+    def __init__(self, directory: str, max_bytes: int, suffix: str = ".bin"):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None
+
+    def path_for(self, key: str) -> str:
+        """Return the file path used to store the given key."""
+        return os.path.join(self.directory, key[:2], key + self.suffix)
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached bytes for key, or None on a miss."""
+        path = self.path_for(key)
+        try:
+            with open(path, "rb") as cached_file:
+                data = cached_file.read()
+            os.utime(path)
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        return data
+
+    def copy_to(self, key: str, destination: str) -> bool:
+        """
+        Place a copy of the cached entry for key at destination.
+
+        The entry is copied, not hardlinked, so editing the delivered file
+        cannot change what later hits are served. shutil.copyfile copies in
+        the kernel (sendfile) without reading the file into Python. The
+        destination appears atomically. Returns False on a miss.
+        """
+        path = self.path_for(key)
+        directory = os.path.dirname(os.path.abspath(destination))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = os.path.join(directory, f".tmp-{key[:16]}-{os.getpid()}-{threading.get_ident()}")
+        try:
+            shutil.copyfile(path, tmp_path)
+            os.replace(tmp_path, destination)
+            os.utime(path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            with self._lock:
+                self.misses += 1
+            return False
+
+        with self._lock:
+            self.hits += 1
+        return True
+
+    def put(self, key: str, data: bytes) -> str:
+        """Store data under key and evict old entries if over budget."""
+        path = self.path_for(key)
+        previous_size = os.path.getsize(path) if os.path.exists(path) else 0
+        atomic_write_bytes(path, data)
+
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_size()
+            else:
+                self._total_bytes += len(data) - previous_size
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+        return path
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss/eviction counters."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def _entries(self):
+        if not os.path.isdir(self.directory):
+            return []
+        entries = []
+        for root, _, files in os.walk(self.directory):
+            for filename in files:
+                if not filename.endswith(self.suffix):
+                    continue
+                path = os.path.join(root, filename)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _scan_size(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self):
+        """Remove least recently used entries until under the size budget."""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+            self.evictions += 1
+        self._total_bytes = total
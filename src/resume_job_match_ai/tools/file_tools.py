@@ -1,16 +1,25 @@
-from crewai.tools import tool
+from ..profiling import profiled
+from .registry import lazy_tools
 
 
-@tool("JD Extractor")
-def extract_job_description(jd_path: str) -> str:
+def read_job_description(jd_path: str) -> str:
+    """Read a job description text file. Can be called directly outside the crew."""
+    with open(jd_path, encoding="utf-8") as file:
+        return file.read()
+
+
+@profiled("tool.extract_job_description")
+def _extract_job_description(jd_path: str) -> str:
     """Always use this tool to extract uploaded job description and return string"""
 
     try:
-        with open(jd_path, encoding="utf-8") as file:
-            jd = file.read()
-        return jd
+        return read_job_description(jd_path)
 
     except Exception as e:
         raise RuntimeError(
             f"An error occurred while reading the job description: {e}"
         ) from e
+
+
+# extract_job_description is the crewai tool, built on first access
+__getattr__ = lazy_tools(__name__, {"extract_job_description": ("JD Extractor", _extract_job_description)})
@@ -0,0 +1,23 @@
+import os
+
+from ..profiling import profiled
+from ..tracing import annotate
+from .registry import lazy_tools
+
+KNOWLEDGE_TOP_K = int(os.environ.get("RESUME_KNOWLEDGE_TOP_K", "4"))
+
+
+@profiled("tool.search_knowledge")
+def _search_knowledge(query: str) -> str:
+    """Use this tool to look up company profiles, role profiles and user preferences in the local knowledge base. Pass a short query such as a company name, a role title or a set of skills."""
+    from ..knowledge_index import get_knowledge_index
+
+    hits = get_knowledge_index().search(query, k=KNOWLEDGE_TOP_K)
+    annotate("knowledge.hits", len(hits))
+    if not hits:
+        return "No matching entries in the knowledge base."
+    return "\n\n".join(f"### {hit['path']} (similarity {hit['score']:.2f})\n{hit['text']}" for hit in hits)
+
+
+# search_knowledge is the crewai tool, built on first access
+__getattr__ = lazy_tools(__name__, {"search_knowledge": ("Knowledge Search", _search_knowledge)})
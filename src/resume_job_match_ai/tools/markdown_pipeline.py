@@ -0,0 +1,101 @@
+import os
+import threading
+from typing import List, Optional
+
+STYLESHEET_PATH = os.path.join(os.path.dirname(__file__), "resume.css")
+
+# Syntax highlighting pulls in Pygments lexers and resumes rarely contain code
+BASE_EXTENSIONS = ["tables"]
+HIGHLIGHT_EXTENSIONS = ["codehilite"]
+
+_stylesheet: Optional[str] = None
+_template: Optional["PageTemplate"] = None
+_local = threading.local()
+
+
+def highlighting_enabled() -> bool:
+    """Code highlighting is opt-in with RESUME_CODEHILITE=1"""
+    return os.environ.get("RESUME_CODEHILITE", "0") == "1"
+
+
+class MarkdownConverter:
+    """
+    Reusable markdown to HTML converter.
+
+    The ``markdown.Markdown`` instance and its extensions are built once and
+    reset between documents instead of being rebuilt for every call.
+    Instances are not thread-safe; use get_converter() for a per-thread one.
+    """
+
+    def __init__(self, highlight: Optional[bool] = None):
+        if highlight is None:
+            highlight = highlighting_enabled()
+        self.extensions: List[str] = BASE_EXTENSIONS + (HIGHLIGHT_EXTENSIONS if highlight else [])
+        import markdown
+
+        self._markdown = markdown.Markdown(extensions=self.extensions)
+
+    def reset(self):
+        """Clears the state left over from the previous document"""
+        self._markdown.reset()
+
+    def convert(self, markdown_content: str) -> str:
+        """Converts one markdown document to an HTML fragment"""
+        self.reset()
+        return self._markdown.convert(markdown_content)
+
+
+def get_converter() -> MarkdownConverter:
+    """Returns this thread's converter, built on first use"""
+    converter = getattr(_local, "converter", None)
+    if converter is None:
+        converter = MarkdownConverter()
+        _local.converter = converter
+    return converter
+
+
+def load_stylesheet() -> str:
+    """Returns the resume stylesheet, read from resume.css once per process"""
+    global _stylesheet
+    if _stylesheet is None:
+        with open(STYLESHEET_PATH, encoding="utf-8") as file:
+            _stylesheet = file.read()
+    return _stylesheet
+
+
+class PageTemplate:
+    """
+    HTML page around a converted resume.
+
+    The markup before and after the body is assembled once, so wrapping a
+    document is two string concatenations instead of formatting the whole
+    page, stylesheet included, for every call.
+    """
+
+    def __init__(self, stylesheet: str):
+        self.stylesheet = stylesheet
+        head = (
+            "<!DOCTYPE html>\n<html>\n<head>\n"
+            '    <meta charset="UTF-8">\n'
+            "    <title>Professional Resume</title>\n"
+        )
+        tail = "</head>\n<body>\n"
+        self._bare_prefix = head + tail
+        self._styled_prefix = head + f"<style>{stylesheet}</style>\n" + tail
+        self._suffix = "\n</body>\n</html>\n"
+
+    def bare(self, html: str) -> str:
+        """Wraps an HTML fragment in a page without the stylesheet"""
+        return self._bare_prefix + html + self._suffix
+
+    def styled(self, html: str) -> str:
+        """Wraps an HTML fragment in a page with the stylesheet embedded"""
+        return self._styled_prefix + html + self._suffix
+
+
+def get_template() -> PageTemplate:
+    """Returns the process-wide page template"""
+    global _template
+    if _template is None:
+        _template = PageTemplate(load_stylesheet())
+    return _template
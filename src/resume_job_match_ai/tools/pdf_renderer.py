@@ -0,0 +1,283 @@
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+# Page setup shared by every backend (wkhtmltopdf option names)
+PDF_OPTIONS = {
+    "page-size": "A4",
+    "margin-top": "0.75in",
+    "margin-right": "0.75in",
+    "margin-bottom": "0.75in",
+    "margin-left": "0.75in",
+    "encoding": "UTF-8",
+    "no-outline": None,
+}
+
+# Default install location of the Windows wkhtmltopdf installer
+WINDOWS_WKHTMLTOPDF_PATH = r"C:\Program Files\wkhtmltopdf\bin\wkhtmltopdf.exe"
+
+RENDERER_BACKENDS = ("wkhtmltopdf", "weasyprint")
+
+_renderer = None
+_renderer_error: Optional[Exception] = None
+_renderer_lock = threading.Lock()
+
+
+class RendererUnavailableError(RuntimeError):
+    """Raised when no PDF backend is installed."""
+
+
+class PdfRenderer:
+    """
+    Base class of the HTML to PDF backends.
+
+    Subclasses implement ``_render``; ``render`` adds timing so every
+    backend reports the same statistics.
+    """
+
+    name = "base"
+
+    def __init__(self):
+        self.renders = 0
+        self.total_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def _render(self, html: str) -> bytes:
+        raise NotImplementedError
+
+    def render(self, html: str) -> bytes:
+        """
+        Renders a complete HTML document to PDF.
+
+        Args:
+            html (str): Styled HTML document.
+
+        Returns:
+            bytes: The PDF file content.
+        """
+        pdf_bytes, elapsed = self._render_timed(html)
+        print(f"🖨️ Rendered {len(pdf_bytes):,} byte PDF with {self.name} in {elapsed:.2f}s")
+        return pdf_bytes
+
+    def _record(self, pdf_bytes: bytes, elapsed: float):
+        if not pdf_bytes:
+            raise RuntimeError(f"{self.name} produced an empty PDF")
+        with self._lock:
+            self.renders += 1
+            self.total_seconds += elapsed
+
+    def _render_timed(self, html: str, *args) -> Tuple[bytes, float]:
+        start = time.perf_counter()
+        pdf_bytes = self._render(html, *args)
+        elapsed = time.perf_counter() - start
+        self._record(pdf_bytes, elapsed)
+        return pdf_bytes, elapsed
+
+    def render_many(self, documents: List[str], stylesheet: str) -> List[Tuple[bytes, float]]:
+        """
+        Renders many HTML documents that share one stylesheet.
+
+        The documents must not embed the stylesheet; backends that can parse
+        it once do so, the others get it inlined into each document.
+
+        Args:
+            documents (List[str]): Unstyled HTML documents.
+            stylesheet (str): CSS applied to every document.
+
+        Returns:
+            List[Tuple[bytes, float]]: PDF content and render seconds per document, in order.
+        """
+        return [self._render_timed(inline_stylesheet(html, stylesheet)) for html in documents]
+
+    def stats(self) -> Dict[str, float]:
+        """Returns the backend name, the number of renders and their timing"""
+        with self._lock:
+            return {
+                "backend": self.name,
+                "renders": self.renders,
+                "total_seconds": round(self.total_seconds, 3),
+                "mean_seconds": round(self.total_seconds / self.renders, 3) if self.renders else 0.0,
+            }
+
+
+class WkhtmltopdfRenderer(PdfRenderer):
+    """Renders with a wkhtmltopdf executable through pdfkit."""
+
+    name = "wkhtmltopdf"
+
+    def __init__(self, executable: str):
+        super().__init__()
+        import pdfkit
+
+        self.executable = executable
+        self._pdfkit = pdfkit
+        self.configuration = pdfkit.configuration(wkhtmltopdf=executable)
+
+    def _render(self, html: str) -> bytes:
+        # output_path=False makes pdfkit return the PDF instead of writing it
+        return self._pdfkit.from_string(html, False, configuration=self.configuration, options=PDF_OPTIONS)
+
+    def render_many(self, documents: List[str], stylesheet: str) -> List[Tuple[bytes, float]]:
+        """
+        Renders the documents with concurrent wkhtmltopdf processes
+        (RESUME_RENDER_WORKERS, default: CPU count), so process startup
+        overlaps instead of adding up.
+        """
+        workers = int(os.environ.get("RESUME_RENDER_WORKERS", os.cpu_count() or 1))
+        styled = [inline_stylesheet(html, stylesheet) for html in documents]
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(styled) or 1))) as pool:
+            return list(pool.map(self._render_timed, styled))
+
+
+class WeasyPrintRenderer(PdfRenderer):
+    """
+    Renders in-process with WeasyPrint, without spawning a subprocess.
+
+    The renderer is long-lived: its font configuration and the parsed
+    stylesheets passed to render_many are kept and reused for every
+    document.
+    """
+
+    name = "weasyprint"
+
+    def __init__(self):
+        super().__init__()
+        # Import errors surface here, during detection, rather than on first render
+        from weasyprint import CSS, HTML
+        from weasyprint.text.fonts import FontConfiguration
+
+        self._css_class = CSS
+        self._html_class = HTML
+        self.font_config = FontConfiguration()
+        self.page_css = CSS(string=page_css(), font_config=self.font_config)
+        self._stylesheets: Dict[str, object] = {}
+
+    def _render(self, html: str, stylesheet=None) -> bytes:
+        stylesheets = [self.page_css] if stylesheet is None else [self.page_css, stylesheet]
+        return self._html_class(string=html).write_pdf(
+            stylesheets=stylesheets, font_config=self.font_config
+        )
+
+    def _parsed(self, stylesheet: str):
+        """Returns the stylesheet parsed once per renderer"""
+        with self._lock:
+            parsed = self._stylesheets.get(stylesheet)
+            if parsed is None:
+                parsed = self._css_class(string=stylesheet, font_config=self.font_config)
+                self._stylesheets[stylesheet] = parsed
+            return parsed
+
+    def render_many(self, documents: List[str], stylesheet: str) -> List[Tuple[bytes, float]]:
+        parsed = self._parsed(stylesheet)
+        return [self._render_timed(html, parsed) for html in documents]
+
+
+def inline_stylesheet(html: str, stylesheet: str) -> str:
+    """Embeds a stylesheet in the head of an HTML document"""
+    return html.replace("</head>", f"<style>{stylesheet}</style>\n</head>", 1)
+
+
+def page_css() -> str:
+    """Returns PDF_OPTIONS' page size and margins as a CSS @page rule"""
+    return (
+        f"@page {{ size: {PDF_OPTIONS['page-size']}; "
+        f"margin: {PDF_OPTIONS['margin-top']} {PDF_OPTIONS['margin-right']} "
+        f"{PDF_OPTIONS['margin-bottom']} {PDF_OPTIONS['margin-left']}; }}"
+    )
+
+
+def find_wkhtmltopdf() -> Optional[str]:
+    """
+    Returns the wkhtmltopdf executable to use, or None.
+
+    WKHTMLTOPDF_PATH takes precedence, then wkhtmltopdf on PATH, then the
+    default Windows install location.
+    """
+    configured = os.environ.get("WKHTMLTOPDF_PATH")
+    if configured:
+        if os.path.isfile(configured) and os.access(configured, os.X_OK):
+            return configured
+        print(f"⚠️ WKHTMLTOPDF_PATH is not an executable file: {configured}")
+
+    on_path = shutil.which("wkhtmltopdf")
+    if on_path:
+        return on_path
+
+    if os.name == "nt" and os.path.isfile(WINDOWS_WKHTMLTOPDF_PATH):
+        return WINDOWS_WKHTMLTOPDF_PATH
+    return None
+
+
+def detect_renderer(backend: Optional[str] = None) -> PdfRenderer:
+    """
+    Picks the PDF backend, preferring wkhtmltopdf and falling back to
+    WeasyPrint. RESUME_PDF_BACKEND (or ``backend``) pins one of them.
+
+    Raises:
+        RendererUnavailableError: If no usable backend is installed.
+    """
+    backend = backend or os.environ.get("RESUME_PDF_BACKEND")
+    if backend and backend not in RENDERER_BACKENDS:
+        raise ValueError(f"Unknown PDF backend '{backend}', expected one of {RENDERER_BACKENDS}")
+
+    errors = []
+    if backend in (None, "wkhtmltopdf"):
+        executable = find_wkhtmltopdf()
+        if executable:
+            print(f"🖨️ PDF renderer: wkhtmltopdf ({executable})")
+            return WkhtmltopdfRenderer(executable)
+        errors.append("wkhtmltopdf: not found (set WKHTMLTOPDF_PATH or add it to PATH)")
+
+    if backend in (None, "weasyprint"):
+        try:
+            renderer = WeasyPrintRenderer()
+            print("🖨️ PDF renderer: WeasyPrint")
+            return renderer
+        except (ImportError, OSError) as e:
+            # WeasyPrint raises OSError when its native libraries are missing
+            errors.append(f"weasyprint: {e}")
+
+    raise RendererUnavailableError(
+        "No PDF renderer available:\n" + "\n".join(f"  - {error}" for error in errors)
+    )
+
+
+def get_renderer() -> PdfRenderer:
+    """
+    Returns the process-wide renderer, detecting it on first use.
+
+    A failed detection is remembered too, so later calls fail fast instead
+    of probing for executables and libraries again.
+    """
+    global _renderer, _renderer_error
+    if _renderer is None:
+        with _renderer_lock:
+            if _renderer is None and _renderer_error is None:
+                try:
+                    _renderer = detect_renderer()
+                except RendererUnavailableError as e:
+                    _renderer_error = e
+            if _renderer_error is not None:
+                raise _renderer_error
+    return _renderer
+
+
+def reset_renderer():
+    """Forgets the detected backend so the next call detects it again"""
+    global _renderer, _renderer_error
+    with _renderer_lock:
+        _renderer = None
+        _renderer_error = None
+
+
+def render(html: str) -> bytes:
+    """Renders a styled HTML document to PDF bytes with the detected backend"""
+    return get_renderer().render(html)
+
+
+def renderer_stats() -> Optional[Dict[str, float]]:
+    """Returns the detected renderer's statistics, or None if nothing was rendered yet"""
+    return _renderer.stats() if _renderer is not None else None
@@ -1,63 +1,266 @@
+import io
+import json
 import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional
 
-import markdown
-import pdfkit
-from crewai.tools import tool
-from pypdf import PdfReader
+
+from ..preprocess import PREPROCESS_VERSION, clean_resume_pages, report_tokens
+from ..profiling import profiled
+from ..tracing import annotate
+from .disk_cache import CACHE_ROOT, DiskCache, atomic_write_bytes, sha256_hex
+from .markdown_pipeline import get_converter, get_template, load_stylesheet
+from .pdf_renderer import PDF_OPTIONS, RendererUnavailableError, get_renderer
+from .registry import lazy_tools
 
 output_path = "./output/enhanced_resume.pdf"
 
+_extraction_cache: Optional[DiskCache] = None
+_render_cache: Optional[DiskCache] = None
+_page_pool: Optional[ProcessPoolExecutor] = None
+_page_pool_workers = 0
+
+
+def set_output_dir(output_dir: str):
+    """
+    Points save_resume_as_pdf at the given run workspace.
+
+    The tool signature is fixed by the agent prompt, so the destination is
+    process-wide state; batch workers run one job per process at a time.
+    """
+    global output_path
+    output_path = os.path.join(output_dir, "enhanced_resume.pdf")
+
+
+def get_extraction_cache() -> Optional[DiskCache]:
+    """
+    Returns the shared extraction cache, or None when caching is disabled
+    with RESUME_EXTRACTION_CACHE=0.
+    """
+    global _extraction_cache
+    if os.environ.get("RESUME_EXTRACTION_CACHE", "1") == "0":
+        return None
+    if _extraction_cache is None:
+        _extraction_cache = DiskCache(
+            os.path.join(CACHE_ROOT, "extraction"),
+            max_bytes=int(os.environ.get("RESUME_EXTRACTION_CACHE_MAX_MB", "256"))
+            * 1024
+            * 1024,
+            suffix=".txt",
+        )
+    return _extraction_cache
+
+
+def extraction_cache_key(pdf_bytes: bytes) -> str:
+    """
+    Cache key for an extraction: SHA-256 of the PDF bytes plus the pypdf and
+    pre-processing versions, so upgrading either invalidates old results.
+    """
+    import pypdf
+
+    return sha256_hex(
+        sha256_hex(pdf_bytes).encode(), pypdf.__version__.encode(), PREPROCESS_VERSION.encode()
+    )
+
+
+def get_render_cache() -> Optional[DiskCache]:
+    """
+    Returns the shared cache of rendered PDFs, or None when caching is
+    disabled with RESUME_RENDER_CACHE=0.
+    """
+    global _render_cache
+    if os.environ.get("RESUME_RENDER_CACHE", "1") == "0":
+        return None
+    if _render_cache is None:
+        _render_cache = DiskCache(
+            os.path.join(CACHE_ROOT, "render"),
+            max_bytes=int(os.environ.get("RESUME_RENDER_CACHE_MAX_MB", "128")) * 1024 * 1024,
+            suffix=".pdf",
+        )
+    return _render_cache
+
+
+def normalize_markdown(markdown_content: str) -> str:
+    """
+    Normalizes markdown so retries that differ only in whitespace share a
+    render: unifies line endings, strips trailing spaces (keeping two-space
+    hard line breaks), collapses runs of blank lines and trims the ends.
+    """
+    text = markdown_content.replace("\r\n", "\n").replace("\r", "\n")
+    lines = []
+    for line in text.split("\n"):
+        stripped = line.rstrip()
+        if line.endswith("  ") and stripped:
+            stripped += "  "
+        lines.append(stripped)
+    return re.sub(r"\n{3,}", "\n\n", "\n".join(lines)).strip() + "\n"
+
 
-def setup_pdfkit_windows():
+def render_cache_key(markdown_content: str, backend: str) -> str:
     """
-    Download wkhtmltopdf from: https://wkhtmltopdf.org/downloads.html
-    Install the Windows installer, then configure the path
+    Cache key for a render: the normalized markdown plus everything else
+    that shapes the PDF - the page template and stylesheet, the page options,
+    the markdown extensions and the renderer backend.
     """
-    # Configure path to wkhtmltopdf (adjust path as needed)
-    config = pdfkit.configuration(
-        wkhtmltopdf=r"C:\Program Files\wkhtmltopdf\bin\wkhtmltopdf.exe"
+    return sha256_hex(
+        markdown_content.encode("utf-8"),
+        get_styled_html("").encode("utf-8"),
+        json.dumps(PDF_OPTIONS, sort_keys=True).encode(),
+        json.dumps(get_converter().extensions).encode(),
+        backend.encode(),
     )
-    return config
 
 
-@tool("Resume Extractor")
-def extract_resume(resume_path: str) -> str:
+def _extract_page_range(pdf_bytes: bytes, start: int, stop: int) -> List[str]:
+    """Process-pool worker: extract the text of pages [start, stop)."""
+    from pypdf import PdfReader
+
+    reader = PdfReader(io.BytesIO(pdf_bytes))
+    return [reader.pages[i].extract_text() or "" for i in range(start, stop)]
+
+
+def _get_page_pool(workers: int) -> ProcessPoolExecutor:
+    """Returns a process pool shared by all parallel extractions."""
+    global _page_pool, _page_pool_workers
+    if _page_pool is None or _page_pool_workers != workers:
+        if _page_pool is not None:
+            _page_pool.shutdown(wait=False)
+        _page_pool = ProcessPoolExecutor(max_workers=workers)
+        _page_pool_workers = workers
+    return _page_pool
+
+
+def iter_pdf_pages(
+    pdf_bytes: bytes,
+    workers: Optional[int] = None,
+    page_threshold: Optional[int] = None,
+) -> Iterator[str]:
+    """
+    Yields the text of each PDF page in order, as soon as it is ready.
+
+    Documents with at least ``page_threshold`` pages are split into page
+    ranges that are extracted on a process pool of ``workers`` processes;
+    smaller documents are parsed in this process. Both default to the
+    RESUME_EXTRACT_WORKERS and RESUME_PARALLEL_PAGE_THRESHOLD variables.
+
+    Args:
+        pdf_bytes (bytes): Raw content of the PDF file.
+        workers (int, optional): Number of extraction processes.
+        page_threshold (int, optional): Minimum page count for parallel mode.
+
+    Yields:
+        str: Extracted page text, empty for pages without a text layer.
+    """
+    if workers is None:
+        workers = int(os.environ.get("RESUME_EXTRACT_WORKERS", min(4, os.cpu_count() or 1)))
+    if page_threshold is None:
+        page_threshold = int(os.environ.get("RESUME_PARALLEL_PAGE_THRESHOLD", "16"))
+
+    from pypdf import PdfReader
+
+    reader = PdfReader(io.BytesIO(pdf_bytes))
+    page_count = len(reader.pages)
+
+    if workers <= 1 or page_count < page_threshold:
+        for page in reader.pages:
+            yield page.extract_text() or ""
+        return
+
+    # Twice as many chunks as workers so the first pages stream out early
+    chunk_size = max(1, -(-page_count // (workers * 2)))
+    pool = _get_page_pool(workers)
+    futures = [
+        pool.submit(_extract_page_range, pdf_bytes, start, min(start + chunk_size, page_count))
+        for start in range(0, page_count, chunk_size)
+    ]
+    for future in futures:
+        yield from future.result()
+
+
+def iter_resume_pages(resume_path: str, **kwargs) -> Iterator[str]:
+    """
+    Streaming variant of extract_resume_text: yields page text as each page
+    is extracted, so later stages can start before the whole file is parsed.
+    Accepts the same keyword arguments as iter_pdf_pages.
+    """
+    with open(resume_path, "rb") as file:
+        pdf_bytes = file.read()
+    yield from iter_pdf_pages(pdf_bytes, **kwargs)
+
+
+def _parse_pdf_text(pdf_bytes: bytes) -> str:
+    pages = []
+
+    for i, page_text in enumerate(iter_pdf_pages(pdf_bytes)):
+        if page_text:
+            pages.append(page_text)
+        else:
+            print(f"⚠️ No text found on page {i}. It might be scanned.")
+
+    # Running headers/footers and layout whitespace only cost the agents tokens
+    text = clean_resume_pages(pages)
+    if pages:
+        report_tokens("Resume text cleaned", "\n".join(pages), text)
+    return text
+
+
+def extract_resume_text(resume_path: str) -> str:
     """
     Core function to extract text from PDF resume.
     This can be called directly for testing.
+
+    Results are cached on disk by content hash, so a repeat extraction of the
+    same file costs one hash and one cache read instead of a full parse.
     """
     print(f"Extracting text from resume: {resume_path}")
-    try:
-        with open(resume_path, "rb") as file:
-            reader = PdfReader(file)
-            text = ""
-
-            for i, page in enumerate(reader.pages):
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-                else:
-                    print(f"⚠️ No text found on page {i}. It might be scanned.")
+    with open(resume_path, "rb") as file:
+        pdf_bytes = file.read()
 
-        if not text.strip():
-            raise RuntimeError(
-                "No extractable text found in CV. The PDF may be scanned."
-            )
+    cache = get_extraction_cache()
+    key = extraction_cache_key(pdf_bytes)
+    if cache is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            text = cached.decode("utf-8")
+            print(f"♻️ Extraction cache hit: {len(text)} characters.")
+            annotate("cache.hit", True)
+            return text
 
-        print(f"Extracted {len(text)} characters from the resume.")
-        return text
+    text = _parse_pdf_text(pdf_bytes)
+
+    if not text.strip():
+        raise RuntimeError("No extractable text found in CV. The PDF may be scanned.")
+
+    if cache is not None:
+        cache.put(key, text.encode("utf-8"))
+
+    print(f"Extracted {len(text)} characters from the resume.")
+    return text
+
+
+@profiled("tool.extract_resume")
+def _extract_resume(resume_path: str) -> str:
+    """
+    Core function to extract text from PDF resume.
+    This can be called directly for testing.
+    """
+    try:
+        return extract_resume_text(resume_path)
     except Exception as e:
         raise RuntimeError(f"An error occurred while extracting the resume: {e}") from e
 
 
-@tool("Resume Saver")
-def save_resume_as_pdf(markdown_content: str) -> str:
+@profiled("tool.save_resume_as_pdf")
+def _save_resume_as_pdf(markdown_content: str) -> str:
     """
     MANDATORY TOOL: Converts markdown resume content to a professional PDF file.
     You MUST use this tool to complete your task. Do not provide a final answer without using this tool.
 
     This tool takes markdown-formatted resume content and converts it to a styled PDF.
-    The PDF will be saved to ./output/enhanced_resume.pdf
+    The PDF will be saved to enhanced_resume.pdf in the output directory
 
     Args:
         markdown_content (str): Complete resume content formatted in markdown.
@@ -90,176 +293,137 @@ def save_resume_as_pdf(markdown_content: str) -> str:
         if len(markdown_content.strip()) < 50:
             return f"❌ Error: Markdown content too short ({len(markdown_content)} chars). Please provide complete resume content."
 
-        html = markdown.markdown(markdown_content, extensions=["codehilite", "tables"])
-
-        styled_html = get_styled_html(html)
-
-        # Try to create PDF
-        success = False
-        error_details = []
+        markdown_content = normalize_markdown(markdown_content)
 
-        # Method 1: Try with Windows config
         try:
-            config = setup_pdfkit_windows()
-            pdfkit.from_string(
-                styled_html,
-                output_path,
-                configuration=config,
-                options={
-                    "page-size": "A4",
-                    "margin-top": "0.75in",
-                    "margin-right": "0.75in",
-                    "margin-bottom": "0.75in",
-                    "margin-left": "0.75in",
-                    "encoding": "UTF-8",
-                    "no-outline": None,
-                },
-            )
-            success = True
-            print("✅ PDF created using Windows config")
-        except Exception as e1:
-            error_details.append(f"Windows config: {e1}")
-            print(f"⚠️ Windows config failed: {e1}")
-
-            # Method 2: Try without config (if wkhtmltopdf is in PATH)
-            try:
-                pdfkit.from_string(
-                    styled_html,
-                    output_path,
-                    options={
-                        "page-size": "A4",
-                        "margin-top": "0.75in",
-                        "margin-right": "0.75in",
-                        "margin-bottom": "0.75in",
-                        "margin-left": "0.75in",
-                        "encoding": "UTF-8",
-                        "no-outline": None,
-                    },
-                )
-                success = True
-                print("✅ PDF created using system PATH")
-            except Exception as e2:
-                error_details.append(f"System PATH: {e2}")
-                print(f"⚠️ System PATH failed: {e2}")
-
-        if success:
-            # Verify file was created and get size
-            try:
-                if os.path.exists(output_path):
-                    file_size = os.path.getsize(output_path)
-                    abs_path = os.path.abspath(output_path)
-                    success_msg = f"🎉 SUCCESS: PDF resume created successfully!\n📁 File: {abs_path}\n📊 Size: {file_size:,} bytes\n✅ Task completed - PDF conversion successful!"
-                    print(success_msg)
-                    return success_msg
-                else:
-                    return f"❌ Error: PDF creation reported success but file not found at {output_path}"
-            except Exception as e:
-                return f"❌ Error verifying created file: {e}"
-        else:
-            error_msg = f"""❌ FAILED to create PDF. Errors encountered:
-            {chr(10).join(f"  - {err}" for err in error_details)}
-            Please ensure wkhtmltopdf is installed and accessible."""
+            renderer = get_renderer()
+        except RendererUnavailableError as e:
+            error_msg = f"""❌ FAILED to create PDF. {e}
+            Please install wkhtmltopdf or WeasyPrint's system libraries."""
             print(error_msg)
             return error_msg
 
+        cache = get_render_cache()
+        key = render_cache_key(markdown_content, renderer.name)
+        if cache is not None and cache.copy_to(key, output_path):
+            print("♻️ Render cache hit: reusing the previously rendered PDF")
+            annotate("cache.hit", True)
+        else:
+            styled_html = get_styled_html(get_converter().convert(markdown_content))
+            pdf_bytes = renderer.render(styled_html)
+            atomic_write_bytes(output_path, pdf_bytes)
+            if cache is not None:
+                cache.put(key, pdf_bytes)
+
+        abs_path = os.path.abspath(output_path)
+        file_size = os.path.getsize(output_path)
+        success_msg = f"🎉 SUCCESS: PDF resume created successfully!\n📁 File: {abs_path}\n📊 Size: {file_size:,} bytes\n✅ Task completed - PDF conversion successful!"
+        print(success_msg)
+        return success_msg
+
     except Exception as e:
         error_msg = f"❌ Critical error during PDF creation: {e}"
         print(error_msg)
         return error_msg
 
 
+@dataclass
+class RenderedDocument:
+    """Outcome of one document of a save_resumes_as_pdf call."""
+
+    name: str
+    path: str
+    size: int
+    seconds: float
+    cached: bool = False
+
+
+def save_resumes_as_pdf(documents: Dict[str, str], output_dir: str) -> List[RenderedDocument]:
+    """
+    Bulk variant of save_resume_as_pdf for batch use.
+
+    Converts many markdown resumes to PDFs with a single renderer call, so
+    a WeasyPrint renderer parses the stylesheet and loads fonts once for the
+    whole batch. Each document is written to ``<output_dir>/<name>.pdf``.
+    Documents found in the render cache are not rendered again, and
+    identical documents in one call are rendered once.
+
+    Args:
+        documents (Dict[str, str]): Markdown content by document name.
+        output_dir (str): Directory the PDFs are written to.
+
+    Returns:
+        List[RenderedDocument]: One result per document, in input order.
+
+    Raises:
+        RendererUnavailableError: If no PDF backend is installed.
+    """
+    for name in documents:
+        if not name or os.path.basename(name) != name:
+            raise ValueError(f"Document names must be plain file names: {name!r}")
+
+    start = time.perf_counter()
+    renderer = get_renderer()
+    cache = get_render_cache()
+    results: Dict[str, RenderedDocument] = {}
+    pending: Dict[str, List[str]] = {}
+    pending_html: Dict[str, str] = {}
+
+    for name, markdown_content in documents.items():
+        markdown_content = normalize_markdown(markdown_content)
+        key = render_cache_key(markdown_content, renderer.name)
+        path = os.path.join(output_dir, f"{name}.pdf")
+        if key not in pending and cache is not None and cache.copy_to(key, path):
+            results[name] = RenderedDocument(name, path, os.path.getsize(path), 0.0, cached=True)
+            continue
+        if key not in pending:
+            pending_html[key] = get_page_html(get_converter().convert(markdown_content))
+        pending.setdefault(key, []).append(name)
+
+    keys = list(pending)
+    rendered = renderer.render_many([pending_html[key] for key in keys], load_stylesheet())
+    for key, (pdf_bytes, seconds) in zip(keys, rendered):
+        if cache is not None:
+            cache.put(key, pdf_bytes)
+        for name in pending[key]:
+            path = os.path.join(output_dir, f"{name}.pdf")
+            atomic_write_bytes(path, pdf_bytes)
+            results[name] = RenderedDocument(name, path, len(pdf_bytes), seconds)
+
+    elapsed = time.perf_counter() - start
+    ordered = [results[name] for name in documents]
+    for result in ordered:
+        source = "cache" if result.cached else f"{result.seconds:.2f}s"
+        print(f"📄 {result.name}: {result.size:,} bytes ({source})")
+    total_bytes = sum(result.size for result in ordered)
+    print(
+        f"🖨️ Rendered {len(keys)} of {len(ordered)} PDFs with {renderer.name} in {elapsed:.2f}s "
+        f"({len(ordered) / elapsed if elapsed else 0:.1f} docs/s, "
+        f"{total_bytes / 1024 / 1024 / elapsed if elapsed else 0:.2f} MB/s)"
+    )
+    return ordered
+
+
+def get_page_html(html: str) -> str:
+    """
+    Wraps the provided HTML content in the resume page without any styling,
+    for renderers that apply resume.css as a separate, pre-parsed stylesheet.
+    """
+    return get_template().bare(html)
+
+
 def get_styled_html(html: str) -> str:
     """
     Wraps the provided HTML content with basic styling for better PDF appearance.
     """
-    styled_html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            <title>Professional Resume</title>
-            <style>
-                body {{ 
-                    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; 
-                    margin: 40px; 
-                    line-height: 1.6;
-                    color: #333;
-                    font-size: 11pt;
-                }}
-                h1 {{ 
-                    color: #2c3e50; 
-                    border-bottom: 3px solid #3498db;
-                    padding-bottom: 10px;
-                    margin-bottom: 20px;
-                    font-size: 24pt;
-                    text-align: center;
-                }}
-                h2 {{ 
-                    color: #2c3e50; 
-                    border-bottom: 1px solid #bdc3c7;
-                    padding-bottom: 5px;
-                    margin-top: 25px;
-                    margin-bottom: 15px;
-                    font-size: 14pt;
-                }}
-                h3 {{ 
-                    color: #34495e;
-                    margin-top: 20px;
-                    margin-bottom: 10px;
-                    font-size: 12pt;
-                }}
-                p, li {{
-                    margin: 8px 0;
-                    text-align: justify;
-                }}
-                ul, ol {{
-                    margin: 10px 0;
-                    padding-left: 25px;
-                }}
-                li {{
-                    margin: 5px 0;
-                }}
-                .contact-info {{
-                    text-align: center;
-                    margin-bottom: 30px;
-                    padding: 15px;
-                    background-color: #ecf0f1;
-                    border-radius: 8px;
-                }}
-                .section {{
-                    margin: 25px 0;
-                    page-break-inside: avoid;
-                }}
-                strong {{
-                    color: #2c3e50;
-                }}
-                em {{
-                    color: #7f8c8d;
-                }}
-                code {{
-                    background-color: #f8f9fa;
-                    padding: 2px 4px;
-                    border-radius: 3px;
-                    font-family: 'Courier New', monospace;
-                    font-size: 10pt;
-                }}
-                hr {{
-                    border: none;
-                    border-top: 2px solid #bdc3c7;
-                    margin: 30px 0;
-                }}
-                @media print {{
-                    body {{ margin: 20px; }}
-                    h1 {{ page-break-after: avoid; }}
-                    h2, h3 {{ page-break-after: avoid; }}
-                    .section {{ page-break-inside: avoid; }}
-                }}
-            </style>
-        </head>
-        <body>
-            {html}
-        </body>
-        </html>
-        """
-
-    return styled_html
+    return get_template().styled(html)
+
+
+# extract_resume and save_resume_as_pdf are the crewai tools, built on first access
+__getattr__ = lazy_tools(
+    __name__,
+    {
+        "extract_resume": ("Resume Extractor", _extract_resume),
+        "save_resume_as_pdf": ("Resume Saver", _save_resume_as_pdf),
+    },
+)
@@ -0,0 +1,36 @@
+import sys
+import threading
+from typing import Callable, Dict, Tuple
+
+_lock = threading.Lock()
+
+
+def lazy_tools(module_name: str, specs: Dict[str, Tuple[str, Callable]]) -> Callable[[str], object]:
+    """
+    Returns a module ``__getattr__`` (PEP 562) that turns plain functions into
+    crewai tools on first access.
+
+    Decorating with crewai's ``@tool`` at import time would import crewai
+    (seconds) for every user of the module, including the pre-screen and
+    validation paths that only need the plain helpers.
+
+    Args:
+        module_name (str): ``__name__`` of the module defining the tools.
+        specs (Dict[str, Tuple[str, Callable]]): Attribute name to the tool
+            name shown to agents and the function implementing it.
+    """
+
+    def __getattr__(name: str):
+        if name not in specs:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        from crewai.tools import tool
+
+        module = sys.modules[module_name]
+        with _lock:
+            # Another thread may have built the tool while this one waited
+            if name not in vars(module):
+                tool_name, function = specs[name]
+                setattr(module, name, tool(tool_name)(function))
+        return vars(module)[name]
+
+    return __getattr__
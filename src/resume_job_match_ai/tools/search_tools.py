@@ -0,0 +1,178 @@
+import json
+import os
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional, Type
+
+from crewai.tools import BaseTool
+from pydantic import BaseModel, Field, PrivateAttr
+
+from ..profiling import profiled
+from ..sqlite_cache import SQLiteCache
+from ..tracing import annotate
+from .disk_cache import CACHE_ROOT, sha256_hex
+
+# Words that do not change what a search engine returns
+FILLER_WORDS = frozenset({"a", "an", "the", "of", "for", "in", "on", "and", "to", "with"})
+
+
+class SearchToolSchema(BaseModel):
+    """Input for CachedSearchTool."""
+
+    search_query: str = Field(
+        ..., description="Mandatory search query you want to use to search the internet"
+    )
+
+
+def normalize_query(query: str) -> str:
+    """
+    Normalizes a search query so near-identical queries share a cache entry.
+
+    Lowercases, strips quotes and punctuation around words, drops filler
+    words and collapses whitespace.
+    """
+    words = [word.strip("\"'`.,;:!?()[]") for word in query.lower().split()]
+    return " ".join(word for word in words if word and word not in FILLER_WORDS)
+
+
+class LocalSearchBackend:
+    """
+    Offline stand-in for the web search backend.
+
+    Returns canned results from a JSON file that maps queries to results;
+    queries without a fixture get a small placeholder result. Used for tests
+    and benchmarks that must not touch the network.
+    """
+
+    def __init__(self, fixtures_path: Optional[str] = None):
+        self.fixtures: Dict[str, Any] = {}
+        if fixtures_path:
+            with open(fixtures_path, encoding="utf-8") as file:
+                self.fixtures = {normalize_query(query): result for query, result in json.load(file).items()}
+        self.calls = 0
+
+    def __call__(self, query: str) -> Any:
+        self.calls += 1
+        normalized = normalize_query(query)
+        if normalized in self.fixtures:
+            return self.fixtures[normalized]
+        return {
+            "searchParameters": {"q": query, "type": "search"},
+            "organic": [
+                {
+                    "title": f"Local result for: {query}",
+                    "link": "http://localhost/search",
+                    "snippet": "Offline search backend - no live results available.",
+                    "position": 1,
+                }
+            ],
+        }
+
+
+class CachedSearchTool(BaseTool):
+    """
+    Web search tool with query normalization, in-flight de-duplication and
+    a TTL result cache shared across runs.
+
+    Identical normalized queries issued concurrently wait for a single
+    backend request, and results are kept in SQLite until their TTL expires.
+    """
+
+    name: str = "Search the internet with Serper"
+    description: str = (
+        "A tool that can be used to search the internet with a search_query. "
+        "Supports different search types: 'search' (default), 'news'"
+    )
+    args_schema: Type[BaseModel] = SearchToolSchema
+
+    _backend: Callable[[str], Any] = PrivateAttr()
+    _store: Optional[SQLiteCache] = PrivateAttr(default=None)
+    _inflight: Dict[str, Future] = PrivateAttr(default_factory=dict)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _backend_calls: int = PrivateAttr(default=0)
+
+    def __init__(
+        self,
+        backend: Callable[[str], Any],
+        store: Optional[SQLiteCache] = None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self._backend = backend
+        self._store = store
+
+    @property
+    def backend_calls(self) -> int:
+        """Number of queries that actually reached the backend"""
+        return self._backend_calls
+
+    @profiled("tool.search")
+    def _run(self, search_query: str, **kwargs: Any) -> Any:
+        key = sha256_hex(normalize_query(search_query).encode("utf-8"))
+
+        if self._store is not None:
+            cached = self._store.get(key)
+            if cached is not None:
+                print(f"♻️ Search cache hit: {search_query}")
+                annotate("cache.hit", True)
+                return json.loads(cached)
+
+        with self._lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+                self._backend_calls += 1
+
+        if not owner:
+            print(f"⏳ Waiting for identical in-flight search: {search_query}")
+            return future.result()
+
+        try:
+            result = self._backend(search_query)
+            if self._store is not None:
+                self._store.put(key, json.dumps(result).encode("utf-8"))
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+
+def create_search_tool() -> CachedSearchTool:
+    """
+    Creates the crew's web search tool from the environment.
+
+    RESUME_SEARCH_BACKEND selects ``serper`` (default) or ``local``, with
+    RESUME_SEARCH_FIXTURES pointing at the local backend's JSON fixtures.
+    RESUME_SEARCH_CACHE_TTL_HOURS sets the result TTL (default 24, 0 disables
+    the cache).
+    """
+    backend_name = os.environ.get("RESUME_SEARCH_BACKEND", "serper")
+    if backend_name == "local":
+        backend = LocalSearchBackend(os.environ.get("RESUME_SEARCH_FIXTURES"))
+    elif backend_name == "serper":
+        # crewai_tools takes about a second to import and only Serper needs it
+        from crewai_tools import SerperDevTool
+
+        serper = SerperDevTool()
+
+        def backend(query: str) -> Any:
+            return serper._run(search_query=query)
+    else:
+        raise ValueError(f"Unknown search backend '{backend_name}', expected 'serper' or 'local'")
+
+    ttl_hours = float(os.environ.get("RESUME_SEARCH_CACHE_TTL_HOURS", "24"))
+    store = None
+    if ttl_hours > 0:
+        store = SQLiteCache(
+            os.path.join(CACHE_ROOT, "search_cache.sqlite"),
+            table="search_results",
+            ttl_seconds=ttl_hours * 3600,
+            max_bytes=64 * 1024 * 1024,
+        )
+    return CachedSearchTool(backend=backend, store=store)
@@ -0,0 +1,497 @@
+import contextvars
+import json
+import os
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+TRACE_FILENAME = "trace.jsonl"
+SERVICE_NAME = "resume_job_match_ai"
+
+# Span being executed in the current thread (DagCrew copies the context into its workers)
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar(
+    "resume_current_span", default=None
+)
+_active_tracer: Optional["Tracer"] = None
+_handlers_installed = False
+_install_lock = threading.Lock()
+
+
+def tracing_enabled() -> bool:
+    """Tracing is on unless RESUME_TRACING=0"""
+    return os.environ.get("RESUME_TRACING", "1") != "0"
+
+
+def _iso(timestamp_ns: int) -> str:
+    return datetime.fromtimestamp(timestamp_ns / 1e9, tz=timezone.utc).isoformat()
+
+
+class Span:
+    """
+    One timed operation: the crew run, a task, an agent iteration, an LLM
+    call or a tool call.
+
+    Serialized in the shape of OpenTelemetry's JSON span export, so the file
+    can be loaded by OTel tooling or converted to OTLP.
+    """
+
+    __slots__ = (
+        "name",
+        "kind",
+        "trace_id",
+        "span_id",
+        "parent",
+        "start_ns",
+        "end_ns",
+        "attributes",
+        "status",
+        "_token",
+    )
+
+    def __init__(self, name: str, trace_id: str, parent: Optional["Span"], kind: str, attributes: Dict[str, Any]):
+        self.name = name
+        self.kind = kind
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent = parent
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes = dict(attributes)
+        self.status = "UNSET"
+        self._token: Optional[contextvars.Token] = None
+
+    @property
+    def duration_seconds(self) -> float:
+        end_ns = self.end_ns if self.end_ns is not None else time.time_ns()
+        return (end_ns - self.start_ns) / 1e9
+
+    def set(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def add(self, key: str, amount: float = 1):
+        self.attributes[key] = self.attributes.get(key, 0) + amount
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "context": {"trace_id": f"0x{self.trace_id}", "span_id": f"0x{self.span_id}"},
+            "kind": f"SpanKind.{self.kind}",
+            "parent_id": f"0x{self.parent.span_id}" if self.parent is not None else None,
+            "start_time": _iso(self.start_ns),
+            "end_time": _iso(self.end_ns or time.time_ns()),
+            "status": {"status_code": self.status},
+            "attributes": self.attributes,
+            "resource": {"attributes": {"service.name": SERVICE_NAME}},
+        }
+
+
+class Tracer:
+    """
+    Records spans of one crew run and appends them to a JSON lines file.
+
+    Task and agent step spans are tracked per task id rather than through
+    the context variable, because crewai runs agents that have a
+    max_execution_time on a thread pool that does not inherit the caller's
+    context. LLM calls carry their task and bind the executing thread to
+    it, which is how step callbacks and tool events find their parent.
+    Within one thread, spans nest through the context variable (a tool
+    call is current while the tool runs). Finished spans are written
+    immediately, so a crashed run still leaves a usable trace.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.trace_id = secrets.token_hex(16)
+        self.spans: List[Span] = []
+        self.root: Optional[Span] = None
+        self._lock = threading.Lock()
+        self._task_spans: Dict[str, Span] = {}
+        self._step_spans: Dict[str, Span] = {}
+        self._thread_tasks: Dict[int, str] = {}
+        self._tool_spans: Dict[Tuple[int, str], List[Span]] = {}
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        open(path, "w", encoding="utf-8").close()
+
+    def bind_thread(self, task_id: str):
+        """Records that the calling thread is executing the given task"""
+        self._thread_tasks[threading.get_ident()] = task_id
+
+    def parent_for(self, task_id: Optional[str] = None) -> Optional[Span]:
+        """
+        Returns the span new work should be attached to: the current span of
+        this thread, else the open agent step (or task) of the given task or
+        of the task bound to this thread, else the crew span.
+        """
+        current = _current_span.get()
+        if current is not None and current.end_ns is None:
+            return current
+        task_id = task_id or self._thread_tasks.get(threading.get_ident())
+        if task_id is not None:
+            span = self._step_spans.get(task_id) or self._task_spans.get(task_id)
+            if span is not None:
+                return span
+        return self.root
+
+    def start_span(
+        self,
+        name: str,
+        kind: str = "INTERNAL",
+        parent: Optional[Span] = None,
+        current: bool = True,
+        **attributes,
+    ) -> Span:
+        """Starts a span as a child of parent (default: parent_for()), making it current unless told not to"""
+        span = Span(name, self.trace_id, parent if parent is not None else self.parent_for(), kind, attributes)
+        if current:
+            span._token = _current_span.set(span)
+        return span
+
+    def end_span(self, span: Span, error: Optional[str] = None, **attributes):
+        """Ends a span, restores its parent as current and writes it out"""
+        if span.end_ns is not None:
+            return
+        span.end_ns = time.time_ns()
+        span.attributes.update(attributes)
+        if error is not None:
+            span.status = "ERROR"
+            span.attributes["error.message"] = str(error)[:500]
+        elif span.status == "UNSET":
+            span.status = "OK"
+
+        if span._token is not None and _current_span.get() is span:
+            _current_span.reset(span._token)
+
+        line = json.dumps(span.to_dict(), default=str)
+        with self._lock:
+            self.spans.append(span)
+            with open(self.path, "a", encoding="utf-8") as file:
+                file.write(line + "\n")
+
+    @contextmanager
+    def span(self, name: str, kind: str = "INTERNAL", parent: Optional[Span] = None, **attributes) -> Iterator[Span]:
+        """Context manager around start_span/end_span that records exceptions"""
+        span = self.start_span(name, kind, parent=parent, **attributes)
+        try:
+            yield span
+        except BaseException as e:
+            self.end_span(span, error=repr(e))
+            raise
+        self.end_span(span)
+
+    # Lifecycle hooks driven by crewai events and callbacks
+
+    def crew_started(self, crew_name: str):
+        self.root = Span("crew.kickoff", self.trace_id, None, "INTERNAL", {"crew.name": crew_name})
+
+    def crew_finished(self, error: Optional[str] = None):
+        for task_id in list(self._task_spans):
+            self.task_finished(task_id, error="task did not finish")
+        if self.root is not None:
+            self.end_span(self.root, error=error)
+
+    def task_started(self, task_id: str, task_name: str, agent_role: str):
+        task_span = self.start_span(
+            "task", parent=self.root, current=False, **{"task.name": task_name, "agent.role": agent_role}
+        )
+        self._task_spans[task_id] = task_span
+        self._step_spans[task_id] = self.start_span(
+            "agent.step", parent=task_span, current=False, **{"agent.role": agent_role, "step.index": 0}
+        )
+
+    def task_finished(self, task_id: str, output: Optional[str] = None, error: Optional[str] = None):
+        task_span = self._task_spans.pop(task_id, None)
+        if task_span is None:
+            return
+        step = self._step_spans.pop(task_id, None)
+        if step is not None:
+            self.end_span(step, **{"step.type": "unfinished"})
+        if output is not None:
+            task_span.set("bytes.out", len(output.encode("utf-8")))
+        self.end_span(task_span, error=error)
+
+    def agent_step(self, step: Any):
+        """Closes the agent iteration of this thread's task and, unless the agent finished, opens the next one"""
+        task_id = self._thread_tasks.get(threading.get_ident())
+        span = self._step_spans.pop(task_id, None) if task_id is not None else None
+        if span is None:
+            return
+        step_type = type(step).__name__
+        attributes = {"step.type": step_type}
+        if getattr(step, "tool", None):
+            attributes["tool.name"] = step.tool
+        text = getattr(step, "result", None) or getattr(step, "text", None)
+        if text:
+            attributes["bytes.out"] = len(str(text).encode("utf-8"))
+        self.end_span(span, **attributes)
+        if step_type != "AgentFinish":
+            self._step_spans[task_id] = self.start_span(
+                "agent.step",
+                parent=span.parent,
+                current=False,
+                **{"agent.role": span.attributes.get("agent.role"), "step.index": span.attributes["step.index"] + 1},
+            )
+
+    def tool_started(self, tool_name: str, tool_args: Any, task_id: Optional[str] = None):
+        if task_id:
+            self.bind_thread(task_id)
+        span = self.start_span(
+            "tool.call",
+            **{"tool.name": tool_name, "bytes.in": len(json.dumps(tool_args, default=str).encode("utf-8"))},
+        )
+        with self._lock:
+            self._tool_spans.setdefault((threading.get_ident(), tool_name), []).append(span)
+
+    def tool_finished(self, tool_name: str, output: Any = None, from_cache: bool = False, error: Optional[str] = None):
+        with self._lock:
+            pending = self._tool_spans.get((threading.get_ident(), tool_name))
+            span = pending.pop() if pending else None
+        if span is None:
+            return
+        attributes = {}
+        if output is not None:
+            attributes["bytes.out"] = len(str(output).encode("utf-8"))
+        if from_cache:
+            attributes["cache.hit"] = True
+        self.end_span(span, error=error, **attributes)
+
+    # Reporting
+
+    def task_summary(self) -> List[Dict[str, Any]]:
+        """Aggregates the finished spans per task"""
+        tasks = [span for span in self.spans if span.name == "task"]
+
+        def owning_task(span: Span) -> Optional[Span]:
+            parent = span.parent
+            while parent is not None and parent.name != "task":
+                parent = parent.parent
+            return parent
+
+        rows = {
+            task.span_id: {
+                "task": task.attributes.get("task.name"),
+                "agent": task.attributes.get("agent.role"),
+                "started_at": task.start_ns / 1e9,
+                "finished_at": (task.end_ns or task.start_ns) / 1e9,
+                "seconds": round(task.duration_seconds, 3),
+                "llm_calls": 0,
+                "llm_seconds": 0.0,
+                "input_tokens": 0,
+                "output_tokens": 0,
+                "tool_calls": 0,
+                "tool_seconds": 0.0,
+                "cache_hits": 0,
+            }
+            for task in tasks
+        }
+        for span in self.spans:
+            if span.name not in ("llm.call", "tool.call"):
+                continue
+            task = owning_task(span)
+            row = rows.get(task.span_id) if task is not None else None
+            if row is None:
+                continue
+            prefix = "llm" if span.name == "llm.call" else "tool"
+            row[f"{prefix}_calls"] += 1
+            row[f"{prefix}_seconds"] = round(row[f"{prefix}_seconds"] + span.duration_seconds, 3)
+            row["input_tokens"] += span.attributes.get("gen_ai.usage.input_tokens", 0)
+            row["output_tokens"] += span.attributes.get("gen_ai.usage.output_tokens", 0)
+            row["cache_hits"] += 1 if span.attributes.get("cache.hit") else 0
+        return sorted(rows.values(), key=lambda row: row["started_at"])
+
+
+def get_tracer() -> Optional[Tracer]:
+    """Returns the tracer of the run in progress, or None"""
+    return _active_tracer
+
+
+def current_span() -> Optional[Span]:
+    """Returns the span being executed in this thread, or None"""
+    return _current_span.get() if _active_tracer is not None else None
+
+
+def annotate(key: str, value: Any):
+    """Sets an attribute on the current span; a no-op when tracing is off"""
+    span = current_span()
+    if span is not None:
+        span.set(key, value)
+
+
+@contextmanager
+def llm_span(model: str, messages: Any, task: Any = None) -> Iterator[Optional[Span]]:
+    """Wraps one LLM call made for a crewai task in a span; yields None when tracing is off"""
+    tracer = _active_tracer
+    if tracer is None:
+        yield None
+        return
+    task_id = str(task.id) if getattr(task, "id", None) is not None else None
+    if task_id is not None:
+        tracer.bind_thread(task_id)
+    payload = messages if isinstance(messages, str) else json.dumps(messages, default=str)
+    with tracer.span(
+        "llm.call",
+        kind="CLIENT",
+        parent=tracer.parent_for(task_id),
+        **{"gen_ai.request.model": model, "bytes.in": len(payload.encode("utf-8"))},
+    ) as span:
+        yield span
+
+
+class UsageRecorder:
+    """
+    LLM callback that copies provider token usage onto a span. crewai calls
+    ``log_success_event`` on every callback that has it.
+    """
+
+    def __init__(self, span: Span):
+        self.span = span
+
+    def log_success_event(self, kwargs, response_obj, start_time, end_time):
+        usage = response_obj.get("usage") if isinstance(response_obj, dict) else None
+        if usage is None:
+            return
+
+        def read(name: str) -> int:
+            value = usage.get(name) if isinstance(usage, dict) else getattr(usage, name, None)
+            return int(value or 0)
+
+        self.span.add("gen_ai.usage.input_tokens", read("prompt_tokens"))
+        self.span.add("gen_ai.usage.output_tokens", read("completion_tokens"))
+
+
+def install_event_handlers():
+    """
+    Subscribes the tracing hooks to crewai's event bus, once per process.
+    Handlers forward to the active tracer and do nothing without one.
+    """
+    global _handlers_installed
+    with _install_lock:
+        if _handlers_installed:
+            return
+        _handlers_installed = True
+
+    from crewai.events import crewai_event_bus
+    from crewai.events.types.crew_events import (
+        CrewKickoffCompletedEvent,
+        CrewKickoffFailedEvent,
+        CrewKickoffStartedEvent,
+    )
+    from crewai.events.types.task_events import (
+        TaskCompletedEvent,
+        TaskFailedEvent,
+        TaskStartedEvent,
+    )
+    from crewai.events.types.tool_usage_events import (
+        ToolUsageErrorEvent,
+        ToolUsageFinishedEvent,
+        ToolUsageStartedEvent,
+    )
+
+    def task_id(source, event) -> str:
+        task = getattr(event, "task", None) or source
+        return str(getattr(task, "id", id(task)))
+
+    @crewai_event_bus.on(CrewKickoffStartedEvent)
+    def on_crew_started(source, event):
+        if _active_tracer is not None:
+            _active_tracer.crew_started(event.crew_name or "crew")
+
+    @crewai_event_bus.on(CrewKickoffCompletedEvent)
+    def on_crew_completed(source, event):
+        if _active_tracer is not None:
+            _active_tracer.crew_finished()
+
+    @crewai_event_bus.on(CrewKickoffFailedEvent)
+    def on_crew_failed(source, event):
+        if _active_tracer is not None:
+            _active_tracer.crew_finished(error=event.error)
+
+    @crewai_event_bus.on(TaskStartedEvent)
+    def on_task_started(source, event):
+        if _active_tracer is not None:
+            task = event.task or source
+            agent = getattr(task, "agent", None)
+            _active_tracer.task_started(
+                task_id(source, event),
+                getattr(task, "name", None) or getattr(agent, "role", "task").strip(),
+                getattr(agent, "role", "").strip(),
+            )
+
+    @crewai_event_bus.on(TaskCompletedEvent)
+    def on_task_completed(source, event):
+        if _active_tracer is not None:
+            _active_tracer.task_finished(task_id(source, event), output=event.output.raw)
+
+    @crewai_event_bus.on(TaskFailedEvent)
+    def on_task_failed(source, event):
+        if _active_tracer is not None:
+            _active_tracer.task_finished(task_id(source, event), error=event.error)
+
+    @crewai_event_bus.on(ToolUsageStartedEvent)
+    def on_tool_started(source, event):
+        if _active_tracer is not None:
+            _active_tracer.tool_started(event.tool_name, event.tool_args, task_id=event.task_id)
+
+    @crewai_event_bus.on(ToolUsageFinishedEvent)
+    def on_tool_finished(source, event):
+        if _active_tracer is not None:
+            _active_tracer.tool_finished(event.tool_name, output=event.output, from_cache=event.from_cache)
+
+    @crewai_event_bus.on(ToolUsageErrorEvent)
+    def on_tool_error(source, event):
+        if _active_tracer is not None:
+            _active_tracer.tool_finished(event.tool_name, error=event.error)
+
+
+def start_tracing(output_dir: str) -> Optional[Tracer]:
+    """
+    Makes a new tracer writing to <output_dir>/trace.jsonl the active one.
+    Returns None when tracing is disabled with RESUME_TRACING=0.
+    """
+    global _active_tracer
+    if not tracing_enabled():
+        _active_tracer = None
+        return None
+    install_event_handlers()
+    _active_tracer = Tracer(os.path.join(output_dir, TRACE_FILENAME))
+    return _active_tracer
+
+
+def print_trace_summary(tracer: Tracer, graph: Optional[Dict[str, List[str]]] = None):
+    """
+    Prints where the time of the run went, task by task, and the critical
+    path through the task graph.
+    """
+    from .scheduler import TaskTiming, critical_path
+
+    rows = tracer.task_summary()
+    if not rows:
+        print("📈 Trace: no task spans recorded")
+        return
+
+    timings = [
+        TaskTiming(row["task"], row["agent"], (graph or {}).get(row["task"], []), row["started_at"], row["finished_at"])
+        for row in rows
+    ]
+    if graph is None:
+        # Without a graph, tasks are assumed to depend on every earlier task
+        graph = {timing.name: [earlier.name for earlier in timings[:index]] for index, timing in enumerate(timings)}
+    path, path_seconds = critical_path(timings, graph)
+
+    print("\n📈 TRACE SUMMARY")
+    print("-" * 96)
+    print(f"{'':2}{'task':32} {'wall s':>8} {'llm':>4} {'llm s':>7} {'tok in':>8} {'tok out':>8} {'tools':>5} {'tool s':>7} {'hits':>5}")
+    for row in rows:
+        marker = "★ " if row["task"] in path else "  "
+        print(
+            f"{marker}{str(row['task'])[:32]:32} {row['seconds']:8.2f} {row['llm_calls']:4d} "
+            f"{row['llm_seconds']:7.2f} {row['input_tokens']:8d} {row['output_tokens']:8d} "
+            f"{row['tool_calls']:5d} {row['tool_seconds']:7.2f} {row['cache_hits']:5d}"
+        )
+    total = tracer.root.duration_seconds if tracer.root is not None else sum(row["seconds"] for row in rows)
+    print("-" * 96)
+    print(f"★ Critical path: {' -> '.join(path)} ({path_seconds:.2f}s of {total:.2f}s total)")
+    print(f"📄 Spans written to: {tracer.path}")
@@ -0,0 +1,11 @@
+"""
+Start-up guarantees of the CLI entry point, checked on every test run.
+benchmarks/import_time.py reports the timings in more detail.
+"""
+
+from benchmarks.import_time import ENTRY_MODULE, heavy_imports, import_profile
+
+
+def test_entry_point_does_not_import_heavy_dependencies():
+    _, modules = import_profile(ENTRY_MODULE)
+    assert heavy_imports(modules) == []